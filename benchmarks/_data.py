@@ -0,0 +1,43 @@
+import os
+import atexit
+import shutil
+import tempfile
+from benchmarks import synthetic
+
+# The inputs are written once per process and reused by the benchmarks.
+_data_dir = None
+
+def data_dir():
+    global _data_dir
+    if _data_dir is None:
+        _data_dir = tempfile.mkdtemp(prefix='viola_benchmarks_')
+        atexit.register(shutil.rmtree, _data_dir, True)
+    return _data_dir
+
+def sample_events(n_svs, seed=0):
+    # a quarter of the intrachromosomal SVs of Manta and Lumpy are written as breakends.
+    return synthetic.simulate_svs(n_svs, random_state=seed, breakend_fraction=0.25)
+
+def sample_vcf(variant_caller, n_svs, seed=0):
+    path = os.path.join(data_dir(), '{}_{}_{}.vcf'.format(variant_caller, n_svs, seed))
+    if not os.path.exists(path):
+        synthetic.write_vcf(sample_events(n_svs, seed), path, variant_caller=variant_caller, random_state=seed)
+    return path
+
+def sample_bedpe(n_svs, seed=0):
+    path = os.path.join(data_dir(), 'bedpe_{}_{}.bedpe'.format(n_svs, seed))
+    if not os.path.exists(path):
+        synthetic.write_bedpe(sample_events(n_svs, seed), path)
+    return path
+
+def sample_bed(n_regions, seed=0):
+    path = os.path.join(data_dir(), 'regions_{}_{}.bed'.format(n_regions, seed))
+    if not os.path.exists(path):
+        synthetic.write_bed(path, n_regions, random_state=seed)
+    return path
+
+def sample_cohort(n_patients, n_svs, format_='bedpe', variant_caller='manta', seed=0):
+    path = os.path.join(data_dir(), 'cohort_{}_{}_{}_{}_{}'.format(format_, variant_caller, n_patients, n_svs, seed))
+    if not os.path.exists(path):
+        synthetic.generate_cohort(path, n_patients, n_svs, variant_caller=variant_caller, format_=format_, random_state=seed)
+    return path
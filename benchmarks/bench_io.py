@@ -0,0 +1,29 @@
+import viola
+from benchmarks._data import sample_vcf, sample_bedpe
+
+class ReadVcf:
+    params = (['manta', 'delly', 'lumpy', 'gridss'], [1000, 10000])
+    param_names = ['variant_caller', 'n_svs']
+    timeout = 600
+
+    def setup(self, variant_caller, n_svs):
+        self.path = sample_vcf(variant_caller, n_svs)
+
+    def time_read_vcf(self, variant_caller, n_svs):
+        viola.read_vcf(self.path, variant_caller=variant_caller, patient_name='patient')
+
+    def peakmem_read_vcf(self, variant_caller, n_svs):
+        viola.read_vcf(self.path, variant_caller=variant_caller, patient_name='patient')
+
+class ReadBedpe:
+    params = [1000, 10000, 100000]
+    param_names = ['n_svs']
+
+    def setup(self, n_svs):
+        self.path = sample_bedpe(n_svs)
+
+    def time_read_bedpe(self, n_svs):
+        viola.read_bedpe(self.path, patient_name='patient')
+
+    def peakmem_read_bedpe(self, n_svs):
+        viola.read_bedpe(self.path, patient_name='patient')
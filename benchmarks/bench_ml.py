@@ -0,0 +1,31 @@
+import viola
+from benchmarks._data import sample_cohort
+
+class CohortFeatureMatrix:
+    params = ([50, 200], [100])
+    param_names = ['n_patients', 'n_svs']
+    timeout = 600
+
+    def setup(self, n_patients, n_svs):
+        self.multibedpe = viola.read_bedpe_multi(sample_cohort(n_patients, n_svs))
+
+    def time_classify_manual_svtype(self, n_patients, n_svs):
+        self.multibedpe.classify_manual_svtype(definitions='default')
+
+    def peakmem_classify_manual_svtype(self, n_patients, n_svs):
+        self.multibedpe.classify_manual_svtype(definitions='default')
+
+class SVSignatureExtractor:
+    params = ([50, 200], [10])
+    param_names = ['n_patients', 'n_iter']
+    timeout = 600
+
+    def setup(self, n_patients, n_iter):
+        multibedpe = viola.read_bedpe_multi(sample_cohort(n_patients, 100))
+        self.feature_matrix = multibedpe.classify_manual_svtype(definitions='default')
+
+    def time_SV_signature_extractor(self, n_patients, n_iter):
+        viola.SV_signature_extractor(self.feature_matrix, n_iter=n_iter, n_components=3, random_state=0, max_iter=1000)
+
+    def peakmem_SV_signature_extractor(self, n_patients, n_iter):
+        viola.SV_signature_extractor(self.feature_matrix, n_iter=n_iter, n_components=3, random_state=0, max_iter=1000)
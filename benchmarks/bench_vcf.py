@@ -0,0 +1,81 @@
+import viola
+from benchmarks._data import sample_vcf, sample_bed
+
+class Breakend2Breakpoint:
+    # Delly is left out because it does not write mates.
+    params = (['manta', 'lumpy', 'gridss'], [100, 300, 1000])
+    param_names = ['variant_caller', 'n_svs']
+    timeout = 600
+
+    def setup(self, variant_caller, n_svs):
+        self.vcf = viola.read_vcf(sample_vcf(variant_caller, n_svs), variant_caller=variant_caller, patient_name='patient')
+
+    def time_breakend2breakpoint(self, variant_caller, n_svs):
+        self.vcf.breakend2breakpoint()
+
+    def peakmem_breakend2breakpoint(self, variant_caller, n_svs):
+        self.vcf.breakend2breakpoint()
+
+class Merge:
+    # the same SVs called by the four callers; the distance matrix is quadratic in n_svs.
+    params = ([30, 100, 300], ['distance', 'confidence_intervals'])
+    param_names = ['n_svs', 'mode']
+    timeout = 600
+
+    def setup(self, n_svs, mode):
+        self.ls_vcf = [
+            viola.read_vcf(sample_vcf(caller, n_svs), variant_caller=caller, patient_name=caller).breakend2breakpoint()
+            for caller in ['manta', 'delly', 'lumpy', 'gridss']
+        ]
+
+    def time_merge(self, n_svs, mode):
+        viola.merge(self.ls_vcf, mode=mode, integration=True)
+
+    def peakmem_merge(self, n_svs, mode):
+        viola.merge(self.ls_vcf, mode=mode, integration=True)
+
+# The breakpoints of Delly are used as the inputs of AnnotateBed and ClassifyManualSvtype
+# so that the setup does not depend on the cost of breakend2breakpoint.
+class AnnotateBed:
+    params = ([1000, 10000], [1000, 100000])
+    param_names = ['n_svs', 'n_regions']
+    timeout = 600
+
+    def setup(self, n_svs, n_regions):
+        self.vcf = viola.read_vcf(sample_vcf('delly', n_svs), variant_caller='delly', patient_name='patient').breakend2breakpoint()
+        self.bed = viola.read_bed(sample_bed(n_regions))
+
+    # annotate_bed adds INFO tables in place, so that each run annotates a copy.
+    def time_annotate_bed(self, n_svs, n_regions):
+        self.vcf.copy().annotate_bed(self.bed, 'region')
+
+    def peakmem_annotate_bed(self, n_svs, n_regions):
+        self.vcf.copy().annotate_bed(self.bed, 'region')
+
+class ClassifyManualSvtype:
+    params = [1000, 10000]
+    param_names = ['n_svs']
+    timeout = 600
+
+    def setup(self, n_svs):
+        self.vcf = viola.read_vcf(sample_vcf('delly', n_svs), variant_caller='delly', patient_name='patient').breakend2breakpoint()
+
+    def time_classify_manual_svtype(self, n_svs):
+        self.vcf.classify_manual_svtype(definitions='default')
+
+    def peakmem_classify_manual_svtype(self, n_svs):
+        self.vcf.classify_manual_svtype(definitions='default')
+
+class ToVcf:
+    params = (['manta', 'gridss'], [100, 300, 1000])
+    param_names = ['variant_caller', 'n_svs']
+    timeout = 600
+
+    def setup(self, variant_caller, n_svs):
+        self.vcf = viola.read_vcf(sample_vcf(variant_caller, n_svs), variant_caller=variant_caller, patient_name='patient')
+
+    def time_to_vcf(self, variant_caller, n_svs):
+        self.vcf.to_vcf()
+
+    def peakmem_to_vcf(self, variant_caller, n_svs):
+        self.vcf.to_vcf()
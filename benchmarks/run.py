@@ -0,0 +1,112 @@
+"""
+Run the benchmarks without asv and report the time and the peak memory of each operation.
+
+    python -m benchmarks.run [--bench REGEX] [--quick] [--repeat N] [--output PATH]
+
+Each benchmark is run for all the combinations of its parameters,
+so that the rows of the same operation show how it scales with the input size.
+The time is the best of the repeats. The peak memory is the peak of the memory
+allocations traced by tracemalloc during one more run, i.e. the memory used by the
+operation on top of its inputs. asv (asv.conf.json at the top of the repository)
+runs the same benchmarks across commits.
+"""
+import io
+import re
+import sys
+import time
+import argparse
+import itertools
+import importlib
+import tracemalloc
+from contextlib import redirect_stdout
+import pandas as pd
+
+BENCHMARK_MODULES = ['benchmarks.bench_io', 'benchmarks.bench_vcf', 'benchmarks.bench_ml']
+
+def _iter_benchmarks(pattern=None):
+    # (name, class, method name) of the time_* methods of the benchmark classes
+    for module_name in BENCHMARK_MODULES:
+        module = importlib.import_module(module_name)
+        for class_name, cls in list(vars(module).items()):
+            if not isinstance(cls, type) or cls.__module__ != module_name:
+                continue
+            for attr in sorted(vars(cls)):
+                if not attr.startswith('time_'):
+                    continue
+                name = '{}.{}.{}'.format(module_name.split('.')[-1], class_name, attr[len('time_'):])
+                if pattern is None or re.search(pattern, name):
+                    yield name, cls, attr
+
+def _param_combinations(cls, quick=False):
+    params = getattr(cls, 'params', [])
+    if len(params) == 0:
+        return [()]
+    # asv accepts a single list for the benchmarks with one parameter.
+    if not isinstance(params, tuple):
+        params = (params,)
+    if quick:
+        params = [[min(ls_values)] if all(isinstance(v, (int, float)) for v in ls_values) else ls_values
+                  for ls_values in params]
+    return list(itertools.product(*params))
+
+def run_benchmarks(pattern=None, quick=False, repeat=3):
+    """
+    run_benchmarks(pattern=None, quick=False, repeat=3)
+    Run the benchmarks and return the results.
+
+    Parameters
+    ----------
+    pattern: str or None, default None
+        Regular expression to select the benchmarks by "<module>.<class>.<operation>".
+    quick: bool, default False
+        If True, only the smallest value of each numeric parameter is run.
+    repeat: int, default 3
+        Number of the timed runs.
+
+    Returns
+    ----------
+    pd.DataFrame
+        One row per benchmark and parameter combination with the columns
+        benchmark, params, time_s and peak_mib.
+    """
+    ls_rows = []
+    for name, cls, attr in _iter_benchmarks(pattern):
+        param_names = getattr(cls, 'param_names', [])
+        for args in _param_combinations(cls, quick):
+            bench = cls()
+            if hasattr(bench, 'setup'):
+                bench.setup(*args)
+            func = getattr(bench, attr)
+            ls_times = []
+            # the progress messages of the operations are not shown.
+            with redirect_stdout(io.StringIO()):
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    func(*args)
+                    ls_times.append(time.perf_counter() - t0)
+                tracemalloc.start()
+                func(*args)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            if hasattr(bench, 'teardown'):
+                bench.teardown(*args)
+            str_params = ', '.join('{}={}'.format(k, v) for k, v in zip(param_names, args))
+            ls_rows.append([name, str_params, min(ls_times), peak / 2 ** 20])
+            print('{}({}): {:.3f} s, {:.1f} MiB'.format(name, str_params, min(ls_times), peak / 2 ** 20), file=sys.stderr)
+    return pd.DataFrame(ls_rows, columns=['benchmark', 'params', 'time_s', 'peak_mib'])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the Viola benchmarks on synthetic SV data.')
+    parser.add_argument('--bench', default=None, help='Regular expression to select the benchmarks, e.g. "ReadVcf|Merge".')
+    parser.add_argument('--quick', action='store_true', help='Run only the smallest size of each benchmark.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of the timed runs (default, 3).')
+    parser.add_argument('--output', default=None, help='Write the results to this TSV file.')
+    args = parser.parse_args(argv)
+    df_result = run_benchmarks(args.bench, quick=args.quick, repeat=args.repeat)
+    if args.output is not None:
+        df_result.to_csv(args.output, sep='\t', index=False)
+    with pd.option_context('display.max_rows', None, 'display.width', 200, 'display.max_colwidth', 80):
+        print(df_result.to_string(index=False, float_format='{:.3f}'.format))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,528 @@
+"""
+Seeded synthetic SV cohorts for the benchmarks.
+
+The generator writes VCFs in the styles of Manta, Delly, Lumpy and GRIDSS,
+BEDPEs and BED annotations, so that the benchmarks do not depend on
+any data outside the repository. The same random_state always gives the same files.
+
+Example
+-------
+>>> events = simulate_svs(1000, random_state=0)
+>>> write_vcf(events, 'sample.manta.vcf', variant_caller='manta')
+>>> generate_cohort('cohort', n_patients=20, n_svs=100, variant_caller='delly', random_state=0)
+"""
+import os
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+
+# GRCh37 lengths of the chromosomes.
+CHROMOSOMES = [
+    ('chr1', 249250621), ('chr2', 243199373), ('chr3', 198022430), ('chr4', 191154276),
+    ('chr5', 180915260), ('chr6', 171115067), ('chr7', 159138663), ('chr8', 146364022),
+    ('chr9', 141213431), ('chr10', 135534747), ('chr11', 135006516), ('chr12', 133851895),
+    ('chr13', 115169878), ('chr14', 107349540), ('chr15', 102531392), ('chr16', 90354753),
+    ('chr17', 81195210), ('chr18', 78077248), ('chr19', 59128983), ('chr20', 63025520),
+    ('chr21', 48129895), ('chr22', 51304566), ('chrX', 155270560),
+]
+
+VARIANT_CALLERS = ('manta', 'delly', 'lumpy', 'gridss')
+
+DEFAULT_SVTYPE_WEIGHTS = {'DEL': 0.4, 'DUP': 0.2, 'INV': 0.2, 'TRA': 0.2}
+
+_EVENT_COLUMNS = ['id', 'chrom1', 'pos1', 'chrom2', 'pos2', 'strand1', 'strand2',
+    'svtype', 'ci', 'breakend', 'mate_missing']
+
+def simulate_svs(n_svs: int,
+    random_state=None,
+    svtype_weights: Optional[dict] = None,
+    breakend_fraction: float = 0.0,
+    mate_missing_fraction: float = 0.0,
+    ci_width: int = 100,
+    min_svlen: int = 1000,
+    max_svlen: int = 10000000,
+    chromosomes=None) -> pd.DataFrame:
+    """
+    simulate_svs(n_svs, random_state=None, svtype_weights=None, breakend_fraction=0.0, mate_missing_fraction=0.0, ci_width=100, min_svlen=1000, max_svlen=10000000, chromosomes=None)
+    Draw SV events at random.
+
+    Parameters
+    ----------
+    n_svs: int
+        Number of SV events.
+    random_state: int, np.random.Generator or None, default None
+        Seed of the events.
+    svtype_weights: dict or None, default None
+        Relative frequencies of 'DEL', 'DUP', 'INV' and 'TRA'.
+        If None, DEFAULT_SVTYPE_WEIGHTS is used.
+    breakend_fraction: float, default 0.0
+        Fraction of the intrachromosomal SVs written as a pair of BND records
+        by the callers that report both representations (Manta and Lumpy).
+        GRIDSS writes every SV as breakends, and Delly writes none of them.
+        TRA is always written as breakends.
+    mate_missing_fraction: float, default 0.0
+        Fraction of the breakend pairs whose second record is not written,
+        e.g. because it was filtered out.
+    ci_width: int, default 100
+        Maximum half width of the confidence intervals around the breakends.
+        The half width of each SV is drawn from [0, ci_width], and the SVs with
+        zero width are written as precise.
+    min_svlen, max_svlen: int, default 1000 and 10000000
+        Range of the lengths of the intrachromosomal SVs, drawn log-uniformly.
+    chromosomes: list of (str, int) or None, default None
+        Names and lengths of the chromosomes. If None, CHROMOSOMES is used.
+
+    Returns
+    ----------
+    pd.DataFrame
+        One row per SV event with the columns
+        id, chrom1, pos1, chrom2, pos2, strand1, strand2, svtype, ci, breakend and mate_missing.
+        pos1 <= pos2 for the intrachromosomal SVs.
+    """
+    rng = np.random.default_rng(random_state)
+    if chromosomes is None:
+        chromosomes = CHROMOSOMES
+    if svtype_weights is None:
+        svtype_weights = DEFAULT_SVTYPE_WEIGHTS
+    arr_chrom_names = np.array([c for c, _ in chromosomes])
+    arr_chrom_lengths = np.array([l for _, l in chromosomes])
+    arr_chrom_p = arr_chrom_lengths / arr_chrom_lengths.sum()
+    ls_svtypes = list(svtype_weights.keys())
+    arr_svtype_p = np.array([svtype_weights[t] for t in ls_svtypes], dtype=float)
+    arr_svtype = np.array(ls_svtypes)[rng.choice(len(ls_svtypes), size=n_svs, p=arr_svtype_p / arr_svtype_p.sum())]
+    arr_is_tra = arr_svtype == 'TRA'
+
+    arr_chrom1 = rng.choice(len(chromosomes), size=n_svs, p=arr_chrom_p)
+    # the partner chromosome of TRA is any other chromosome.
+    arr_chrom2 = rng.choice(len(chromosomes), size=n_svs, p=arr_chrom_p)
+    arr_same = arr_is_tra & (arr_chrom1 == arr_chrom2)
+    arr_chrom2[arr_same] = (arr_chrom2[arr_same] + 1) % len(chromosomes)
+    arr_chrom2[~arr_is_tra] = arr_chrom1[~arr_is_tra]
+
+    arr_svlen = np.exp(rng.uniform(np.log(min_svlen), np.log(max_svlen), size=n_svs)).astype(np.int64)
+    # keep the intrachromosomal SVs inside the chromosome.
+    arr_svlen = np.minimum(arr_svlen, arr_chrom_lengths[arr_chrom1] // 2)
+    arr_pos1 = (rng.random(n_svs) * (arr_chrom_lengths[arr_chrom1] - arr_svlen - 2 * ci_width - 2)).astype(np.int64) + ci_width + 1
+    arr_pos2 = np.where(
+        arr_is_tra,
+        (rng.random(n_svs) * (arr_chrom_lengths[arr_chrom2] - 2 * ci_width - 2)).astype(np.int64) + ci_width + 1,
+        arr_pos1 + arr_svlen
+    )
+
+    arr_strand1 = np.where(rng.random(n_svs) < 0.5, '+', '-')
+    arr_strand2 = np.where(rng.random(n_svs) < 0.5, '+', '-')
+    arr_strand1 = np.select([arr_svtype == 'DEL', arr_svtype == 'DUP'], ['+', '-'], default=arr_strand1)
+    arr_strand2 = np.select([arr_svtype == 'DEL', arr_svtype == 'DUP', arr_svtype == 'INV'], ['-', '+', arr_strand1], default=arr_strand2)
+
+    arr_breakend = arr_is_tra | (rng.random(n_svs) < breakend_fraction)
+    arr_mate_missing = arr_breakend & (rng.random(n_svs) < mate_missing_fraction)
+    arr_ci = rng.integers(0, ci_width + 1, size=n_svs)
+
+    return pd.DataFrame({
+        'id': np.arange(n_svs),
+        'chrom1': arr_chrom_names[arr_chrom1],
+        'pos1': arr_pos1,
+        'chrom2': arr_chrom_names[arr_chrom2],
+        'pos2': arr_pos2,
+        'strand1': arr_strand1,
+        'strand2': arr_strand2,
+        'svtype': arr_svtype,
+        'ci': arr_ci,
+        'breakend': arr_breakend,
+        'mate_missing': arr_mate_missing,
+    }, columns=_EVENT_COLUMNS)
+
+def _bnd_alt(strand1, strand2, chrom2, pos2, ref='N'):
+    # VCF breakend notation of a join to chrom2:pos2
+    mate = '{}:{}'.format(chrom2, pos2)
+    if strand1 == '+':
+        return ref + ('[' + mate + '[' if strand2 == '-' else ']' + mate + ']')
+    return ('[' + mate + '[' if strand2 == '-' else ']' + mate + ']') + ref
+
+def _header_lines(meta_lines, chromosomes, samples):
+    ls_lines = [meta_lines[0]]
+    ls_lines += ['##contig=<ID={},length={}>'.format(c, l) for c, l in chromosomes]
+    ls_lines += meta_lines[1:]
+    ls_lines.append('\t'.join(['#CHROM', 'POS', 'ID', 'REF', 'ALT', 'QUAL', 'FILTER', 'INFO', 'FORMAT'] + list(samples)))
+    return ls_lines
+
+_MANTA_META = [
+    '##fileformat=VCFv4.1',
+    '##source=GenerateSVCandidates 1.6.0',
+    '##INFO=<ID=IMPRECISE,Number=0,Type=Flag,Description="Imprecise structural variation">',
+    '##INFO=<ID=SVTYPE,Number=1,Type=String,Description="Type of structural variant">',
+    '##INFO=<ID=SVLEN,Number=.,Type=Integer,Description="Difference in length between REF and ALT alleles">',
+    '##INFO=<ID=END,Number=1,Type=Integer,Description="End position of the variant described in this record">',
+    '##INFO=<ID=CIPOS,Number=2,Type=Integer,Description="Confidence interval around POS">',
+    '##INFO=<ID=CIEND,Number=2,Type=Integer,Description="Confidence interval around END">',
+    '##INFO=<ID=MATEID,Number=.,Type=String,Description="ID of mate breakend">',
+    '##INFO=<ID=BND_DEPTH,Number=1,Type=Integer,Description="Read depth at local translocation breakend">',
+    '##INFO=<ID=MATE_BND_DEPTH,Number=1,Type=Integer,Description="Read depth at remote translocation mate breakend">',
+    '##INFO=<ID=SOMATIC,Number=0,Type=Flag,Description="Somatic mutation">',
+    '##INFO=<ID=SOMATICSCORE,Number=1,Type=Integer,Description="Somatic variant quality score">',
+    '##INFO=<ID=INV3,Number=0,Type=Flag,Description="Inversion breakends open 3\' of reported location">',
+    '##INFO=<ID=INV5,Number=0,Type=Flag,Description="Inversion breakends open 5\' of reported location">',
+    '##FORMAT=<ID=PR,Number=.,Type=Integer,Description="Spanning paired-read support for the ref and alt alleles in the order listed">',
+    '##FORMAT=<ID=SR,Number=.,Type=Integer,Description="Split reads for the ref and alt alleles in the order listed, for reads where P(allele|read)>0.999">',
+    '##FILTER=<ID=MinSomaticScore,Description="Somatic score is less than 30">',
+    '##ALT=<ID=INV,Description="Inversion">',
+    '##ALT=<ID=DEL,Description="Deletion">',
+    '##ALT=<ID=DUP:TANDEM,Description="Tandem Duplication">',
+]
+
+_DELLY_META = [
+    '##fileformat=VCFv4.2',
+    '##FILTER=<ID=PASS,Description="All filters passed">',
+    '##FILTER=<ID=LowQual,Description="Poor quality and insufficient number of PEs and SRs.">',
+    '##ALT=<ID=DEL,Description="Deletion">',
+    '##ALT=<ID=DUP,Description="Duplication">',
+    '##ALT=<ID=INV,Description="Inversion">',
+    '##ALT=<ID=BND,Description="Translocation">',
+    '##INFO=<ID=PRECISE,Number=0,Type=Flag,Description="Precise structural variation">',
+    '##INFO=<ID=IMPRECISE,Number=0,Type=Flag,Description="Imprecise structural variation">',
+    '##INFO=<ID=SVTYPE,Number=1,Type=String,Description="Type of structural variant">',
+    '##INFO=<ID=SVMETHOD,Number=1,Type=String,Description="Type of approach used to detect SV">',
+    '##INFO=<ID=END,Number=1,Type=Integer,Description="End position of the structural variant">',
+    '##INFO=<ID=CHR2,Number=1,Type=String,Description="Chromosome for POS2 coordinate in case of an inter-chromosomal translocation">',
+    '##INFO=<ID=POS2,Number=1,Type=Integer,Description="Genomic position for CHR2 in case of an inter-chromosomal translocation">',
+    '##INFO=<ID=PE,Number=1,Type=Integer,Description="Paired-end support of the structural variant">',
+    '##INFO=<ID=MAPQ,Number=1,Type=Integer,Description="Median mapping quality of paired-ends">',
+    '##INFO=<ID=CT,Number=1,Type=String,Description="Paired-end signature induced connection type">',
+    '##INFO=<ID=CIPOS,Number=2,Type=Integer,Description="PE confidence interval around POS">',
+    '##INFO=<ID=CIEND,Number=2,Type=Integer,Description="PE confidence interval around END">',
+    '##INFO=<ID=SR,Number=1,Type=Integer,Description="Split-read support">',
+    '##INFO=<ID=SVLEN,Number=1,Type=Integer,Description="Insertion length for SVTYPE=INS.">',
+    '##INFO=<ID=SOMATIC,Number=0,Type=Flag,Description="Somatic structural variant.">',
+    '##FORMAT=<ID=GT,Number=1,Type=String,Description="Genotype">',
+    '##FORMAT=<ID=GQ,Number=1,Type=Integer,Description="Genotype Quality">',
+    '##FORMAT=<ID=FT,Number=1,Type=String,Description="Per-sample genotype filter">',
+    '##FORMAT=<ID=DR,Number=1,Type=Integer,Description="# high-quality reference pairs">',
+    '##FORMAT=<ID=DV,Number=1,Type=Integer,Description="# high-quality variant pairs">',
+    '##FORMAT=<ID=RR,Number=1,Type=Integer,Description="# high-quality reference junction reads">',
+    '##FORMAT=<ID=RV,Number=1,Type=Integer,Description="# high-quality variant junction reads">',
+]
+
+_LUMPY_META = [
+    '##fileformat=VCFv4.2',
+    '##source=LUMPY',
+    '##INFO=<ID=SVTYPE,Number=1,Type=String,Description="Type of structural variant">',
+    '##INFO=<ID=STRANDS,Number=.,Type=String,Description="Strand orientation of the adjacency in BEDPE format (DEL:+-, DUP:-+, INV:++/--)">',
+    '##INFO=<ID=SECONDARY,Number=0,Type=Flag,Description="Secondary breakend in a multi-line variants">',
+    '##INFO=<ID=EVENT,Number=1,Type=String,Description="ID of event associated to breakend">',
+    '##INFO=<ID=MATEID,Number=.,Type=String,Description="ID of mate breakends">',
+    '##INFO=<ID=SVLEN,Number=.,Type=Integer,Description="Difference in length between REF and ALT alleles">',
+    '##INFO=<ID=END,Number=1,Type=Integer,Description="End position of the variant described in this record">',
+    '##INFO=<ID=CIPOS,Number=2,Type=Integer,Description="Confidence interval around POS for imprecise variants">',
+    '##INFO=<ID=CIEND,Number=2,Type=Integer,Description="Confidence interval around END for imprecise variants">',
+    '##INFO=<ID=CIPOS95,Number=2,Type=Integer,Description="Confidence interval (95%) around POS for imprecise variants">',
+    '##INFO=<ID=CIEND95,Number=2,Type=Integer,Description="Confidence interval (95%) around END for imprecise variants">',
+    '##INFO=<ID=IMPRECISE,Number=0,Type=Flag,Description="Imprecise structural variation">',
+    '##INFO=<ID=SU,Number=.,Type=Integer,Description="Number of pieces of evidence supporting the variant across all samples">',
+    '##INFO=<ID=PE,Number=.,Type=Integer,Description="Number of paired-end reads supporting the variant across all samples">',
+    '##INFO=<ID=SR,Number=.,Type=Integer,Description="Number of split reads supporting the variant across all samples">',
+    '##ALT=<ID=DEL,Description="Deletion">',
+    '##ALT=<ID=DUP,Description="Duplication">',
+    '##ALT=<ID=INV,Description="Inversion">',
+    '##FORMAT=<ID=GT,Number=1,Type=String,Description="Genotype">',
+    '##FORMAT=<ID=SU,Number=1,Type=Integer,Description="Number of pieces of evidence supporting the variant">',
+    '##FORMAT=<ID=PE,Number=1,Type=Integer,Description="Number of paired-end reads supporting the variant">',
+    '##FORMAT=<ID=SR,Number=1,Type=Integer,Description="Number of split reads supporting the variant">',
+]
+
+_GRIDSS_META = [
+    '##fileformat=VCFv4.2',
+    '##gridssVersion=2.10.2-gridss',
+    '##INFO=<ID=AS,Number=1,Type=Integer,Description="Count of assemblies supporting breakpoint">',
+    '##INFO=<ID=CIEND,Number=2,Type=Integer,Description="Confidence interval around END for imprecise variants">',
+    '##INFO=<ID=CIPOS,Number=2,Type=Integer,Description="Confidence interval around POS for imprecise variants">',
+    '##INFO=<ID=CIRPOS,Number=2,Type=Integer,Description="Confidence interval around remote breakend POS for imprecise variants">',
+    '##INFO=<ID=EVENT,Number=1,Type=String,Description="ID of event associated to breakend">',
+    '##INFO=<ID=IMPRECISE,Number=0,Type=Flag,Description="Imprecise structural variation">',
+    '##INFO=<ID=MATEID,Number=.,Type=String,Description="ID of mate breakends">',
+    '##INFO=<ID=RP,Number=1,Type=Integer,Description="Count of read pairs supporting breakpoint">',
+    '##INFO=<ID=SR,Number=1,Type=Integer,Description="Count of split reads supporting breakpoint">',
+    '##INFO=<ID=SVLEN,Number=.,Type=Integer,Description="Difference in length between REF and ALT alleles">',
+    '##INFO=<ID=SVTYPE,Number=1,Type=String,Description="Type of structural variant">',
+    '##INFO=<ID=VF,Number=1,Type=Integer,Description="Count of fragments supporting the variant breakpoint allele and not the reference allele.">',
+    '##FILTER=<ID=LOW_QUAL,Description="Low quality call">',
+    '##ALT=<ID=BND,Description="Breakend">',
+    '##FORMAT=<ID=GT,Number=1,Type=String,Description="Genotype">',
+    '##FORMAT=<ID=RP,Number=1,Type=Integer,Description="Count of read pairs supporting breakpoint">',
+    '##FORMAT=<ID=SR,Number=1,Type=Integer,Description="Count of split reads supporting breakpoint">',
+    '##FORMAT=<ID=VF,Number=1,Type=Integer,Description="Count of fragments supporting the variant breakpoint allele and not the reference allele.">',
+]
+
+_META = {'manta': _MANTA_META, 'delly': _DELLY_META, 'lumpy': _LUMPY_META, 'gridss': _GRIDSS_META}
+
+def _ci_info(ci):
+    return '-{0},{0}'.format(ci)
+
+def _manta_records(ev, rng, n_samples):
+    ls_format = ['PR:SR'] + ['{},{}:{},{}'.format(*rng.integers(0, 60, size=4)) for _ in range(n_samples)]
+    score = int(rng.integers(10, 100))
+    filter_ = 'PASS' if score >= 30 else 'MinSomaticScore'
+    ls_flags = ['IMPRECISE'] if ev.ci > 0 else []
+    if ev.breakend:
+        id1 = 'MantaBND:{}:0:1:0:0:0:0'.format(ev.id)
+        id2 = 'MantaBND:{}:0:1:0:0:0:1'.format(ev.id)
+        depth1, depth2 = rng.integers(20, 80, size=2)
+        ls_out = []
+        for chrom, pos, strand1, strand2, chrom2, pos2, id_, mateid, d1, d2 in [
+            (ev.chrom1, ev.pos1, ev.strand1, ev.strand2, ev.chrom2, ev.pos2, id1, id2, depth1, depth2),
+            (ev.chrom2, ev.pos2, ev.strand2, ev.strand1, ev.chrom1, ev.pos1, id2, id1, depth2, depth1)]:
+            info = ';'.join(ls_flags + ['SVTYPE=BND', 'MATEID=' + mateid] + (['CIPOS=' + _ci_info(ev.ci)] if ev.ci > 0 else []) +
+                ['BND_DEPTH={}'.format(d1), 'MATE_BND_DEPTH={}'.format(d2), 'SOMATIC', 'SOMATICSCORE={}'.format(score)])
+            ls_out.append((chrom, pos, [id_, 'N', _bnd_alt(strand1, strand2, chrom2, pos2), '.', filter_, info] + ls_format))
+        return ls_out[:1] if ev.mate_missing else ls_out
+    svtype = ev.svtype
+    svlen = ev.pos2 - ev.pos1
+    alt = {'DEL': '<DEL>', 'DUP': '<DUP:TANDEM>', 'INV': '<INV>'}[svtype]
+    ls_info = ls_flags + ['SVTYPE=' + svtype, 'SVLEN={}'.format(-svlen if svtype == 'DEL' else svlen), 'END={}'.format(ev.pos2)]
+    if ev.ci > 0:
+        ls_info += ['CIPOS=' + _ci_info(ev.ci), 'CIEND=' + _ci_info(ev.ci)]
+    ls_info += ['SOMATIC', 'SOMATICSCORE={}'.format(score)]
+    if svtype == 'INV':
+        ls_info.append('INV3' if ev.strand1 == '+' else 'INV5')
+    id_ = 'Manta{}:{}:0:1:0:0:0'.format(svtype, ev.id)
+    return [(ev.chrom1, ev.pos1, [id_, 'N', alt, '.', filter_, ';'.join(ls_info)] + ls_format)]
+
+_DELLY_CT = {'+': '3', '-': '5'}
+
+def _delly_records(ev, rng, n_samples):
+    ls_format = ['GT:GQ:FT:DR:DV:RR:RV']
+    for _ in range(n_samples):
+        dr, dv, rr, rv = rng.integers(0, 60, size=4)
+        ls_format.append('0/1:{}:PASS:{}:{}:{}:{}'.format(rng.integers(0, 100), dr, dv, rr, rv))
+    pe, sr, mapq = rng.integers(0, 30, size=3)
+    qual = int(rng.integers(0, 1000))
+    filter_ = 'PASS' if qual >= 100 else 'LowQual'
+    ls_info = ['IMPRECISE' if ev.ci > 0 else 'PRECISE']
+    ct = '{}to{}'.format(_DELLY_CT[ev.strand1], _DELLY_CT[ev.strand2])
+    if ev.svtype == 'TRA':
+        # a translocation is reported by a single BND record.
+        id_ = 'BND{:08d}'.format(ev.id)
+        alt = _bnd_alt(ev.strand1, ev.strand2, ev.chrom2, ev.pos2)
+        ls_info += ['SVTYPE=BND', 'SVMETHOD=EMBL.DELLYv0.8.5', 'END={}'.format(ev.pos1 + 1),
+            'CHR2=' + ev.chrom2, 'POS2={}'.format(ev.pos2)]
+    else:
+        id_ = '{}{:08d}'.format(ev.svtype, ev.id)
+        alt = '<{}>'.format(ev.svtype)
+        ls_info += ['SVTYPE=' + ev.svtype, 'SVMETHOD=EMBL.DELLYv0.8.5', 'END={}'.format(ev.pos2)]
+    ls_info += ['PE={}'.format(pe), 'MAPQ={}'.format(mapq), 'CT=' + ct,
+        'CIPOS=' + _ci_info(ev.ci), 'CIEND=' + _ci_info(ev.ci)]
+    if ev.ci == 0:
+        ls_info.append('SR={}'.format(sr))
+    ls_info.append('SOMATIC')
+    return [(ev.chrom1, ev.pos1, [id_, 'N', alt, str(qual), filter_, ';'.join(ls_info)] + ls_format)]
+
+def _lumpy_records(ev, rng, n_samples):
+    ls_pe = rng.integers(0, 10, size=n_samples)
+    ls_sr = rng.integers(0, 10, size=n_samples)
+    ls_format = ['GT:SU:PE:SR'] + ['./.:{}:{}:{}'.format(pe + sr, pe, sr) for pe, sr in zip(ls_pe, ls_sr)]
+    pe, sr = int(ls_pe.sum()), int(ls_sr.sum())
+    su = pe + sr
+    ci_info = ['CIPOS=' + _ci_info(ev.ci), 'CIEND=' + _ci_info(ev.ci),
+        'CIPOS95=' + _ci_info(ev.ci // 2), 'CIEND95=' + _ci_info(ev.ci // 2)]
+    ls_flags = ['IMPRECISE'] if ev.ci > 0 else []
+    count_info = ['SU={}'.format(su), 'PE={}'.format(pe), 'SR={}'.format(sr)]
+    if ev.breakend:
+        id1, id2 = '{}_1'.format(ev.id), '{}_2'.format(ev.id)
+        strands = 'STRANDS={}{}:{}'.format(ev.strand1, ev.strand2, su)
+        ls_out = []
+        for chrom, pos, strand1, strand2, chrom2, pos2, id_, mateid, ls_secondary in [
+            (ev.chrom1, ev.pos1, ev.strand1, ev.strand2, ev.chrom2, ev.pos2, id1, id2, []),
+            (ev.chrom2, ev.pos2, ev.strand2, ev.strand1, ev.chrom1, ev.pos1, id2, id1, ['SECONDARY'])]:
+            info = ';'.join(['SVTYPE=BND', strands] + ls_secondary + ['EVENT={}'.format(ev.id), 'MATEID=' + mateid] +
+                ci_info + ls_flags + count_info)
+            ls_out.append((chrom, pos, [id_, 'N', _bnd_alt(strand1, strand2, chrom2, pos2), '.', '.', info] + ls_format))
+        return ls_out[:1] if ev.mate_missing else ls_out
+    svlen = ev.pos2 - ev.pos1
+    if ev.svtype == 'INV':
+        # Lumpy reports both orientations of an inversion in one record.
+        n_plus = int(rng.integers(0, su + 1))
+        strands = 'STRANDS=++:{},--:{}'.format(n_plus, su - n_plus)
+    else:
+        strands = 'STRANDS={}{}:{}'.format(ev.strand1, ev.strand2, su)
+    info = ';'.join(['SVTYPE=' + ev.svtype, strands, 'SVLEN={}'.format(-svlen if ev.svtype == 'DEL' else svlen),
+        'END={}'.format(ev.pos2)] + ci_info + ls_flags + count_info)
+    return [(ev.chrom1, ev.pos1, [str(ev.id), 'N', '<{}>'.format(ev.svtype), '.', '.', info] + ls_format)]
+
+def _gridss_records(ev, rng, n_samples):
+    # GRIDSS reports every SV as a pair of breakends.
+    ls_counts = [rng.integers(0, 30, size=2) for _ in range(n_samples)]
+    ls_format = ['GT:RP:SR:VF'] + ['.:{}:{}:{}'.format(rp, sr, rp + sr) for rp, sr in ls_counts]
+    rp, sr = [int(x) for x in np.sum(ls_counts, axis=0)]
+    qual = '{:.2f}'.format(rng.uniform(0, 2000))
+    filter_ = 'PASS' if float(qual) >= 100 else 'LOW_QUAL'
+    event = 'gridss{}'.format(ev.id)
+    id1, id2 = event + 'o', event + 'h'
+    ls_out = []
+    for chrom, pos, strand1, strand2, chrom2, pos2, id_, mateid in [
+        (ev.chrom1, ev.pos1, ev.strand1, ev.strand2, ev.chrom2, ev.pos2, id1, id2),
+        (ev.chrom2, ev.pos2, ev.strand2, ev.strand1, ev.chrom1, ev.pos1, id2, id1)]:
+        ls_info = ['AS={}'.format(rng.integers(0, 3))]
+        if ev.ci > 0:
+            ls_info += ['CIPOS=' + _ci_info(ev.ci), 'CIRPOS=' + _ci_info(ev.ci)]
+        ls_info += ['EVENT=' + event] + (['IMPRECISE'] if ev.ci > 0 else []) + \
+            ['MATEID=' + mateid, 'RP={}'.format(rp), 'SR={}'.format(sr), 'SVTYPE=BND', 'VF={}'.format(rp + sr)]
+        ls_out.append((chrom, pos, [id_, 'N', _bnd_alt(strand1, strand2, chrom2, pos2), qual, filter_, ';'.join(ls_info)] + ls_format))
+    return ls_out[:1] if ev.mate_missing else ls_out
+
+_RECORD_WRITERS = {'manta': _manta_records, 'delly': _delly_records, 'lumpy': _lumpy_records, 'gridss': _gridss_records}
+
+def write_vcf(events: pd.DataFrame, path_or_buf, variant_caller: str = 'manta',
+    samples=('normal', 'tumor'), random_state=None, chromosomes=None):
+    """
+    write_vcf(events, path_or_buf, variant_caller='manta', samples=('normal', 'tumor'), random_state=None, chromosomes=None)
+    Write SV events as a VCF in the style of an SV caller.
+
+    The records are sorted by their positions as the callers do,
+    so that the mates of breakends are usually far from each other.
+
+    Parameters
+    ----------
+    events: pd.DataFrame
+        SV events returned by simulate_svs().
+    path_or_buf: str or file-like object
+        Output path or buffer.
+    variant_caller: str, default 'manta'
+        One of 'manta', 'delly', 'lumpy' and 'gridss'.
+    samples: tuple of str, default ('normal', 'tumor')
+        Names of the sample columns.
+    random_state: int, np.random.Generator or None, default None
+        Seed of the read counts and qualities.
+    chromosomes: list of (str, int) or None, default None
+        Contigs of the header. If None, CHROMOSOMES is used.
+    """
+    if variant_caller not in _RECORD_WRITERS:
+        raise ValueError('variant_caller should be one of {}.'.format(VARIANT_CALLERS))
+    rng = np.random.default_rng(random_state)
+    if chromosomes is None:
+        chromosomes = CHROMOSOMES
+    dict_chrom_order = {c: i for i, (c, _) in enumerate(chromosomes)}
+    record_writer = _RECORD_WRITERS[variant_caller]
+    ls_records = []
+    for ev in events.itertuples(index=False):
+        ls_records += record_writer(ev, rng, len(samples))
+    ls_records.sort(key=lambda r: (dict_chrom_order.get(r[0], len(dict_chrom_order)), r[1]))
+
+    ls_lines = _header_lines(_META[variant_caller], chromosomes, samples)
+    ls_lines += ['\t'.join([chrom, str(pos)] + ls_fields) for chrom, pos, ls_fields in ls_records]
+    _write_lines(path_or_buf, ls_lines)
+
+def write_bedpe(events: pd.DataFrame, path_or_buf):
+    """
+    write_bedpe(events, path_or_buf)
+    Write SV events as a BEDPE that read_bedpe() accepts.
+    The breakend intervals are the confidence intervals of the events.
+
+    Parameters
+    ----------
+    events: pd.DataFrame
+        SV events returned by simulate_svs().
+    path_or_buf: str or file-like object
+        Output path or buffer.
+    """
+    df_bedpe = pd.DataFrame({
+        'chrom1': events['chrom1'],
+        'start1': events['pos1'] - 1 - events['ci'],
+        'end1': events['pos1'] + events['ci'],
+        'chrom2': events['chrom2'],
+        'start2': events['pos2'] - 1 - events['ci'],
+        'end2': events['pos2'] + events['ci'],
+        'name': 'sv' + events['id'].astype(str),
+        'score': 60,
+        'strand1': events['strand1'],
+        'strand2': events['strand2'],
+    })
+    df_bedpe.to_csv(path_or_buf, sep='\t', index=False)
+
+def write_bed(path_or_buf, n_regions: int, random_state=None, min_width: int = 1000, max_width: int = 1000000, chromosomes=None):
+    """
+    write_bed(path_or_buf, n_regions, random_state=None, min_width=1000, max_width=1000000, chromosomes=None)
+    Write random genomic regions as a BED for annotate_bed().
+
+    Parameters
+    ----------
+    path_or_buf: str or file-like object
+        Output path or buffer.
+    n_regions: int
+        Number of regions.
+    random_state: int, np.random.Generator or None, default None
+        Seed of the regions.
+    min_width, max_width: int, default 1000 and 1000000
+        Range of the widths of the regions, drawn log-uniformly.
+    chromosomes: list of (str, int) or None, default None
+        Names and lengths of the chromosomes. If None, CHROMOSOMES is used.
+    """
+    rng = np.random.default_rng(random_state)
+    if chromosomes is None:
+        chromosomes = CHROMOSOMES
+    arr_chrom_names = np.array([c for c, _ in chromosomes])
+    arr_chrom_lengths = np.array([l for _, l in chromosomes])
+    arr_chrom = rng.choice(len(chromosomes), size=n_regions, p=arr_chrom_lengths / arr_chrom_lengths.sum())
+    arr_width = np.exp(rng.uniform(np.log(min_width), np.log(max_width), size=n_regions)).astype(np.int64)
+    arr_start = (rng.random(n_regions) * (arr_chrom_lengths[arr_chrom] - arr_width)).astype(np.int64)
+    df_bed = pd.DataFrame({
+        'chrom': arr_chrom_names[arr_chrom],
+        'chromStart': arr_start,
+        'chromEnd': arr_start + arr_width,
+        'name': ['region{}'.format(i) for i in range(n_regions)],
+    }).sort_values(['chrom', 'chromStart'])
+    df_bed.to_csv(path_or_buf, sep='\t', index=False, header=False)
+
+def generate_cohort(out_dir: str, n_patients: int, n_svs: int, variant_caller: str = 'manta',
+    format_: str = 'vcf', random_state=None, **kwargs) -> List[str]:
+    """
+    generate_cohort(out_dir, n_patients, n_svs, variant_caller='manta', format_='vcf', random_state=None, **kwargs)
+    Write the SV files of a synthetic cohort, one file per patient,
+    which can be read by read_vcf_multi() or read_bedpe_multi().
+
+    Parameters
+    ----------
+    out_dir: str
+        Output directory. It is created if it does not exist.
+    n_patients: int
+        Number of patients.
+    n_svs: int
+        Mean number of SV events per patient. The numbers are Poisson distributed.
+    variant_caller: str, default 'manta'
+        Style of the VCFs. Ignored if format_ is 'bedpe'.
+    format_: str, default 'vcf'
+        'vcf' or 'bedpe'.
+    random_state: int or None, default None
+        Seed of the cohort. Each patient has an independent stream spawned from it.
+    **kwargs:
+        Passed to simulate_svs().
+
+    Returns
+    ----------
+    list of str
+        Paths of the files, named "patient<number>.<format_>".
+    """
+    if format_ not in ('vcf', 'bedpe'):
+        raise ValueError("format_ should be 'vcf' or 'bedpe'.")
+    os.makedirs(out_dir, exist_ok=True)
+    ls_seeds = np.random.SeedSequence(random_state).spawn(n_patients)
+    n_digits = len(str(n_patients))
+    ls_paths = []
+    for i, seed in enumerate(ls_seeds):
+        rng = np.random.default_rng(seed)
+        patient = 'patient{}'.format(str(i).zfill(n_digits))
+        events = simulate_svs(int(rng.poisson(n_svs)), random_state=rng, **kwargs)
+        path = os.path.join(out_dir, '{}.{}'.format(patient, format_))
+        if format_ == 'vcf':
+            write_vcf(events, path, variant_caller=variant_caller,
+                samples=(patient + '_N', patient + '_T'), random_state=rng, chromosomes=kwargs.get('chromosomes'))
+        else:
+            write_bedpe(events, path)
+        ls_paths.append(path)
+    return ls_paths
+
+def _write_lines(path_or_buf, ls_lines):
+    text = '\n'.join(ls_lines) + '\n'
+    if hasattr(path_or_buf, 'write'):
+        path_or_buf.write(text)
+    else:
+        with open(path_or_buf, 'w') as f:
+            f.write(text)
@@ -3,11 +3,11 @@ import vcf
 from viola.io.api import (
     read_vcf,
     read_vcf2,
+    read_vcf_chunks,
     read_bedpe,
     read_bed,
     read_vcf_multi,
     read_bedpe_multi,
-    read_fasta,
 )
 from viola.core.api import (
     Bed,
@@ -16,6 +16,8 @@ from viola.core.api import (
     Bedpe,
     Vcf,
     Fasta,
+    RaggedInfo,
+    LazyPlan,
     Indexer,
     RootIndexer,
     SvIdIndexer,
@@ -23,10 +25,7 @@ from viola.core.api import (
     IntervalTreeForMerge,
     merge,
     concat,
-)
-
-from viola.ml.api import (
-    SV_signature_extractor,
+    CohortBuilder,
 )
 
 from viola.utils.api import (
@@ -37,7 +36,18 @@ from viola.utils.api import (
     get_id_by_slicing_info,
 )
 
-import viola.testing
 import viola._typing
 import viola._exceptions
-from viola._version import __version__
\ No newline at end of file
+from viola._version import __version__
+
+# The subsystems below import heavy dependencies (scikit-learn, SciPy, Biopython)
+# and are loaded on the first access of their names,
+# so that "import viola" and the CLI start quickly.
+from viola._lazy import set_lazy_attributes
+set_lazy_attributes(__name__, {
+    'SV_signature_extractor': 'viola.ml.api',
+    'select_n_signatures': 'viola.ml.api',
+    'fit_exposures': 'viola.ml.api',
+    'read_fasta': 'viola.io.fasta_io',
+    'testing': 'viola.testing',
+})
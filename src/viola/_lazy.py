@@ -0,0 +1,41 @@
+import sys
+import importlib
+from types import ModuleType
+
+class _LazyModule(ModuleType):
+    """
+    Module whose attributes listed in _lazy_attributes are imported on their first access.
+
+    The class of the module is replaced instead of defining a module-level
+    __getattr__ (PEP 562), which is not available on Python 3.6.
+    """
+    def __getattr__(self, name):
+        # called only when name is not found in the module.
+        module_name = self.__dict__.get('_lazy_attributes', {}).get(name)
+        if module_name is None:
+            raise AttributeError("module '{}' has no attribute '{}'".format(self.__name__, name))
+        module = importlib.import_module(module_name)
+        value = module if module_name.rsplit('.', 1)[-1] == name and not hasattr(module, name) else getattr(module, name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self.__dict__.get('_lazy_attributes', {})))
+
+def set_lazy_attributes(module_name, dict_lazy_attributes):
+    """
+    set_lazy_attributes(module_name, dict_lazy_attributes)
+    Make the attributes of a module imported on their first access.
+
+    Parameters
+    ----------
+    module_name: str
+        Name of the module, i.e. __name__ of the caller.
+    dict_lazy_attributes: dict
+        Attribute names and the names of the modules they are imported from.
+        If the attribute name is the last component of the module name
+        and the module has no such attribute, the module itself is the value.
+    """
+    module = sys.modules[module_name]
+    module._lazy_attributes = dict_lazy_attributes
+    module.__class__ = _LazyModule
@@ -2,6 +2,58 @@ import click
 import viola
 from io import StringIO, TextIOWrapper
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from viola.core.cohort import _read_definitions
+from viola.io.multi_parser import _list_input_files
+from viola.utils.utils import _check_n_jobs
+
+def _count_features(args):
+    """
+    Read, classify and count the SV classes of one file. Worker of the --streaming mode.
+    """
+    path, format_, caller, svtype_col_name, as_breakpoint, ls_definitions = args
+    if format_ == 'bedpe':
+        obj = viola.read_bedpe(path, svtype_col_name=svtype_col_name)
+    else:
+        obj = viola.read_vcf(path, variant_caller=caller)
+        if as_breakpoint:
+            obj = obj.breakend2breakpoint()
+    return obj.classify_manual_svtype(definitions=ls_definitions)
+
+def _generate_feature_matrix_streaming(ls_inputs, format_, caller, svtype_col_name, as_breakpoint, definitions, n_jobs, output):
+    """
+    Write the feature counts of each (path, patient name) of ls_inputs as soon as it is counted.
+    Only the rows being counted are kept in memory.
+    """
+    ls_definitions = _read_definitions(definitions)
+    iterable_args = ((path, format_, caller, svtype_col_name, as_breakpoint, ls_definitions) for path, name in ls_inputs)
+    is_header_written = False
+    def _write(name, ser_counts):
+        nonlocal is_header_written
+        if not is_header_written:
+            output.write('\t'.join(['patients'] + [str(x) for x in ser_counts.index]) + '\n')
+            is_header_written = True
+        output.write('\t'.join([str(name)] + [str(x) for x in ser_counts.values]) + '\n')
+        output.flush()
+
+    ls_names = [name for path, name in ls_inputs]
+    n_jobs = _check_n_jobs(n_jobs)
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            # keep a bounded number of files in flight, and write the rows in the input order.
+            deque_futures = deque()
+            for i, args in enumerate(iterable_args):
+                deque_futures.append((ls_names[i], executor.submit(_count_features, args)))
+                if len(deque_futures) >= 2 * n_jobs:
+                    name, future = deque_futures.popleft()
+                    _write(name, future.result())
+            while deque_futures:
+                name, future = deque_futures.popleft()
+                _write(name, future.result())
+    else:
+        for name, args in zip(ls_names, iterable_args):
+            _write(name, _count_features(args))
 
 CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 @click.command(context_settings=CONTEXT_SETTINGS)
@@ -14,12 +66,29 @@ CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 @click.option('--svtype-col-name', default=None, help='Name of the column of BEDPE files that indicate SV type. If not specified, SV type will be infered. This option can be specified when --format=bedpe')
 @click.option('--as-breakpoint', is_flag=True, help='Convert SVTYPE=BND records into breakpoint-wise SV records and infer its SVTYPE. This option is used when --format=vcf')
 @click.option('--definitions', default=None, help='Path to the definition file of custom SV class.')
+@click.option('--streaming', is_flag=True, help='Read and classify the input files one by one, and write the row of each file as soon as it is counted. The memory usage does not depend on the number of files. The definitions must only look at each SV record.')
+@click.option('--n-jobs', default=1, help='Number of processes used to classify the input files in the --streaming mode. -1 means all CPUs.')
 @click.argument('output', type=click.File('w'))
 
-def generate_feature_matrix(input_dir, input_files, input_files_id, format_, caller, svtype_col_name, as_breakpoint, definitions, output):
+def generate_feature_matrix(input_dir, input_files, input_files_id, format_, caller, svtype_col_name, as_breakpoint, definitions, streaming, n_jobs, output):
     """
     Generate feature matrix from VCF or BEDPE files.
     """
+    if streaming:
+        if (input_dir is None) == (input_files is None):
+            return
+        elif input_files is None:
+            ls_inputs = _list_input_files(input_dir, format_, format_)
+        else:
+            ls_input = input_files.split(',')
+            if input_files_id is None:
+                ls_names = range(len(ls_input))
+            else:
+                ls_names = input_files_id.split(',')
+            ls_inputs = list(zip(ls_input, ls_names))
+        _generate_feature_matrix_streaming(ls_inputs, format_, caller, svtype_col_name, as_breakpoint, definitions, n_jobs, output)
+        return
+
     if format_ == 'bedpe':
         if (input_dir is None) & (input_files is None):
             return
@@ -1,7 +1,91 @@
 import viola
 import click
 import sys
-from io import StringIO, TextIOWrapper
+import re
+import warnings
+import pandas as pd
+
+def _int_number(number):
+    # the Number of a header line as int, or None if it is not a fixed number.
+    try:
+        number = int(float(number))
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+class _BedpeChunkWriter(object):
+    """
+    Write the BEDPE rows of Vcf chunks as tab-separated lines.
+
+    The columns are fixed when the first chunk is written. The INFO, FILTER and FORMAT
+    columns are those of the first chunk and those expected from the header, so that
+    the columns of the later chunks are aligned to them. The missing values are filled
+    in the same way as Vcf.to_bedpe_like().
+    """
+    def __init__(self, output, ls_info, add_filters, add_formats):
+        self.output = output
+        self.ls_info = ls_info
+        self.add_filters = add_filters
+        self.add_formats = add_formats
+        self.ls_columns = None
+        self.dict_fill = {}
+        self.ls_int_columns = []
+        self.ls_format_columns = []
+        self.is_warned = False
+
+    def _set_columns(self, vcf_chunk, df_bedpe):
+        ls_base = list(df_bedpe.columns[:10])
+        set_columns = set(df_bedpe.columns)
+        df_infos_meta = vcf_chunk.get_table('infos_meta')
+        ls_info_columns = []
+        for info in self.ls_info:
+            row = df_infos_meta.loc[df_infos_meta['id'] == info.upper()].iloc[0]
+            re_column = re.compile('^{}_([0-9]+)$'.format(re.escape(info)))
+            n_observed = max([int(m.group(1)) + 1 for m in map(re_column.match, df_bedpe.columns) if m is not None], default=0)
+            n_values = max(n_observed, _int_number(row['number']) or 1)
+            ls_columns = ['{}_{}'.format(info, i) for i in range(n_values)]
+            ls_info_columns += ls_columns
+            if row['type'] == 'Integer':
+                self.dict_fill.update({c: 0 for c in ls_columns})
+                self.ls_int_columns += ls_columns
+            elif row['type'] == 'Flag':
+                self.dict_fill.update({c: False for c in ls_columns})
+        ls_filter_columns = []
+        if self.add_filters:
+            set_filters = set(vcf_chunk.get_table('filters')['filter']) & set_columns
+            set_filters |= set(vcf_chunk.get_table('filters_meta')['id']) | {'PASS'}
+            ls_filter_columns = sorted(set_filters)
+            self.dict_fill.update({c: False for c in ls_filter_columns})
+        ls_format_columns = []
+        if self.add_formats:
+            set_formats = set_columns - set(ls_base) - set(ls_info_columns) - set(ls_filter_columns)
+            df_formats_meta = vcf_chunk.get_table('formats_meta')
+            for sample in vcf_chunk.get_table('samples_meta')['id']:
+                for fmt, number in zip(df_formats_meta['id'], df_formats_meta['number']):
+                    set_formats |= {'{}_{}_{}'.format(sample, fmt, i) for i in range(_int_number(number) or 0)}
+            ls_format_columns = sorted(set_formats)
+            self.ls_format_columns = ls_format_columns
+        self.ls_columns = ls_base + ls_info_columns + ls_filter_columns + ls_format_columns
+
+    def write(self, vcf_chunk):
+        df_bedpe = vcf_chunk.to_bedpe_like(custom_infonames=self.ls_info, add_filters=self.add_filters, add_formats=self.add_formats)
+        is_first = self.ls_columns is None
+        if is_first:
+            self._set_columns(vcf_chunk, df_bedpe)
+        elif not self.is_warned and not set(df_bedpe.columns) <= set(self.ls_columns):
+            warnings.warn('Some columns are not found in the header and the first records, and are not written: {}'.format(
+                sorted(set(df_bedpe.columns) - set(self.ls_columns))))
+            self.is_warned = True
+        df_bedpe = df_bedpe.reindex(columns=self.ls_columns)
+        df_bedpe = df_bedpe.fillna(self.dict_fill)
+        df_bedpe[self.ls_int_columns] = df_bedpe[self.ls_int_columns].astype(int)
+        # numeric FORMAT values are float whenever a chunk has missing values,
+        # so they are always written as float to be independent of the chunks.
+        for column in self.ls_format_columns:
+            if pd.api.types.is_numeric_dtype(df_bedpe[column]) and not pd.api.types.is_bool_dtype(df_bedpe[column]):
+                df_bedpe[column] = df_bedpe[column].astype(float)
+        df_bedpe.to_csv(self.output, sep='\t', index=False, header=is_first)
+        self.output.flush()
 
 CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 @click.command(context_settings=CONTEXT_SETTINGS)
@@ -10,21 +94,22 @@ CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 @click.option('-i', '--info', help='The names of INFO fields to return. To specify multiple INFO, separate them by commas. ex. --info SVTYPE,SVLEN,END')
 @click.option('-f','--filter', 'filter_', is_flag=True, help='If specified, FILTER field of the VCF files is included in output BEDPE.')
 @click.option('-m', '--format', 'format_', is_flag=True, help='If specified, FORMAT field of the VCF files is included in output BEDPE.')
-@click.argument('vcf', default=sys.stdin, type=click.File('r'))
-def vcf2bedpe(caller, info, filter_, format_, vcf):
+@click.option('--chunksize', default=10000, help='Number of VCF records converted at a time. The memory usage depends on this value, not on the size of the input. Breakends are written with their mates, so they may come later than in the input.')
+@click.argument('vcf', default='-', type=click.File('rb'))
+def vcf2bedpe(caller, info, filter_, format_, chunksize, vcf):
    """
    Convert a VCF file into a BEDPE file.
 
    A VCF argument is the path to the input VCF file.
+   The input can be gzip/BGZF compressed. If omitted, the VCF is read from the standard input.
+   The records are converted chunk by chunk, and the tab-separated BEDPE rows are
+   written to the standard output as they are converted.
    """
-   if isinstance(vcf, TextIOWrapper):
-      vcf_obj = viola.read_vcf(StringIO(vcf.read()), variant_caller=caller)
-   else:
-      vcf_obj = viola.read_vcf(vcf, variant_caller=caller)
    if info is not None:
       ls_info = info.split(',')
       ls_info_lower = [i.lower() for i in ls_info]
    else:
       ls_info_lower = []
-   bedpe_like = vcf_obj.to_bedpe_like(custom_infonames=ls_info_lower, add_filters=filter_, add_formats=format_)
-   click.echo(bedpe_like.to_string(index=None))
+   writer = _BedpeChunkWriter(sys.stdout, ls_info_lower, filter_, format_)
+   for vcf_chunk in viola.read_vcf_chunks(vcf, variant_caller=caller, chunksize=chunksize):
+      writer.write(vcf_chunk)
@@ -2,6 +2,7 @@ import click
 from viola.cli.vcf2bedpe import vcf2bedpe
 from viola.cli.matrix_generator import generate_feature_matrix
 from viola.cli.signature_extractor import extract_signature
+from viola.cli.signature_selector import select_n_signatures
 @click.group()
 def viola():
    pass
@@ -9,6 +10,7 @@ def viola():
 viola.add_command(vcf2bedpe)
 viola.add_command(generate_feature_matrix)
 viola.add_command(extract_signature)
+viola.add_command(select_n_signatures)
 
 if __name__ == '__main__':
    viola()
\ No newline at end of file
@@ -0,0 +1,184 @@
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_list_like
+from viola.core.ragged import RaggedInfo
+
+class LazySelection(object):
+    """
+    Rows of a table whose SV ids are in all of the given id lists.
+
+    filter_by_id() stores a LazySelection instead of filtering every table at once.
+    The selection is resolved the first time the table is accessed, and the
+    result is shared by all TableStores holding the same LazySelection.
+    The source table must not be modified in place.
+
+    Parameters
+    ----------
+    table: DataFrame or RaggedInfo
+        The source table, which has the SV ids in its 'id' column.
+    ls_ids: list of list-like
+        SV ids to keep. Rows are kept if their id is in every list.
+    """
+    def __init__(self, table, ls_ids):
+        self._table = table
+        self._ls_ids = ls_ids
+        self._resolved = None
+
+    def select(self, arrlike_id):
+        """
+        select(arrlike_id)
+        Return a LazySelection which additionally keeps only arrlike_id.
+        """
+        if self._resolved is not None:
+            return select_by_id(self._resolved, arrlike_id)
+        return LazySelection(self._table, self._ls_ids + [arrlike_id])
+
+    def resolve(self):
+        """
+        resolve()
+        Return the selected rows as the same type as the source table.
+        """
+        if self._resolved is None:
+            self._resolved = _filter_table_by_id(self._table, self._ls_ids)
+            self._table = None
+            self._ls_ids = None
+        return self._resolved
+
+def _filter_table_by_id(table, ls_ids):
+    if isinstance(table, RaggedInfo):
+        for arrlike_id in ls_ids:
+            table = table.filter_by_id(arrlike_id)
+        return table
+    arr_id = table['id']
+    mask = np.ones(table.shape[0], dtype=bool)
+    for arrlike_id in ls_ids:
+        mask &= arr_id.isin(arrlike_id).values
+    index = table.index
+    if mask.all() and isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+        # nothing is removed; the table is shared instead of copied.
+        return table
+    return table.loc[mask].reset_index(drop=True)
+
+def select_by_id(table, arrlike_id):
+    """
+    select_by_id(table, arrlike_id)
+    Return a LazySelection of the rows of table whose SV id is in arrlike_id.
+    table can be a DataFrame, a RaggedInfo or a LazySelection.
+    """
+    if is_list_like(arrlike_id) and not isinstance(arrlike_id, (np.ndarray, pd.Index)):
+        # take a snapshot, since the selection is resolved later.
+        arrlike_id = list(arrlike_id)
+    elif isinstance(arrlike_id, np.ndarray):
+        arrlike_id = arrlike_id.copy()
+    if isinstance(table, LazySelection):
+        return table.select(arrlike_id)
+    return LazySelection(table, [arrlike_id])
+
+def _resolve(table):
+    if isinstance(table, LazySelection):
+        return table.resolve()
+    return table
+
+def _materialize(table):
+    table = _resolve(table)
+    if isinstance(table, RaggedInfo):
+        return table.to_long()
+    return table
+
+def raw_values(odict):
+    """
+    raw_values(odict)
+    Return the values of an OrderedDict of tables without materialization.
+    LazySelections are returned unresolved.
+    """
+    if isinstance(odict, TableStore):
+        return [v for k, v in odict.stored_items()]
+    return list(odict.values())
+
+class TableStore(OrderedDict):
+    """
+    OrderedDict of tables used as the internal storage of the Bedpe/Vcf classes.
+
+    Tables can be stored in a compact representation (e.g. RaggedInfo).
+    Item access always returns the table as a pandas DataFrame so that code
+    expecting DataFrames keeps working, whereas get_raw() returns the stored
+    object as is.
+
+    Tables can also be stored as a LazySelection, which is resolved and
+    replaced by its result when the table is accessed.
+    Stored tables are shared between TableStores and must not be modified in place;
+    replace them instead.
+    """
+    def __init__(self, *args, **kwargs):
+        if len(args) == 1 and isinstance(args[0], TableStore):
+            super().__init__(args[0].stored_items(), **kwargs)
+        else:
+            super().__init__(*args, **kwargs)
+
+    def _get_resolved(self, key):
+        table = OrderedDict.__getitem__(self, key)
+        if isinstance(table, LazySelection):
+            table = table.resolve()
+            OrderedDict.__setitem__(self, key, table)
+        return table
+
+    def __getitem__(self, key):
+        return _materialize(self._get_resolved(key))
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def get_raw(self, key, default=None):
+        """
+        get_raw(key, default=None)
+        Return the stored object without materialization.
+        """
+        if key in self:
+            return self._get_resolved(key)
+        return default
+
+    def get_stored(self, key):
+        """
+        get_stored(key)
+        Return the stored object, which may be an unresolved LazySelection.
+        """
+        return OrderedDict.__getitem__(self, key)
+
+    def raw_items(self):
+        """
+        raw_items()
+        Iterate over (key, stored object) pairs without materialization.
+        """
+        for key in list(self.keys()):
+            yield key, self._get_resolved(key)
+
+    def stored_items(self):
+        """
+        stored_items()
+        Return (key, stored object) pairs without resolving LazySelections.
+        """
+        return list(OrderedDict.items(self))
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def pop(self, key, *args):
+        if key in self:
+            return _materialize(OrderedDict.pop(self, key))
+        return OrderedDict.pop(self, key, *args)
+
+    def pop_raw(self, key):
+        """
+        pop_raw(key)
+        Remove the key and return the stored object without materialization.
+        """
+        return _resolve(OrderedDict.pop(self, key))
+
+    def copy(self):
+        return TableStore(self.stored_items())
@@ -15,6 +15,14 @@ from viola.core.fasta import (
     Fasta,
 )
 
+from viola.core.ragged import (
+    RaggedInfo,
+)
+
+from viola.core.lazy import (
+    LazyPlan,
+)
+
 from viola.core.indexing import (
     Indexer,
     RootIndexer,
@@ -28,5 +36,6 @@ from viola.core.merge import (
 )
 
 from viola.core.concat import (
+    CohortBuilder,
     concat,
-)
\ No newline at end of file
+)
@@ -3,7 +3,8 @@ import numpy as np
 import pandas as pd
 import re
 import pkgutil
-from functools import reduce
+import weakref
+from functools import partial, reduce
 from typing import (
     List,
     Set,
@@ -14,6 +15,10 @@ import viola
 from viola.core.indexing import Indexer
 from viola.core.bed import Bed
 from viola.core.fasta import Fasta
+from viola.core.ragged import RaggedInfo
+from viola.core.position_index import PositionIndex
+from viola.core.lazy import LazyPlan
+from viola.core._table_store import TableStore, raw_values, select_by_id
 from viola.utils.microhomology import get_microhomology_from_positions
 from viola.utils.utils import get_inslen_and_insseq_from_alt
 from viola._typing import (
@@ -27,9 +32,83 @@ from viola._exceptions import (
     SVIDNotFoundError,
     DestructiveTableValueError,
     TableValueConfliction,
+    IllegalArgumentError,
 )
 
-from sklearn.cluster import AgglomerativeClustering
+
+def _get_dataframe_repr_params():
+    """
+    Return the keyword arguments of DataFrame.to_string() used by DataFrame.__repr__.
+    """
+    try:
+        from pandas.io.formats.format import get_dataframe_repr_params
+        return get_dataframe_repr_params()
+    except ImportError:
+        return {
+            'max_rows': pd.get_option('display.max_rows'),
+            'min_rows': pd.get_option('display.min_rows'),
+            'max_cols': pd.get_option('display.max_columns'),
+            'max_colwidth': pd.get_option('display.max_colwidth'),
+            'show_dimensions': pd.get_option('display.show_dimensions'),
+            'line_width': pd.get_option('display.width'),
+        }
+
+def _build_info_wide(tablename, table):
+    """
+    Convert an INFO table (a long-form DataFrame or a RaggedInfo) into
+    (wide DataFrame indexed by SV id, dtype of the INFO values).
+    """
+    if isinstance(table, RaggedInfo):
+        ragged = table
+    else:
+        try:
+            ragged = RaggedInfo.from_long(table, name=tablename)
+        except ValueError:
+            df_long = table.copy()
+            df_long['new_column_names'] = tablename + '_' + df_long['value_idx'].astype(str)
+            df_wide = df_long.pivot(index='id', columns='new_column_names', values=tablename)
+            df_wide.columns.name = None
+            return df_wide, df_long[tablename].dtype
+    df_wide = ragged.to_wide()
+    df_wide.columns = [tablename + '_' + str(i) for i in df_wide.columns]
+    # keep the same column order as DataFrame.pivot (lexicographic).
+    df_wide = df_wide[sorted(df_wide.columns)]
+    return df_wide, ragged.dtype
+
+def _join_info_wide(df, df_wide, left_on, keep_index):
+    """
+    Left-join a wide INFO table on its index, as
+    pd.merge(df, df_wide, how='left', left_on=left_on, right_index=True) does.
+    The cached wide table keeps the hash table of its index,
+    so the SV ids of the INFO are not factorized again at every join.
+    If keep_index is False, the result has a new RangeIndex
+    like pd.merge(df, df_wide, how='left', left_on=left_on, right_on='id').
+    """
+    if df.empty or df.columns.isin(df_wide.columns).any():
+        if keep_index:
+            return pd.merge(df, df_wide, how='left', left_on=left_on, right_index=True)
+        return pd.merge(df, df_wide, how='left', left_on=left_on, right_on='id')
+    df_joined = df_wide.reindex(df[left_on].values)
+    df_joined.index = df.index
+    df = pd.concat([df, df_joined], axis=1)
+    if not keep_index:
+        df.reset_index(drop=True, inplace=True)
+    return df
+
+def _lookup_info_wide(df_wide, info_dtype, tablename, arr_id, arr_value_idx):
+    """
+    Return the values of a wide INFO table at (arr_id, arr_value_idx),
+    or None if some of them are missing.
+    """
+    if (df_wide.dtypes != info_dtype).any() or df_wide.isna().values.any():
+        return None
+    arr_row = df_wide.index.get_indexer(arr_id)
+    dict_col = {c: i for i, c in enumerate(df_wide.columns)}
+    arr_unique_idx, arr_inverse = np.unique(arr_value_idx, return_inverse=True)
+    arr_col = np.array([dict_col.get(tablename + '_' + str(v), -1) for v in arr_unique_idx], dtype=int)[arr_inverse]
+    if (arr_row < 0).any() or (arr_col < 0).any():
+        return None
+    return df_wide.values[arr_row, arr_col]
 
 class Bedpe(Indexer):
     """
@@ -98,17 +177,19 @@ class Bedpe(Indexer):
         "svtype",
     ]
     _repr_column_names_set = set(_repr_column_names)
+    _view_doc_name = 'Bedpe'
+    _view_doc_link = 'https://dermasugita.github.io/ViolaDocs/docs/html/reference/bedpe.html'
 
     def __init__(self, df_svpos: pd.DataFrame, odict_df_info: 'OrderedDict[str, pd.DataFrame]', patient_name=None):
         if not isinstance(odict_df_info, OrderedDict):
             raise TypeError('the type of the argument "odict_df_info" should be collections.OrderedDict')
         self._df_svpos = df_svpos
-        self._odict_df_info = odict_df_info
+        self._odict_df_info = TableStore(odict_df_info)
         self._ls_infokeys = [x.lower() for x in odict_df_info.keys()]
         self._patient_name = patient_name
         ls_keys = ['positions'] + self._ls_infokeys
-        ls_values = [df_svpos] + list(odict_df_info.values())
-        self._odict_alltables = OrderedDict([(k, v) for k, v in zip(ls_keys, ls_values)])
+        ls_values = [df_svpos] + raw_values(odict_df_info)
+        self._odict_alltables = TableStore([(k, v) for k, v in zip(ls_keys, ls_values)])
         self._repr_config = {
             'info': None,
         }
@@ -162,10 +243,12 @@ class Bedpe(Indexer):
     def copy(self):
         """
         copy()
-        Return copy of the instance
+        Return copy of the instance.
+        The tables are shared with the instance instead of being copied,
+        since they are never modified in place.
         """
-        df_svpos = self.get_table('positions')
-        odict_df_infos = OrderedDict([(k, self.get_table(k.lower())) for k, v in self._odict_df_info.items()])
+        df_svpos = self._odict_alltables.get_raw('positions')
+        odict_df_infos = OrderedDict([(k, self._odict_alltables.get_stored(k.lower())) for k in self._odict_df_info.keys()])
         patient_name = self.patient_name
         return Bedpe(df_svpos, odict_df_infos, patient_name)
 
@@ -190,6 +273,7 @@ class Bedpe(Indexer):
         self._ls_infokeys += [table_name]
         self._odict_alltables[table_name] = df
         self._odict_df_info[table_name] = df
+        self._invalidate_cache(table_name)
 
     def remove_info_table(self, table_name: str):
         """
@@ -204,6 +288,7 @@ class Bedpe(Indexer):
         del self._odict_df_info[table_name]
         del self._odict_alltables[table_name]
         self._ls_infokeys.remove(table_name)
+        self._invalidate_cache(table_name)
     
     def set_value_for_info_by_id(self, table_name, sv_id, value_idx=0, value=None):
         """
@@ -290,9 +375,16 @@ class Bedpe(Indexer):
         if value in self.table_list:
             raise TableValueConfliction('The table "' + value + '" already exists.')
         ## /Input value validation
-        self._odict_alltables[value] = self._odict_alltables.pop(table_name)
+        table = self._odict_alltables.pop_raw(table_name)
+        if isinstance(table, RaggedInfo):
+            table = table.rename(value)
+        else:
+            # the table may be shared with other objects.
+            table = table.set_axis(['id', 'value_idx', value], axis=1)
+        self._odict_alltables[value] = table
         self._ls_infokeys = [value if i == table_name else i for i in self._ls_infokeys]
-        self._odict_alltables[value].columns = ['id', 'value_idx', value]
+        self._invalidate_cache(table_name)
+        self._invalidate_cache(value)
 
     def change_repr_config(self, key, value):
         self._repr_config[key] = value
@@ -301,10 +393,13 @@ class Bedpe(Indexer):
         config_info = self._repr_config['info']
         return self.view(custom_infonames=config_info)
 
-    def view(self, custom_infonames=None, return_as_dataframe=False):
+    def view(self, custom_infonames=None, return_as_dataframe=False, rows=None):
         """
-        view(custom_infonames, return_as_dataframe)
-        Quick view function of the Vcf object.
+        view(custom_infonames, return_as_dataframe, rows)
+        Quick view function of the Bedpe object.
+
+        Only the rows that pandas displays are formatted, so that the view
+        of a large object returns immediately.
 
         Parameters
         -----------
@@ -312,8 +407,51 @@ class Bedpe(Indexer):
             The names of the INFO to show additionally.
         return_as_dataframe: bool, default False
             If true, return as pandas DataFrame.
+        rows: int, slice, array_like or None, default None
+            Row positions to show. An int n means the first n rows.
+            If None, all the rows are shown (truncated in the manner of pandas).
         """
-        df_svpos = self.get_table('positions')
+        if isinstance(rows, (int, np.integer)):
+            rows = slice(0, rows)
+        if rows is not None:
+            rows = np.arange(self._odict_alltables.get_raw('positions').shape[0])[rows]
+        if return_as_dataframe:
+            return self._view_frame(custom_infonames, rows)
+        if rows is None:
+            str_df_out = self._view_frame_repr(custom_infonames)
+        else:
+            str_df_out = str(self._view_frame(custom_infonames, rows))
+        str_infokeys = ','.join(list(self._ls_infokeys))
+        desc_info = 'INFO='
+        desc_doc = 'Documentation of {} object ==> '.format(self._view_doc_name)
+        doc_link = self._view_doc_link
+        out = desc_info + str_infokeys + '\n' + desc_doc + doc_link + '\n' + str_df_out
+        return str(out)
+
+    def head(self, n: int = 5, custom_infonames=None) -> pd.DataFrame:
+        """
+        head(n=5, custom_infonames=None)
+        Return the view of the first n SV records as a DataFrame.
+        """
+        return self.view(custom_infonames=custom_infonames, return_as_dataframe=True, rows=slice(0, n))
+
+    def tail(self, n: int = 5, custom_infonames=None) -> pd.DataFrame:
+        """
+        tail(n=5, custom_infonames=None)
+        Return the view of the last n SV records as a DataFrame.
+        """
+        n_rows = self._odict_alltables.get_raw('positions').shape[0]
+        return self.view(custom_infonames=custom_infonames, return_as_dataframe=True, rows=slice(max(n_rows - n, 0), n_rows))
+
+    def _view_frame(self, custom_infonames=None, rows=None) -> pd.DataFrame:
+        """
+        _view_frame(custom_infonames=None, rows=None)
+        Return the DataFrame of view(). If rows (an array of row positions) is given,
+        only those rows are built, with the same index and dtypes as in the whole DataFrame.
+        """
+        df_svpos = self._odict_alltables['positions']
+        if rows is not None:
+            df_svpos = df_svpos.iloc[rows]
         ser_id = df_svpos['id']
         ser_be1 = df_svpos['chrom1'].astype(str) + ':' + df_svpos['pos1'].astype(str)
         ser_be2 = df_svpos['chrom2'].astype(str) + ':' + df_svpos['pos2'].astype(str)
@@ -324,17 +462,50 @@ class Bedpe(Indexer):
         ls_key = ['id', 'be1', 'be2', 'strand', 'qual', 'svtype']
         dict_ = {k: v for k, v in zip(ls_key, ls_ser)}
         df_out = pd.DataFrame(dict_)
-        if custom_infonames is not None:
-            df_out = self.append_infos(df_out, ls_tablenames=custom_infonames)
-        str_df_out = str(df_out)
-        str_infokeys = ','.join(list(self._ls_infokeys))
-        desc_info = 'INFO='
-        desc_doc = 'Documentation of Bedpe object ==> '
-        doc_link = 'https://dermasugita.github.io/ViolaDocs/docs/html/reference/bedpe.html'
-        out = desc_info + str_infokeys + '\n' + desc_doc + doc_link + '\n' + str_df_out
-        if return_as_dataframe:
+        if custom_infonames is None:
             return df_out
-        return str(out)
+        if rows is None:
+            return self.append_infos(df_out, ls_tablenames=custom_infonames)
+        # Missing INFO values change the dtypes of the merged columns (e.g. int
+        # to float). A row lacking each INFO is merged together and dropped
+        # afterwards, so that the dtypes are the same as in the whole DataFrame.
+        arr_all_ids = self._odict_alltables['positions']['id'].values
+        ls_extra_rows = []
+        for tablename in custom_infonames:
+            df_wide, _ = self._get_info_wide(tablename)
+            arr_missing = np.flatnonzero(~pd.Index(arr_all_ids).isin(df_wide.index))
+            if arr_missing.shape[0] > 0:
+                ls_extra_rows.append(arr_missing[0])
+        if ls_extra_rows:
+            df_out = pd.concat([df_out, self._view_frame(None, np.array(ls_extra_rows))])
+        df_out = self.append_infos(df_out, ls_tablenames=custom_infonames)
+        # the whole DataFrame has a RangeIndex after merging
+        df_out.index = np.concatenate([rows, ls_extra_rows]).astype(np.int64)
+        return df_out.iloc[:len(rows)]
+
+    def _view_frame_repr(self, custom_infonames=None) -> str:
+        """
+        _view_frame_repr(custom_infonames=None)
+        Return str() of the DataFrame of view(), building only the rows to display.
+        """
+        params = _get_dataframe_repr_params()
+        max_rows = params['max_rows']
+        min_rows = params['min_rows']
+        n_rows = self._odict_alltables.get_raw('positions').shape[0]
+        if not max_rows or n_rows <= max_rows:
+            return str(self._view_frame(custom_infonames))
+        n_rows_fitted = min(min_rows, max_rows) if min_rows else max_rows
+        n_half = n_rows_fitted // 2
+        if n_half < 1:
+            return str(self._view_frame(custom_infonames))
+        # head, a dummy row (hidden by the truncation) and tail
+        rows = np.concatenate([np.arange(n_half), [n_half - 1], np.arange(n_rows - n_half, n_rows)])
+        df_out = self._view_frame(custom_infonames, rows)
+        params.update(max_rows=2 * n_half, min_rows=2 * n_half, show_dimensions=False)
+        str_df_out = df_out.to_string(**params)
+        if _get_dataframe_repr_params()['show_dimensions']:
+            str_df_out += '\n\n[{} rows x {} columns]'.format(n_rows, df_out.shape[1])
+        return str_df_out
     
     def __getattr__(self, value):
         if value in self._internal_attrs_set:
@@ -371,7 +542,9 @@ class Bedpe(Indexer):
         """
         if table_name not in self.table_list:
             raise TableNotFoundError(table_name)
-        table = self._odict_alltables[table_name]
+        table = self._odict_alltables.get_raw(table_name)
+        if isinstance(table, RaggedInfo):
+            return table.to_long()
         return table.copy()
     
     def replace_table(self, table_name: str, table: pd.DataFrame):
@@ -389,6 +562,54 @@ class Bedpe(Indexer):
         if table_name not in self.table_list:
             raise TableNotFoundError(table_name)
         self._odict_alltables[table_name] = table
+        self._invalidate_cache(table_name)
+
+    def _get_cached(self, key, table_name, builder):
+        """
+        _get_cached(key, table_name, builder)
+        Return a value derived from a table, building it with builder(table) at the first call.
+        builder receives the table as stored, i.e. a DataFrame or a RaggedInfo.
+        The cached value is discarded when the table is replaced by another object.
+        Methods that modify a table in place should call _invalidate_cache().
+        """
+        cache = self.__dict__.setdefault('_cache', {})
+        source = self._odict_alltables.get_raw(table_name)
+        entry = cache.get(key)
+        if entry is not None and entry[1]() is source:
+            return entry[2]
+        value = builder(source)
+        cache[key] = (table_name, weakref.ref(source), value)
+        return value
+
+    def _invalidate_cache(self, table_name=None):
+        """
+        _invalidate_cache(table_name=None)
+        Discard the cached values derived from table_name, or all of them if table_name is None.
+        """
+        if table_name is None:
+            self.__dict__.pop('_cache', None)
+            return
+        cache = self.__dict__.get('_cache')
+        if not cache:
+            return
+        for key in [k for k, entry in cache.items() if entry[0] == table_name]:
+            del cache[key]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_cache', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def _get_position_index(self) -> PositionIndex:
+        """
+        _get_position_index()
+        Return the PositionIndex of the positions table.
+        The index is built lazily and reused until the positions table is modified.
+        """
+        return self._get_cached('position_index', 'positions', PositionIndex)
 
 
     def get_ids(self) -> Set[IntOrStr]:
@@ -494,17 +715,79 @@ class Bedpe(Indexer):
         """
         df = base_df.copy()
         for tablename in ls_tablenames:
-            df_to_append_pre = self.get_table(tablename)
-            df_to_append_pre['new_column_names'] = tablename + '_' + df_to_append_pre['value_idx'].astype(str)
-            df_to_append = df_to_append_pre.pivot(index='id', columns='new_column_names', values=tablename)
-            df = pd.merge(df, df_to_append, how='left', left_on=left_on, right_on='id')
+            df_to_append, info_dtype = self._get_info_wide(tablename)
+            df = _join_info_wide(df, df_to_append, left_on, keep_index=False)
             if left_on != 'id':
                 df.drop('id', axis=1, inplace=True) 
-            if pd.api.types.is_bool_dtype(df_to_append_pre.iloc[:, 2]):
-                column_names = np.unique(df_to_append_pre['new_column_names'])
+            if pd.api.types.is_bool_dtype(info_dtype):
+                column_names = df_to_append.columns
                 df[column_names] = df[column_names].fillna(False)
         return df
 
+    def _get_info_ragged(self, tablename: str) -> RaggedInfo:
+        """
+        _get_info_ragged(tablename)
+        Return an INFO table as a RaggedInfo.
+        A RaggedInfo is built from the long table if the INFO is not compacted.
+
+        Raises
+        ----------
+        ValueError
+            If the INFO table cannot be represented by RaggedInfo.
+        """
+        if tablename not in self.table_list:
+            raise TableNotFoundError(tablename)
+        table = self._odict_alltables.get_raw(tablename)
+        if isinstance(table, RaggedInfo):
+            return table
+        return RaggedInfo.from_long(table, name=tablename)
+
+    def _get_info_wide(self, tablename: str):
+        """
+        _get_info_wide(tablename)
+        Return an INFO table in the wide form with the columns named
+        "tablename_valueidx" and the dtype of the INFO values.
+        The wide table is cached until the INFO table is replaced,
+        so the returned DataFrame must not be modified.
+        """
+        if tablename not in self.table_list:
+            raise TableNotFoundError(tablename)
+        return self._get_cached(('info_wide', tablename), tablename, partial(_build_info_wide, tablename))
+
+    def compact_infos(self, ls_tablenames: Iterable[str] = None):
+        """
+        compact_infos(ls_tablenames=None)
+        Store INFO tables as RaggedInfo (a per-id offsets array plus a flat
+        values array) instead of long-form DataFrames.
+        This reduces memory of multi-valued INFO such as CIPOS and CIEND,
+        and append_infos() no longer needs to pivot them.
+        get_table() still returns the long-form DataFrame.
+
+        Parameters
+        ------------
+        ls_tablenames: list-like or None, default None
+            The names of INFO tables to compact. If None, all INFO tables are compacted.
+            INFO tables whose 'value_idx' is not contiguous are left as they are.
+        """
+        if ls_tablenames is None:
+            ls_tablenames = self._ls_infokeys
+        for tablename in ls_tablenames:
+            if tablename not in self._ls_infokeys:
+                raise InfoNotFoundError(tablename)
+            try:
+                ragged = self._get_info_ragged(tablename)
+            except ValueError:
+                continue
+            self._set_info_table_object(tablename, ragged)
+
+    def _set_info_table_object(self, tablename, table):
+        self._odict_alltables[tablename] = table
+        self._invalidate_cache(tablename)
+        for key in self._odict_df_info.keys():
+            if key.lower() == tablename:
+                self._odict_df_info[key] = table
+                break
+
     def _parse_filter_query(self, q):
         # sq: split query
         sq = q.split(' ')
@@ -694,6 +977,70 @@ class Bedpe(Indexer):
         return out
 
 
+    def lazy(self) -> LazyPlan:
+        """
+        lazy()
+        Return a LazyPlan that records filter(), filter_by_id(), breakend2breakpoint(),
+        classify_manual_svtype() and so on, and runs them at once on collect().
+        Consecutive filters are fused and the records are selected only once.
+
+        Returns
+        ----------
+        LazyPlan
+
+        Examples
+        ----------
+        >>> plan = vcf.lazy().filter('svlen > 100').breakend2breakpoint().filter('svtype == DEL')
+        >>> result = plan.collect()
+        """
+        return LazyPlan(self)
+
+    def query_region(self, chrom: str, start: int = None, end: int = None, breakend: str = 'any'):
+        """
+        query_region(chrom, start=None, end=None, breakend='any')
+        Return SV records whose breakends are located in the specified region.
+        The region is interpreted in the same way as the locus queries of filter(),
+        that is, 'be1 chr1:100-200' is equivalent to query_region('chr1', 100, 200, breakend='be1').
+
+        Parameters
+        ----------
+        chrom: str
+            The chromosome name of the region.
+        start: int or None, default None
+            1-based start coordinate of the region (inclusive). If None, the region starts from the beginning of the chromosome.
+        end: int or None, default None
+            1-based end coordinate of the region (exclusive). If None, the region extends to the end of the chromosome.
+        breakend: {'any', 'both', 'be1', 'be2'}, default 'any'
+            * ``'any'``: SV records with at least one breakend in the region.
+            * ``'both'``: SV records with both breakends in the region.
+            * ``'be1'``: SV records with the first breakend in the region.
+            * ``'be2'``: SV records with the second breakend in the region.
+
+        Returns
+        ----------
+        Bedpe or Vcf
+            An object of the same class that includes SV records in the region.
+
+        Notes
+        ----------
+        The lookup uses a per-chromosome sorted index on pos1 and pos2, which is
+        built at the first query and reused until the positions table is modified.
+        """
+        if breakend not in ('any', 'both', 'be1', 'be2'):
+            raise IllegalArgumentError(breakend)
+        position_index = self._get_position_index()
+        set_be1 = set(position_index.query(1, chrom, start, end))
+        set_be2 = set(position_index.query(2, chrom, start, end))
+        if breakend == 'any':
+            set_result = set_be1 | set_be2
+        elif breakend == 'both':
+            set_result = set_be1 & set_be2
+        elif breakend == 'be1':
+            set_result = set_be1
+        else:
+            set_result = set_be2
+        return self.filter_by_id(set_result)
+
     def _filter_by_id(self, tablename, arrlike_id):
         """
         _filter_by_id(tablename, arrlike_id)
@@ -711,15 +1058,27 @@ class Bedpe(Indexer):
         --------
         A filtered DataFrame.
         """
+        table = self._odict_alltables.get_raw(tablename.lower())
+        if isinstance(table, RaggedInfo):
+            return table.filter_by_id(arrlike_id)
         df = self.get_table(tablename.lower())
         return df.loc[df['id'].isin(arrlike_id)].reset_index(drop=True)
 
+    def _select_by_id(self, tablename, arrlike_id):
+        """
+        _select_by_id(tablename, arrlike_id)
+        Lazy version of _filter_by_id().
+        Return a LazySelection, which is filtered when the table is accessed.
+        """
+        return select_by_id(self._odict_alltables.get_stored(tablename.lower()), arrlike_id)
+
 
     def filter_by_id(self, arrlike_id):
         """
         filter_by_id(arrlike_id)
         Filter Bedpe object according to the list of SV ids.
-        Return object is also an instance of the Bedpe object
+        Return object is also an instance of the Bedpe object.
+        INFO tables are filtered when they are accessed for the first time.
 
         Parameters
         ---------------
@@ -733,7 +1092,7 @@ class Bedpe(Indexer):
             All records associated with SV ids that are not in the arrlike_id will be discarded.
         """
         out_svpos = self._filter_by_id('positions', arrlike_id)
-        out_odict_df_info = OrderedDict([(k, self._filter_by_id(k, arrlike_id)) for k in self._ls_infokeys])
+        out_odict_df_info = OrderedDict([(k, self._select_by_id(k, arrlike_id)) for k in self._ls_infokeys])
         return Bedpe(out_svpos, out_odict_df_info, self.patient_name)
 
     def _filter_pos_table(self, item, operator, threshold):
@@ -861,20 +1220,47 @@ class Bedpe(Indexer):
         """
         ls_matched = re.findall(r'\${[^}]*}', operation)
         ls_infonames = [s[2:-1] for s in ls_matched]
-        ls_df_info = []
         operation_replaced = operation
         for idx, infoname in enumerate(ls_infonames):
             # check the info names are valid
             if infoname not in self.table_list:
                 raise TableNotFoundError(infoname)
-            ls_df_info.append(self.get_table(infoname))
             operation_replaced = operation_replaced.replace(ls_matched[idx], 'df_merged["'+infoname+'"]')
-        df_merged = reduce(lambda left, right: pd.merge(left, right, on=['id', 'value_idx']), ls_df_info)
+        df_merged = self._merge_info_tables(list(OrderedDict.fromkeys(ls_infonames)))
         ser_result = eval(operation_replaced)
         df_merged[name] = ser_result
         df_to_add = df_merged[['id', 'value_idx', name]]
         self.add_info_table(name, df_to_add)
         
+    def _merge_info_tables(self, ls_infonames):
+        """
+        _merge_info_tables(ls_infonames)
+        Return the long-form INFO tables inner-joined on 'id' and 'value_idx'.
+        If every (id, value_idx) of the first INFO appears once and is present in the others,
+        their values are looked up in the cached wide tables instead of merging.
+        """
+        df_merged = self.get_table(ls_infonames[0])
+        if len(ls_infonames) == 1:
+            return df_merged
+        # pd.merge groups the rows of duplicated keys, so the lookup cannot reproduce its order.
+        if not df_merged.duplicated(['id', 'value_idx']).any():
+            arr_id = df_merged['id'].values
+            arr_value_idx = df_merged['value_idx'].values
+            for infoname in ls_infonames[1:]:
+                try:
+                    df_wide, info_dtype = self._get_info_wide(infoname)
+                except ValueError:
+                    # duplicated (id, value_idx) pairs cannot be made wide
+                    break
+                arr_values = _lookup_info_wide(df_wide, info_dtype, infoname, arr_id, arr_value_idx)
+                if arr_values is None:
+                    break
+                df_merged[infoname] = arr_values
+            else:
+                return df_merged.reset_index(drop=True)
+        ls_df_info = [self.get_table(infoname) for infoname in ls_infonames]
+        return reduce(lambda left, right: pd.merge(left, right, on=['id', 'value_idx']), ls_df_info)
+
     def classify_manual_svtype(self, definitions=None, ls_conditions=None, ls_names=None, ls_order=None, return_series=True):
         """
         classify_manual_svtype(definitions, ls_conditions, ls_names, ls_order=None)
@@ -1014,17 +1400,8 @@ class Bedpe(Indexer):
         set
             A set of ids which satisfies the argument
         """
-        positions_df = self.get_table("positions")
-        positions_df = positions_df[positions_df["chrom{}".format(position_num)]==chrom]
-        pos1or2 = "pos{}".format(position_num)
-        if (pos_min is not None) and (pos_sup is not None):
-            positions_df = positions_df[(pos_min <= positions_df[pos1or2])
-            & (positions_df[pos1or2] < pos_sup)]
-        elif pos_min is not None:
-            positions_df = positions_df[pos_min <= positions_df[pos1or2]]
-        elif pos_sup is not None:
-            positions_df = positions_df[positions_df[pos1or2] < pos_sup]
-        id_list = positions_df["id"].values
+        position_index = self._get_position_index()
+        id_list = position_index.query(position_num, chrom, pos_min, pos_sup)
         id_set = set(id_list)
         return id_set
     
@@ -1047,19 +1424,10 @@ class Bedpe(Indexer):
         set
             A set of ids except which satisfies the argument
         """
-        positions_df = self.get_table("positions")
-        whole_id = positions_df["id"].values
+        position_index = self._get_position_index()
+        whole_id = position_index.ids
         whole_id_set = set(whole_id)
-        ex_positions_df = positions_df[positions_df["chrom{}".format(ex_position_num)]==ex_chrom]
-        pos1or2 = "pos{}".format(ex_position_num)
-        if (ex_pos_min is not None) and (ex_pos_max is not None):
-            ex_positions_df = ex_positions_df[(ex_pos_min <= ex_positions_df[pos1or2])
-            & (ex_positions_df[pos1or2] <= ex_pos_max)]
-        elif ex_pos_min is not None:
-            ex_positions_df = ex_positions_df[ex_pos_min <= ex_positions_df[pos1or2]]
-        elif ex_pos_max is not None:
-            ex_positions_df = ex_positions_df[ex_positions_df[pos1or2] <= ex_pos_max]
-        ex_id = ex_positions_df["id"].values
+        ex_id = position_index.query(ex_position_num, ex_chrom, ex_pos_min, ex_pos_max, closed=True)
         ex_id_set = set(ex_id)
         id_set = whole_id_set - ex_id_set
         return id_set
@@ -1174,6 +1542,8 @@ class Bedpe(Indexer):
 
         multibedpe = viola.MultiBedpe(ls_bedpe, ls_caller_names)
         distance_matrix = self._generate_distance_matrix_by_distance(multibedpe, penalty_length=3e9, str_missing=str_missing)
+        # scikit-learn is imported here to keep "import viola" fast.
+        from sklearn.cluster import AgglomerativeClustering
         hcl_clustering_model = AgglomerativeClustering(n_clusters=None, affinity="precomputed", linkage=linkage, distance_threshold=threshold)
         labels = hcl_clustering_model.fit_predict(X = distance_matrix)
         
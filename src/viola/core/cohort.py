@@ -1,13 +1,358 @@
+import numpy as np
 import pandas as pd
 import sys, os
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import viola
+from viola.core._table_store import TableStore, raw_values
+from viola.core.bed import Bed
 from viola.core.bedpe import Bedpe
 from viola.core.vcf import Vcf
+from viola.utils.utils import _check_n_jobs
 from typing import (
     List,
     Optional,
+    Union,
 )
 
+def _regions_to_data_frame(regions) -> pd.DataFrame:
+    if isinstance(regions, str):
+        regions = viola.read_bed(regions)
+    if isinstance(regions, Bed):
+        regions = regions._df
+    if not isinstance(regions, pd.DataFrame):
+        raise TypeError('"regions" should be a path to a BED file, Bed object or DataFrame.')
+    for column in ['chrom', 'chromStart', 'chromEnd']:
+        if column not in regions.columns:
+            raise KeyError('"regions" should have the "{}" column.'.format(column))
+    return regions
+
+def _query_regions(obj, regions, flank=0) -> pd.DataFrame:
+    """
+    Shared implementation of MultiBedpe.query_regions and MultiVcf.query_regions.
+    """
+    df_regions = _regions_to_data_frame(regions)
+    position_index = obj._get_position_index()
+
+    # patient name of each row of the positions table
+    arr_global_id = position_index.ids
+    df_global_id = obj._odict_alltables['global_id']
+    df_patients = obj._odict_alltables['patients']
+    arr_row_patient_id = df_global_id['patient_id'].values[pd.Index(df_global_id['global_id']).get_indexer(arr_global_id)]
+    arr_row_patients = df_patients['patients'].values[pd.Index(df_patients['id']).get_indexer(arr_row_patient_id)]
+
+    if 'name' in df_regions.columns:
+        arr_region = df_regions['name'].values
+    else:
+        arr_region = df_regions.index.values
+    arr_chrom = df_regions['chrom'].values
+    # BED regions are 0-based half-open, whereas breakend positions are 1-based.
+    arr_start = df_regions['chromStart'].values + 1 - flank
+    arr_end = df_regions['chromEnd'].values + 1 + flank
+
+    ls_region_idx = []
+    ls_rows = []
+    ls_position_num = []
+    for chrom in pd.unique(arr_chrom):
+        arr_region_idx_chrom = np.flatnonzero(arr_chrom == chrom)
+        for position_num in (1, 2):
+            arr_hit_range, arr_hit_rows = position_index.query_many_rows(
+                position_num, chrom, arr_start[arr_region_idx_chrom], arr_end[arr_region_idx_chrom])
+            ls_region_idx.append(arr_region_idx_chrom[arr_hit_range])
+            ls_rows.append(arr_hit_rows)
+            ls_position_num.append(np.full(arr_hit_rows.shape[0], position_num))
+    if len(ls_rows) == 0:
+        arr_region_idx = arr_rows = arr_position_num = np.array([], dtype=np.int64)
+    else:
+        arr_region_idx = np.concatenate(ls_region_idx)
+        arr_rows = np.concatenate(ls_rows)
+        arr_position_num = np.concatenate(ls_position_num)
+    order = np.lexsort((np.arange(arr_rows.shape[0]), arr_position_num, arr_region_idx))
+    arr_region_idx = arr_region_idx[order]
+    arr_rows = arr_rows[order]
+    arr_position_num = arr_position_num[order]
+    df_out = pd.DataFrame({
+        'region': arr_region[arr_region_idx],
+        'global_id': arr_global_id[arr_rows],
+        'patients': arr_row_patients[arr_rows],
+        'breakend': np.where(arr_position_num == 1, 'be1', 'be2'),
+    })
+    return df_out
+
+
+def _read_definitions(definitions) -> List[str]:
+    """
+    Return the lines of a definition file of classify_manual_svtype().
+    """
+    if isinstance(definitions, str):
+        if definitions in ('default', 'article'):
+            d = os.path.dirname(sys.modules["viola"].__file__)
+            definitions = os.path.join(d, "data/sv_class_{}.txt".format(definitions))
+        with open(definitions, 'r') as f:
+            return f.readlines()
+    return list(definitions)
+
+def _classify_records(obj, ls_conditions, ls_names):
+    """
+    Assign each SV record of obj to the first condition it satisfies, or to 'others'.
+    Return the list of ids and the list of the class names.
+    """
+    set_ids_current = set(obj.ids)
+    obj_current = obj
+    ls_ids = []
+    ls_result_names = []
+    for cond, name in zip(ls_conditions, ls_names):
+        obj_current = obj_current.filter_by_id(set_ids_current)
+        if callable(cond):
+            ids = cond(obj_current)
+        else:
+            ids = cond
+        set_ids = set(ids)
+        set_ids_intersection = set_ids_current & set_ids
+        ls_ids += list(set_ids_intersection)
+        ls_result_names += [name for i in range(len(set_ids_intersection))]
+        set_ids_current = set_ids_current - set_ids_intersection
+    ls_ids += list(set_ids_current)
+    ls_result_names += ['others' for i in range(len(set_ids_current))]
+    return ls_ids, ls_result_names
+
+def _classify_partition(args):
+    # Worker of classify_manual_svtype(n_jobs=...). Classify the records of a partition of the patients.
+    obj, ls_definitions, ls_conditions, ls_names = args
+    if ls_definitions is not None:
+        ls_conditions, ls_names = obj._parse_signature_definition_file(ls_definitions)
+    ls_ids, ls_result_names = _classify_records(obj, ls_conditions, ls_names)
+    return ls_ids, ls_result_names, ls_names
+
+def _patient_codes(obj, arrlike_id) -> np.ndarray:
+    """
+    Return the row number in the patients table of the patient of each global id.
+    Ids which are not in the global_id table get the number of patients.
+    """
+    df_global_id = obj._odict_alltables['global_id']
+    df_patients = obj._odict_alltables['patients']
+    arr_gid_code = pd.Index(df_patients['id']).get_indexer(df_global_id['patient_id'])
+    arr_gid_code = np.where(arr_gid_code < 0, len(df_patients), arr_gid_code)
+    arr_idx = pd.Index(df_global_id['global_id']).get_indexer(arrlike_id)
+    return np.where(arr_idx < 0, len(df_patients), arr_gid_code[arr_idx])
+
+def _split_by_codes(seq, arr_code: np.ndarray, n_parts: int) -> list:
+    """
+    Split a DataFrame or an array into n_parts by the codes in [0, n_parts).
+    Rows with the other codes are discarded, and the order of the rows is kept within each part.
+    """
+    arr_order = np.argsort(arr_code, kind='stable')
+    arr_bounds = np.searchsorted(arr_code[arr_order], np.arange(n_parts + 1))
+    if isinstance(seq, pd.DataFrame):
+        return [seq.iloc[arr_order[st:en]].reset_index(drop=True) for st, en in zip(arr_bounds[:-1], arr_bounds[1:])]
+    arr_seq = np.asarray(seq, dtype=object)
+    return [arr_seq[arr_order[st:en]] for st, en in zip(arr_bounds[:-1], arr_bounds[1:])]
+
+def _part_codes(obj, arrlike_id, n_parts: int) -> np.ndarray:
+    # part number of each global id when the patients are split into n_parts runs of consecutive patients.
+    n_patients = len(obj._odict_alltables['patients'])
+    return _patient_codes(obj, arrlike_id) * n_parts // max(n_patients, 1)
+
+def _split_table(obj, table, n_parts: int, key: str = 'id') -> list:
+    return _split_by_codes(table, _part_codes(obj, table[key], n_parts), n_parts)
+
+def _classify_manual_svtype_partitioned(obj, definitions, ls_conditions, ls_names, n_jobs: int):
+    """
+    Shared implementation of classify_manual_svtype(n_jobs=...) of MultiBedpe and MultiVcf.
+    The patients are split into partitions which are classified separately in a process pool.
+    Return the table of the 'manual_sv_type' INFO and the class names.
+    """
+    n_jobs = _check_n_jobs(n_jobs)
+    n_patients = len(obj._odict_alltables['patients'])
+    # consecutive patients are grouped so that each process receives a few large partitions.
+    n_parts = min(n_jobs * 4, n_patients) if n_jobs > 1 else min(1, n_patients)
+    ls_definitions = None
+    if definitions is not None:
+        ls_definitions = _read_definitions(definitions)
+        ls_conditions_split = [None] * n_parts
+    else:
+        # id lists are split in advance so that each process receives only its own ids.
+        ls_ls_cond = [None if callable(cond) else _split_by_codes(cond, _part_codes(obj, cond, n_parts), n_parts) for cond in ls_conditions]
+        ls_conditions_split = [
+            [cond if ls_cond is None else ls_cond[i] for cond, ls_cond in zip(ls_conditions, ls_ls_cond)]
+            for i in range(n_parts)
+        ]
+    ls_args = [(partition, ls_definitions, ls_cond, ls_names) for partition, ls_cond in zip(obj._split_by_patient(n_parts), ls_conditions_split)]
+    if n_jobs > 1 and len(ls_args) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(ls_args))) as executor:
+            ls_results = list(executor.map(_classify_partition, ls_args))
+    else:
+        ls_results = [_classify_partition(args) for args in ls_args]
+
+    ls_ids = []
+    ls_result_names = []
+    for ids, result_names, names in ls_results:
+        ls_ids += ids
+        ls_result_names += result_names
+    if ls_definitions is not None:
+        # the class names parsed by the workers; an empty cohort has no partition,
+        # and its definitions are parsed here, which costs nothing without records.
+        ls_names = ls_results[0][2] if ls_results else obj._parse_signature_definition_file(ls_definitions)[1]
+    ls_zeros = [0 for i in range(len(ls_ids))]
+    df_result = pd.DataFrame({'id': ls_ids, 'value_idx': ls_zeros, 'manual_sv_type': ls_result_names})
+    return df_result, ls_names
+
+def _get_feature_count(obj, feature='manual_sv_type', ls_order=None, exclude_empty_cases=False, sparse=False) -> pd.DataFrame:
+    """
+    Shared implementation of get_feature_count_as_data_frame of MultiBedpe and MultiVcf.
+    The (patient, feature value) pairs are encoded as integers and counted with np.bincount.
+    """
+    df_feature = obj.get_table(feature)
+    df_patients = obj._odict_alltables['patients']
+    n_patients = len(df_patients)
+    arr_patient_code = _patient_codes(obj, df_feature['id'])
+    arr_value = df_feature[feature].values
+    mask = (arr_patient_code < n_patients) & pd.notna(arr_value)
+    arr_patient_code = arr_patient_code[mask]
+    arr_value_code, idx_value = pd.factorize(arr_value[mask], sort=True)
+    n_values = len(idx_value)
+    if exclude_empty_cases:
+        arr_patient_kept = np.unique(arr_patient_code)
+        # the same order as the groups of pivot_table, i.e. sorted by the patient name
+        arr_patient_kept = arr_patient_kept[np.argsort(df_patients['patients'].values[arr_patient_kept], kind='stable')]
+    else:
+        arr_patient_kept = np.arange(n_patients)
+    arr_row = np.full(n_patients + 1, -1)
+    arr_row[arr_patient_kept] = np.arange(len(arr_patient_kept))
+    arr_row_code = arr_row[arr_patient_code]
+
+    idx_rows = pd.Index(df_patients['patients'].values[arr_patient_kept], name='patients')
+    idx_columns = pd.Index(idx_value.tolist(), name=feature)
+    if ls_order is not None:
+        idx_order = pd.Index(ls_order, name=feature)
+        arr_column = idx_order.get_indexer(idx_value)
+        keep = arr_column[arr_value_code] >= 0
+        arr_row_code = arr_row_code[keep]
+        arr_value_code = arr_column[arr_value_code[keep]]
+        idx_columns = idx_order
+        n_values = len(idx_order)
+    if sparse:
+        from scipy import sparse as sp
+        mat = sp.coo_matrix(
+            (np.ones(len(arr_row_code), dtype=np.int64), (arr_row_code, arr_value_code)),
+            shape=(len(idx_rows), n_values)
+        ).tocsr()
+        return pd.DataFrame.sparse.from_spmatrix(mat, index=idx_rows, columns=idx_columns)
+    arr_counts = np.bincount(arr_row_code * n_values + arr_value_code, minlength=len(idx_rows) * n_values)
+    arr_counts = arr_counts.astype(np.int64).reshape(len(idx_rows), n_values)
+    return pd.DataFrame(arr_counts, index=idx_rows, columns=idx_columns)
+
+
+class _GlobalIdMapper(object):
+    """
+    Convert the SV ids of patients into global ids ("<patient name>_<SV id>").
+
+    The global id strings are built once from the positions tables, and the ids of
+    the other tables are looked up by (patient code, SV id) and share these string
+    objects, instead of building new strings for every table.
+
+    Parameters
+    ----------
+    ls_patient_names: list
+        Names of the patients.
+    ls_arr_local_id: List[np.ndarray]
+        SV ids in the positions table of each patient.
+    """
+    def __init__(self, ls_patient_names, ls_arr_local_id):
+        self._arr_prefix = np.array([str(name) + '_' for name in ls_patient_names], dtype=object)
+        self.arr_patient_code = np.repeat(np.arange(len(ls_arr_local_id), dtype=np.int64), [len(arr) for arr in ls_arr_local_id])
+        arr_local_id = _concat_as_object(ls_arr_local_id)
+        self.arr_global_id = self._to_global_id(self.arr_patient_code, arr_local_id)
+        self._index = None
+        if pd.api.types.infer_dtype(arr_local_id, skipna=False) in ('string', 'empty'):
+            index = pd.MultiIndex.from_arrays([self.arr_patient_code, arr_local_id])
+            if index.is_unique:
+                self._index = index
+
+    def _to_global_id(self, arr_code, arr_local_id) -> np.ndarray:
+        ser_prefix = pd.Series(self._arr_prefix[arr_code], dtype=object)
+        return (ser_prefix + pd.Series(arr_local_id, dtype=object).astype(str)).values
+
+    def global_ids(self, arr_code, arr_local_id) -> np.ndarray:
+        """
+        Return the global ids of the (patient code, SV id) pairs.
+        """
+        # Only string ids are looked up, since e.g. 1 == 1.0 although their string forms differ.
+        if self._index is None or len(self.arr_global_id) == 0 or \
+            pd.api.types.infer_dtype(arr_local_id, skipna=False) not in ('string', 'empty'):
+            return self._to_global_id(arr_code, arr_local_id)
+        arr_idx = self._index.get_indexer(pd.MultiIndex.from_arrays([arr_code, arr_local_id]))
+        arr_out = self.arr_global_id[arr_idx]
+        mask = arr_idx < 0
+        if mask.any():
+            arr_out[mask] = self._to_global_id(arr_code[mask], arr_local_id[mask])
+        return arr_out
+
+    def concat(self, ls_code, ls_df, ignore_index=False) -> pd.DataFrame:
+        """
+        Concatenate the tables of the patients given by ls_code,
+        replacing their 'id' column with the global ids.
+        """
+        df = pd.concat(ls_df, ignore_index=ignore_index)
+        arr_code = np.repeat(np.asarray(ls_code, dtype=np.int64), [len(d) for d in ls_df])
+        df['id'] = self.global_ids(arr_code, _concat_as_object([d['id'].values for d in ls_df]))
+        return df
+
+def _merge_header_tables(ls_df) -> pd.DataFrame:
+    """
+    Outer-merge the header tables of the same kind of multiple Vcf objects.
+    A table identical to one which is already merged is skipped, since merging
+    it again does not change the result as long as the merged rows are unique.
+    This is usually the case for VCF files from the same SV caller.
+    """
+    df_merged = ls_df[0]
+    is_unique = None
+    # recently merged tables by their shape and columns
+    dict_ls_merged = {}
+    for idx, df in enumerate(ls_df):
+        key = (df.shape, tuple(df.columns))
+        ls_merged = dict_ls_merged.setdefault(key, [])
+        # the first merge is always done, so that the index is the one created by merge().
+        if idx > 1 and any(df is df_prev or df.equals(df_prev) for df_prev in ls_merged):
+            if is_unique is None:
+                is_unique = not df_merged.duplicated().any()
+            if is_unique:
+                continue
+        ls_merged.append(df)
+        del ls_merged[:-8]
+        if idx == 0:
+            continue
+        on = list(df_merged.columns)
+        df_merged = df_merged.merge(df, how='outer', on=on)
+        is_unique = None
+    return df_merged
+
+def _concat_as_object(ls_arr) -> np.ndarray:
+    if len(ls_arr) == 0:
+        return np.array([], dtype=object)
+    return np.concatenate([np.asarray(arr, dtype=object) for arr in ls_arr])
+
+def _concat_global_id_table(ls_df_svpos, ls_patient_id, mapper) -> pd.DataFrame:
+    df_id = pd.concat([df[['id']] for df in ls_df_svpos], ignore_index=True)
+    df_id['patient_id'] = np.asarray(ls_patient_id, dtype=np.int64)[mapper.arr_patient_code]
+    df_id['global_id'] = mapper.arr_global_id
+    return df_id[['global_id', 'patient_id', 'id']]
+
+def _bedpe_tables_with_global_id(bedpe, patient_id, patient_name):
+    """
+    Return the global_id table, and the positions and INFO tables of a Bedpe object
+    whose SV ids are replaced with the global ids.
+    """
+    df_svpos = bedpe.get_table('positions')
+    mapper = _GlobalIdMapper([patient_name], [df_svpos['id'].values])
+    df_id = _concat_global_id_table([df_svpos], [patient_id], mapper)
+    df_svpos['id'] = mapper.arr_global_id
+
+    odict_df_info = OrderedDict()
+    for key, value in bedpe._odict_df_info.items():
+        odict_df_info[key] = mapper.concat([0], [value])
+    return df_id, df_svpos, odict_df_info
+
 class MultiBedpe(Bedpe):
     """
     A database-like object that contains information of multiple BEDPE files.
@@ -36,6 +381,8 @@ class MultiBedpe(Bedpe):
         "svtype",
     ]
     _repr_column_names_set = set(_repr_column_names)
+    _view_doc_name = 'MultiBedpe'
+    _view_doc_link = 'https://dermasugita.github.io/ViolaDocs/docs/html/reference/multi_bedpe.html'
     def __init__(
         self,
         ls_bedpe: List[Bedpe] = None, 
@@ -49,34 +396,26 @@ class MultiBedpe(Bedpe):
             self.__init__common(*direct_tables)
     
     def __init__from_ls_bedpe(self, ls_bedpe, ls_patient_names):
-        ls_df_id = []
-        ls_df_svpos = []
         dict_ls_df_info = dict() 
+        dict_ls_code = dict()
         ls_patient_id = [i for i in range(len(ls_patient_names))]
         df_patients = pd.DataFrame({'id': ls_patient_id, 'patients': ls_patient_names})
-        for bedpe, patient_id, patient_name in zip(ls_bedpe, ls_patient_id, ls_patient_names):
-            df_svpos = bedpe.get_table('positions')
-            df_id = df_svpos[['id']].copy()
-            df_id['patient_id'] = patient_id
-            df_id['global_id'] = str(patient_name) + '_' + df_id['id'].astype(str)
-            df_id = df_id[['global_id', 'patient_id', 'id']]
-            ls_df_id.append(df_id)
-
-            df_svpos['id'] = str(patient_name) + '_' + df_svpos['id'].astype(str)
-            ls_df_svpos.append(df_svpos)
-
+        ls_df_svpos = [bedpe.get_table('positions') for bedpe in ls_bedpe]
+        mapper = _GlobalIdMapper(ls_patient_names, [df['id'].values for df in ls_df_svpos])
+        for code, bedpe in enumerate(ls_bedpe):
             for key, value in bedpe._odict_df_info.items():
-                value = value.copy()
-                value['id'] = str(patient_name) + '_' + value['id'].astype(str)
                 if dict_ls_df_info.get(key) is None:
                     dict_ls_df_info[key] = [value]
+                    dict_ls_code[key] = [code]
                 else:
                     dict_ls_df_info[key].append(value)
-        df_concat_id = pd.concat(ls_df_id, ignore_index=True)
+                    dict_ls_code[key].append(code)
+        df_concat_id = _concat_global_id_table(ls_df_svpos, ls_patient_id, mapper)
         df_concat_svpos = pd.concat(ls_df_svpos, ignore_index=True)
+        df_concat_svpos['id'] = mapper.arr_global_id
         odict_df_info = OrderedDict()
         for key, value in dict_ls_df_info.items():
-            odict_df_info[key] = pd.concat(value)
+            odict_df_info[key] = mapper.concat(dict_ls_code[key], value)
         
         return (df_concat_id, df_patients, df_concat_svpos, odict_df_info)
     
@@ -85,48 +424,14 @@ class MultiBedpe(Bedpe):
         self._df_patients = df_patients
         self._ls_patients = df_patients['patients'].to_list()
         self._df_svpos = df_svpos 
-        self._odict_df_info = odict_df_info
+        self._odict_df_info = TableStore(odict_df_info)
         self._ls_infokeys = [x.lower() for x in odict_df_info.keys()]
         ls_keys = ['global_id', 'patients', 'positions'] + self._ls_infokeys
-        ls_values = [df_id, df_patients, df_svpos] + list(odict_df_info.values())
-        self._odict_alltables = OrderedDict([(k, v) for k, v in zip(ls_keys, ls_values)])
+        ls_values = [df_id, df_patients, df_svpos] + raw_values(odict_df_info)
+        self._odict_alltables = TableStore([(k, v) for k, v in zip(ls_keys, ls_values)])
         self._repr_config = {
             'info': None,
         }
-    def view(self, custom_infonames=None, return_as_dataframe=False):
-        """
-        view(custom_infonames, return_as_dataframe)
-        Quick view function of the Vcf object.
-
-        Parameters
-        -----------
-        custom_infonames: list_like or None, default None
-            The names of the INFO to show additionally.
-        return_as_dataframe: bool, default False
-            If true, return as pandas DataFrame.
-        """
-        df_svpos = self.get_table('positions')
-        ser_id = df_svpos['id']
-        ser_be1 = df_svpos['chrom1'].astype(str) + ':' + df_svpos['pos1'].astype(str)
-        ser_be2 = df_svpos['chrom2'].astype(str) + ':' + df_svpos['pos2'].astype(str)
-        ser_strand = df_svpos['strand1'] + df_svpos['strand2']
-        ser_qual = df_svpos['qual']
-        ser_svtype = df_svpos['svtype']
-        ls_ser = [ser_id, ser_be1, ser_be2, ser_strand, ser_qual, ser_svtype]
-        ls_key = ['id', 'be1', 'be2', 'strand', 'qual', 'svtype']
-        dict_ = {k: v for k, v in zip(ls_key, ls_ser)}
-        df_out = pd.DataFrame(dict_)
-        if custom_infonames is not None:
-            df_out = self.append_infos(df_out, ls_tablenames=custom_infonames)
-        str_df_out = str(df_out)
-        str_infokeys = ','.join(list(self._ls_infokeys))
-        desc_info = 'INFO='
-        desc_doc = 'Documentation of MultiBedpe object ==> '
-        doc_link = 'https://dermasugita.github.io/ViolaDocs/docs/html/reference/multi_bedpe.html'
-        out = desc_info + str_infokeys + '\n' + desc_doc + doc_link + '\n' + str_df_out
-        if return_as_dataframe:
-            return df_out
-        return str(out)
         
 
     def filter_by_id(self, arrlike_id):
@@ -151,13 +456,55 @@ class MultiBedpe(Bedpe):
         out_global_id = df_global_id.loc[df_global_id['global_id'].isin(arrlike_id)].reset_index(drop=True)
         out_patients = self.get_table('patients')
         out_svpos = self._filter_by_id('positions', arrlike_id)
-        out_odict_df_info = OrderedDict([(k, self._filter_by_id(k, arrlike_id)) for k in self._ls_infokeys])
+        out_odict_df_info = OrderedDict([(k, self._select_by_id(k, arrlike_id)) for k in self._ls_infokeys])
         return MultiBedpe(direct_tables=[out_global_id, out_patients, out_svpos, out_odict_df_info])
+
+    def _split_by_patient(self, n_parts: int) -> List['MultiBedpe']:
+        """
+        Split the object into n_parts MultiBedpe objects of consecutive patients
+        in the order of the patients table.
+        """
+        df_patients = self.get_table('patients')
+        ls_patients = _split_by_codes(df_patients, np.arange(len(df_patients)) * n_parts // max(len(df_patients), 1), n_parts)
+        ls_global_id = _split_table(self, self.get_table('global_id'), n_parts, key='global_id')
+        ls_svpos = _split_table(self, self.get_table('positions'), n_parts)
+        odict_ls_info = OrderedDict([(k, _split_table(self, self.get_table(k), n_parts)) for k in self._ls_infokeys])
+        return [
+            MultiBedpe(direct_tables=[ls_global_id[i], ls_patients[i], ls_svpos[i],
+                OrderedDict([(k, v[i]) for k, v in odict_ls_info.items()])])
+            for i in range(n_parts)
+        ]
+
+    def query_regions(self, regions: Union[str, Bed, pd.DataFrame], flank: int = 0) -> pd.DataFrame:
+        """
+        query_regions(regions, flank=0)
+        Find breakends of all patients located in the given regions.
+        Both breakends of each SV record are looked up in a single pass over
+        a per-chromosome sorted index, without creating a filtered object.
+
+        Parameters
+        ------------
+        regions: str or Bed or DataFrame
+            Path to a BED file, Bed object, or DataFrame with the 'chrom', 'chromStart'
+            and 'chromEnd' columns (and optionally 'name'). The coordinates are
+            interpreted as BED, that is, 0-based and half-open.
+        flank: int, default 0
+            Extend each region by this number of bases on both sides.
+
+        Returns
+        ---------
+        DataFrame
+            A hit table with the following columns, one row per (region, breakend) hit:
+            ['region', 'global_id', 'patients', 'breakend']
+            'region' is the 'name' column of the regions if it exists, otherwise the index.
+            'breakend' is either 'be1' or 'be2'.
+        """
+        return _query_regions(self, regions, flank)
     
 
-    def classify_manual_svtype(self, definitions=None, ls_conditions=None, ls_names=None, ls_order=None, return_data_frame=True, exclude_empty_cases=False):
+    def classify_manual_svtype(self, definitions=None, ls_conditions=None, ls_names=None, ls_order=None, return_data_frame=True, exclude_empty_cases=False, n_jobs=None, sparse=False):
         """
-        classify_manual_svtype(definitions, ls_conditions, ls_names, ls_order=None, exclude_empty_cases=False)
+        classify_manual_svtype(definitions, ls_conditions, ls_names, ls_order=None, exclude_empty_cases=False, n_jobs=None, sparse=False)
         Classify SV records by user-defined criteria. A new INFO table named
         'manual_sv_type' will be created.
 
@@ -183,66 +530,58 @@ class MultiBedpe(Bedpe):
             Return counts of each custom SV class as a pd.Series.
         exclude_empty_cases: bool, default False
             If True, samples which have no SV record will be excluded.
+        n_jobs: int, default None
+            If not None, the patients are split into partitions which are classified in n_jobs processes.
+            -1 means all CPUs, and 1 means a single process without a pool.
+            Every condition must only look at each SV record, not at the other records
+            (the definition files and filter() based conditions satisfy this),
+            and callable conditions must be picklable, e.g. functions defined at the module level.
+        sparse: bool, default False
+            If True, the returned DataFrame has sparse columns.
         
         Returns
         ---------
         pd.DataFrame or None
         """
-        set_ids_current = set(self.ids)
-        obj = self
-        ls_ids = []
-        ls_result_names = []
-        if definitions is not None:
-            if isinstance(definitions, str):
-                if definitions == "default":
-                    d = os.path.dirname(sys.modules["viola"].__file__)
-                    definitions = os.path.join(d, "data/sv_class_default.txt")
-                    ls_conditions, ls_names = self._parse_signature_definition_file(open(definitions, 'r'))
-                elif definitions == "article":
-                    d = os.path.dirname(sys.modules["viola"].__file__)
-                    definitions = os.path.join(d, "data/sv_class_article.txt")
-                    ls_conditions, ls_names = self._parse_signature_definition_file(open(definitions, 'r'))
-                else:
-                    ls_conditions, ls_names = self._parse_signature_definition_file(open(definitions, 'r'))
-            else:
-                ls_conditions, ls_names = self._parse_signature_definition_file(definitions)
-        for cond, name in zip(ls_conditions, ls_names):
-            obj = obj.filter_by_id(set_ids_current)
-            if callable(cond):
-                ids = cond(obj)
-            else:
-                ids = cond
-            set_ids = set(ids)
-            set_ids_intersection = set_ids_current & set_ids
-            ls_ids += list(set_ids_intersection)
-            ls_result_names += [name for i in range(len(set_ids_intersection))]
-            set_ids_current = set_ids_current - set_ids_intersection
-        ls_ids += list(set_ids_current)
-        ls_result_names += ['others' for i in range(len(set_ids_current))]
-        ls_zeros = [0 for i in range(len(self.ids))]
-        df_result = pd.DataFrame({'id': ls_ids, 'value_idx': ls_zeros, 'manual_sv_type': ls_result_names})
+        if n_jobs is not None:
+            df_result, ls_names = _classify_manual_svtype_partitioned(self, definitions, ls_conditions, ls_names, n_jobs)
+        else:
+            if definitions is not None:
+                ls_conditions, ls_names = self._parse_signature_definition_file(_read_definitions(definitions))
+            ls_ids, ls_result_names = _classify_records(self, ls_conditions, ls_names)
+            ls_zeros = [0 for i in range(len(ls_ids))]
+            df_result = pd.DataFrame({'id': ls_ids, 'value_idx': ls_zeros, 'manual_sv_type': ls_result_names})
         self.add_info_table('manual_sv_type', df_result)
         if return_data_frame:
             if ls_order is None:
                 pd_ind_reindex = pd.Index(ls_names + ['others'])
             else:
                 pd_ind_reindex = pd.Index(ls_order)
-            df_feature_counts = self.get_feature_count_as_data_frame(ls_order=pd_ind_reindex, exclude_empty_cases=exclude_empty_cases)
+            df_feature_counts = self.get_feature_count_as_data_frame(ls_order=pd_ind_reindex, exclude_empty_cases=exclude_empty_cases, sparse=sparse)
             return df_feature_counts
 
-    def get_feature_count_as_data_frame(self, feature='manual_sv_type', ls_order=None, exclude_empty_cases=False):
-        df_feature = self.get_table(feature)
-        df_id = self.get_table('global_id')
-        df_patients = self.get_table('patients')
-        df_merged = pd.merge(df_feature, df_id, left_on='id', right_on='global_id')
-        df_merged = df_merged.merge(df_patients, left_on='patient_id', right_on='id')
-        df_feature_counts = df_merged.pivot_table('global_id', index='patients', columns=feature, aggfunc='count', fill_value=0)
-        if not exclude_empty_cases:
-            df_feature_counts = df_feature_counts.reindex(self._ls_patients, fill_value=0)
-        if ls_order is not None:
-            pd_ind_reindex = pd.Index(ls_order, name=feature)
-            df_feature_counts = df_feature_counts.reindex(columns=pd_ind_reindex, fill_value=0)
-        return df_feature_counts
+    def get_feature_count_as_data_frame(self, feature='manual_sv_type', ls_order=None, exclude_empty_cases=False, sparse=False):
+        """
+        get_feature_count_as_data_frame(feature='manual_sv_type', ls_order=None, exclude_empty_cases=False, sparse=False)
+        Return the counts of the values of an INFO for each patient as a DataFrame.
+
+        Parameters
+        -----------
+        feature: str, default 'manual_sv_type'
+            The name of INFO to be counted.
+        ls_order: List[str], default None
+            Order of the columns (unique feature values) of the output DataFrame.
+        exclude_empty_cases: bool, default False
+            If True, patients which have no value of the INFO will be excluded.
+        sparse: bool, default False
+            If True, the returned DataFrame has sparse columns.
+
+        Returns
+        --------
+        pd.DataFrame
+            A patients x feature values DataFrame of counts.
+        """
+        return _get_feature_count(self, feature, ls_order, exclude_empty_cases, sparse)
 
 class MultiVcf(Vcf):
     """
@@ -272,6 +611,8 @@ class MultiVcf(Vcf):
         "svtype",
     ]
     _repr_column_names_set = set(_repr_column_names)
+    _view_doc_name = 'MultiBedpe'
+    _view_doc_link = 'https://dermasugita.github.io/ViolaDocs/docs/html/reference/multi_vcf.html'
     def __init__(
         self,
         ls_vcf: List[Vcf] = None, 
@@ -285,17 +626,12 @@ class MultiVcf(Vcf):
             self.__init__common(*direct_tables)
     
     def __init__from_ls_vcf(self, ls_vcf, ls_patient_names):
-        ls_df_id = []
-        ls_df_svpos = []
-        ls_df_filters = []
         odict_ls_df_info = OrderedDict() 
-        ls_df_formats = []
         odict_ls_df_headers = OrderedDict()
 
         # Header Integration
         for vcf, patient_name in zip(ls_vcf, ls_patient_names):
             for key, value in vcf._odict_df_headers.items():
-                value = value.copy()
                 if odict_ls_df_headers.get(key) is None:
                     odict_ls_df_headers[key] = [value]
                 else:
@@ -303,58 +639,38 @@ class MultiVcf(Vcf):
 
         odict_df_headers = OrderedDict()
         for key, value in odict_ls_df_headers.items():
-            for idx, df in enumerate(value):
-                if idx == 0:
-                    df_merged = df
-                    continue
-                on = list(df_merged.columns)
-                df_merged = df_merged.merge(df, how='outer', on=on)
-            
-            odict_df_headers[key] = df_merged
+            odict_df_headers[key] = _merge_header_tables(value)
         # /Header Integration
 
         ls_patient_id = [i for i in range(len(ls_patient_names))]
         df_patients = pd.DataFrame({'id': ls_patient_id, 'patients': ls_patient_names})
-        for vcf, patient_id, patient_name in zip(ls_vcf, ls_patient_id, ls_patient_names):
-            df_svpos = vcf.get_table('positions')
-            df_filters = vcf.get_table('filters')
-            df_formats = vcf.get_table('formats')
-            df_id = df_svpos[['id']].copy()
-            df_id['patient_id'] = patient_id
-            df_id['global_id'] = str(patient_name) + '_' + df_id['id'].astype(str)
-            df_id = df_id[['global_id', 'patient_id', 'id']]
-            ls_df_id.append(df_id)
-
-            df_svpos['id'] = str(patient_name) + '_' + df_svpos['id'].astype(str)
-            ls_df_svpos.append(df_svpos)
-
-            df_filters['id'] = str(patient_name) + '_' + df_filters['id'].astype(str)
-            ls_df_filters.append(df_filters)
-
-            df_formats['id'] = str(patient_name) + '_' + df_formats['id'].astype(str)
-            ls_df_formats.append(df_formats)
-
+        ls_df_svpos = [vcf.get_table('positions') for vcf in ls_vcf]
+        mapper = _GlobalIdMapper(ls_patient_names, [df['id'].values for df in ls_df_svpos])
+        ls_df_filters = [vcf._odict_alltables.get_raw('filters') for vcf in ls_vcf]
+        ls_df_formats = [vcf._odict_alltables.get_raw('formats') for vcf in ls_vcf]
+        ls_code = list(range(len(ls_vcf)))
+        odict_ls_code = OrderedDict()
+        for code, vcf in enumerate(ls_vcf):
             for info in odict_df_headers['infos_meta'].id:
-                df_info_ = vcf._odict_df_info.get(info, None)
-                if df_info_ is None:
+                df_info = vcf._odict_df_info.get(info, None)
+                if df_info is None:
                     df_info = pd.DataFrame(columns=('id', 'value_idx', info.lower()))
-                else:
-                    df_info = df_info_.copy()
-                    df_info['id'] = str(patient_name) + '_' + df_info['id'].astype(str)
                 if odict_ls_df_info.get(info) is None:
                     odict_ls_df_info[info] = [df_info]
+                    odict_ls_code[info] = [code]
                 else:
                     odict_ls_df_info[info].append(df_info)
+                    odict_ls_code[info].append(code)
 
-            
-        df_concat_id = pd.concat(ls_df_id, ignore_index=True)
+        df_concat_id = _concat_global_id_table(ls_df_svpos, ls_patient_id, mapper)
         df_concat_svpos = pd.concat(ls_df_svpos, ignore_index=True)
-        df_concat_filters = pd.concat(ls_df_filters, ignore_index=True)
-        df_concat_formats = pd.concat(ls_df_formats, ignore_index=True)
+        df_concat_svpos['id'] = mapper.arr_global_id
+        df_concat_filters = mapper.concat(ls_code, ls_df_filters, ignore_index=True)
+        df_concat_formats = mapper.concat(ls_code, ls_df_formats, ignore_index=True)
         odict_df_info = OrderedDict()
 
         for key, value in odict_ls_df_info.items():
-            odict_df_info[key] = pd.concat(value)
+            odict_df_info[key] = mapper.concat(odict_ls_code[key], value)
         
         return (df_concat_id, df_patients, df_concat_svpos, df_concat_filters, odict_df_info, df_concat_formats, odict_df_headers)
 
@@ -364,53 +680,19 @@ class MultiVcf(Vcf):
         self._df_patients = df_patients
         self._df_svpos = df_svpos
         self._df_filters = df_filters
-        self._odict_df_info = odict_df_info
+        self._odict_df_info = TableStore(odict_df_info)
         self._df_formats = df_formats
         self._odict_df_headers = odict_df_headers
         self._ls_patients = df_patients['patients'].to_list()
         self._ls_infokeys = [ x.lower() for x in odict_df_headers['infos_meta']['id'].tolist()]
         ls_keys = ['global_id', 'patients', 'positions', 'filters'] + self._ls_infokeys + ['formats'] + \
         list(odict_df_headers.keys())
-        ls_values = [df_id, df_patients, df_svpos, df_filters] + list(odict_df_info.values()) + [df_formats] + list(odict_df_headers.values())
-        self._odict_alltables = OrderedDict([(k, v) for k, v in zip(ls_keys, ls_values)])
+        ls_values = [df_id, df_patients, df_svpos, df_filters] + raw_values(odict_df_info) + [df_formats] + list(odict_df_headers.values())
+        self._odict_alltables = TableStore([(k, v) for k, v in zip(ls_keys, ls_values)])
         self._repr_config = {
             'info': None,
         }
 
-    def view(self, custom_infonames=None, return_as_dataframe=False):
-        """
-        view(custom_infonames, return_as_dataframe)
-        Quick view function of the Vcf object.
-
-        Parameters
-        -----------
-        custom_infonames: list_like or None, default None
-            The names of the INFO to show additionally.
-        return_as_dataframe: bool, default False
-            If true, return as pandas DataFrame.
-        """
-        df_svpos = self.get_table('positions')
-        ser_id = df_svpos['id']
-        ser_be1 = df_svpos['chrom1'].astype(str) + ':' + df_svpos['pos1'].astype(str)
-        ser_be2 = df_svpos['chrom2'].astype(str) + ':' + df_svpos['pos2'].astype(str)
-        ser_strand = df_svpos['strand1'] + df_svpos['strand2']
-        ser_qual = df_svpos['qual']
-        ser_svtype = df_svpos['svtype']
-        ls_ser = [ser_id, ser_be1, ser_be2, ser_strand, ser_qual, ser_svtype]
-        ls_key = ['id', 'be1', 'be2', 'strand', 'qual', 'svtype']
-        dict_ = {k: v for k, v in zip(ls_key, ls_ser)}
-        df_out = pd.DataFrame(dict_)
-        if custom_infonames is not None:
-            df_out = self.append_infos(df_out, ls_tablenames=custom_infonames)
-        str_df_out = str(df_out)
-        str_infokeys = ','.join(list(self._ls_infokeys))
-        desc_info = 'INFO='
-        desc_doc = 'Documentation of MultiBedpe object ==> '
-        doc_link = 'https://dermasugita.github.io/ViolaDocs/docs/html/reference/multi_vcf.html'
-        out = desc_info + str_infokeys + '\n' + desc_doc + doc_link + '\n' + str_df_out
-        if return_as_dataframe:
-            return df_out
-        return str(out)
         
 
     def filter_by_id(self, arrlike_id):
@@ -435,16 +717,60 @@ class MultiVcf(Vcf):
         out_global_id = df_global_id.loc[df_global_id['global_id'].isin(arrlike_id)].reset_index(drop=True)
         out_patients = self.get_table('patients')
         out_svpos = self._filter_by_id('positions', arrlike_id)
-        out_filters = self._filter_by_id('filters', arrlike_id)
-        out_odict_df_info = OrderedDict([(k, self._filter_by_id(k, arrlike_id)) for k in self._ls_infokeys])
-        out_formats = self._filter_by_id('formats', arrlike_id)
+        out_filters = self._select_by_id('filters', arrlike_id)
+        out_odict_df_info = OrderedDict([(k, self._select_by_id(k, arrlike_id)) for k in self._ls_infokeys])
+        out_formats = self._select_by_id('formats', arrlike_id)
         out_odict_df_headers = self._odict_df_headers.copy()
         return MultiVcf(direct_tables=[out_global_id, out_patients, out_svpos, out_filters, out_odict_df_info, out_formats, out_odict_df_headers])
+
+    def _split_by_patient(self, n_parts: int) -> List['MultiVcf']:
+        """
+        Split the object into n_parts MultiVcf objects of consecutive patients
+        in the order of the patients table.
+        """
+        df_patients = self.get_table('patients')
+        ls_patients = _split_by_codes(df_patients, np.arange(len(df_patients)) * n_parts // max(len(df_patients), 1), n_parts)
+        ls_global_id = _split_table(self, self.get_table('global_id'), n_parts, key='global_id')
+        ls_svpos = _split_table(self, self.get_table('positions'), n_parts)
+        ls_filters = _split_table(self, self.get_table('filters'), n_parts)
+        odict_ls_info = OrderedDict([(k, _split_table(self, self.get_table(k), n_parts)) for k in self._ls_infokeys])
+        ls_formats = _split_table(self, self.get_table('formats'), n_parts)
+        return [
+            MultiVcf(direct_tables=[ls_global_id[i], ls_patients[i], ls_svpos[i], ls_filters[i],
+                OrderedDict([(k, v[i]) for k, v in odict_ls_info.items()]), ls_formats[i], self._odict_df_headers.copy()])
+            for i in range(n_parts)
+        ]
+
+    def query_regions(self, regions: Union[str, Bed, pd.DataFrame], flank: int = 0) -> pd.DataFrame:
+        """
+        query_regions(regions, flank=0)
+        Find breakends of all patients located in the given regions.
+        Both breakends of each SV record are looked up in a single pass over
+        a per-chromosome sorted index, without creating a filtered object.
+
+        Parameters
+        ------------
+        regions: str or Bed or DataFrame
+            Path to a BED file, Bed object, or DataFrame with the 'chrom', 'chromStart'
+            and 'chromEnd' columns (and optionally 'name'). The coordinates are
+            interpreted as BED, that is, 0-based and half-open.
+        flank: int, default 0
+            Extend each region by this number of bases on both sides.
+
+        Returns
+        ---------
+        DataFrame
+            A hit table with the following columns, one row per (region, breakend) hit:
+            ['region', 'global_id', 'patients', 'breakend']
+            'region' is the 'name' column of the regions if it exists, otherwise the index.
+            'breakend' is either 'be1' or 'be2'.
+        """
+        return _query_regions(self, regions, flank)
     
 
-    def classify_manual_svtype(self, definitions=None, ls_conditions=None, ls_names=None, ls_order=None, return_data_frame=True, exclude_empty_cases=False):
+    def classify_manual_svtype(self, definitions=None, ls_conditions=None, ls_names=None, ls_order=None, return_data_frame=True, exclude_empty_cases=False, n_jobs=None, sparse=False):
         """
-        classify_manual_svtype(definitions, ls_conditions, ls_names, ls_order=None, exclude_empty_cases=False)
+        classify_manual_svtype(definitions, ls_conditions, ls_names, ls_order=None, exclude_empty_cases=False, n_jobs=None, sparse=False)
         Classify SV records by user-defined criteria. A new INFO table named
         'manual_sv_type' will be created.
 
@@ -470,51 +796,34 @@ class MultiVcf(Vcf):
             Return counts of each custom SV class as a pd.Series.
         exclude_empty_cases: bool, default False
             If True, samples which have no SV record will be excluded.
+        n_jobs: int, default None
+            If not None, the patients are split into partitions which are classified in n_jobs processes.
+            -1 means all CPUs, and 1 means a single process without a pool.
+            Every condition must only look at each SV record, not at the other records
+            (the definition files and filter() based conditions satisfy this),
+            and callable conditions must be picklable, e.g. functions defined at the module level.
+        sparse: bool, default False
+            If True, the returned DataFrame has sparse columns.
         
         Returns
         ---------
         pd.DataFrame or None
         """
-        set_ids_current = set(self.ids)
-        obj = self
-        ls_ids = []
-        ls_result_names = []
-        if definitions is not None:
-            if isinstance(definitions, str):
-                if definitions == "default":
-                    d = os.path.dirname(sys.modules["viola"].__file__)
-                    definitions = os.path.join(d, "data/sv_class_default.txt")
-                    ls_conditions, ls_names = self._parse_signature_definition_file(open(definitions, 'r'))
-                elif definitions == "article":
-                    d = os.path.dirname(sys.modules["viola"].__file__)
-                    definitions = os.path.join(d, "data/sv_class_article.txt")
-                    ls_conditions, ls_names = self._parse_signature_definition_file(open(definitions, 'r'))
-                else:
-                    ls_conditions, ls_names = self._parse_signature_definition_file(open(definitions, 'r'))
-            else:
-                ls_conditions, ls_names = self._parse_signature_definition_file(definitions)
-        for cond, name in zip(ls_conditions, ls_names):
-            obj = obj.filter_by_id(set_ids_current)
-            if callable(cond):
-                ids = cond(obj)
-            else:
-                ids = cond
-            set_ids = set(ids)
-            set_ids_intersection = set_ids_current & set_ids
-            ls_ids += list(set_ids_intersection)
-            ls_result_names += [name for i in range(len(set_ids_intersection))]
-            set_ids_current = set_ids_current - set_ids_intersection
-        ls_ids += list(set_ids_current)
-        ls_result_names += ['others' for i in range(len(set_ids_current))]
-        ls_zeros = [0 for i in range(len(self.ids))]
-        df_result = pd.DataFrame({'id': ls_ids, 'value_idx': ls_zeros, 'manual_sv_type': ls_result_names})
+        if n_jobs is not None:
+            df_result, ls_names = _classify_manual_svtype_partitioned(self, definitions, ls_conditions, ls_names, n_jobs)
+        else:
+            if definitions is not None:
+                ls_conditions, ls_names = self._parse_signature_definition_file(_read_definitions(definitions))
+            ls_ids, ls_result_names = _classify_records(self, ls_conditions, ls_names)
+            ls_zeros = [0 for i in range(len(ls_ids))]
+            df_result = pd.DataFrame({'id': ls_ids, 'value_idx': ls_zeros, 'manual_sv_type': ls_result_names})
         self.add_info_table('manual_sv_type', df_result, number=1, type_='String', description='Custom SV class defined by user')
         if return_data_frame:
             if ls_order is None:
                 pd_ind_reindex = pd.Index(ls_names + ['others'])
             else:
                 pd_ind_reindex = pd.Index(ls_order)
-            df_feature_counts = self.get_feature_count_as_data_frame(ls_order=pd_ind_reindex, exclude_empty_cases=exclude_empty_cases)
+            df_feature_counts = self.get_feature_count_as_data_frame(ls_order=pd_ind_reindex, exclude_empty_cases=exclude_empty_cases, sparse=sparse)
             return df_feature_counts
     
     def as_bedpe_multi(self):
@@ -573,16 +882,25 @@ class MultiVcf(Vcf):
         return self.as_bedpe_multi()
 
     
-    def get_feature_count_as_data_frame(self, feature='manual_sv_type', ls_order=None, exclude_empty_cases=False):
-        df_feature = self.get_table(feature)
-        df_id = self.get_table('global_id')
-        df_patients = self.get_table('patients')
-        df_merged = pd.merge(df_feature, df_id, left_on='id', right_on='global_id')
-        df_merged = df_merged.merge(df_patients, left_on='patient_id', right_on='id')
-        df_feature_counts = df_merged.pivot_table('global_id', index='patients', columns=feature, aggfunc='count', fill_value=0)
-        if not exclude_empty_cases:
-            df_feature_counts = df_feature_counts.reindex(self._ls_patients, fill_value=0)
-        if ls_order is not None:
-            pd_ind_reindex = pd.Index(ls_order, name=feature)
-            df_feature_counts = df_feature_counts.reindex(columns=pd_ind_reindex, fill_value=0)
-        return df_feature_counts
\ No newline at end of file
+    def get_feature_count_as_data_frame(self, feature='manual_sv_type', ls_order=None, exclude_empty_cases=False, sparse=False):
+        """
+        get_feature_count_as_data_frame(feature='manual_sv_type', ls_order=None, exclude_empty_cases=False, sparse=False)
+        Return the counts of the values of an INFO for each patient as a DataFrame.
+
+        Parameters
+        -----------
+        feature: str, default 'manual_sv_type'
+            The name of INFO to be counted.
+        ls_order: List[str], default None
+            Order of the columns (unique feature values) of the output DataFrame.
+        exclude_empty_cases: bool, default False
+            If True, patients which have no value of the INFO will be excluded.
+        sparse: bool, default False
+            If True, the returned DataFrame has sparse columns.
+
+        Returns
+        --------
+        pd.DataFrame
+            A patients x feature values DataFrame of counts.
+        """
+        return _get_feature_count(self, feature, ls_order, exclude_empty_cases, sparse)
\ No newline at end of file
@@ -2,76 +2,188 @@ import pandas as pd
 import viola
 from viola.core.bedpe import Bedpe
 from viola.core.vcf import Vcf
-from viola.core.cohort import MultiBedpe, MultiVcf
+from viola.core.cohort import MultiBedpe, MultiVcf, _bedpe_tables_with_global_id
 from collections import OrderedDict
 from viola._exceptions import DuplicatedPatientIDError
+from typing import List
 
-def _detect_patient_name_duplication(ls_left, ls_right):
-    ls_left = [str(i) for i in ls_left]
-    ls_right = [str(i) for i in ls_right]
-    if len(set(ls_left) | set(ls_right)) != len(set(ls_left)) + len(set(ls_right)):
-        ls_duplicated_patients = list(set(ls_left) & set(ls_right))
-        raise DuplicatedPatientIDError(', '.join(ls_duplicated_patients))
+def _concat_chunks(ls_chunks):
+    """
+    Concatenate the tables of the chunks of CohortBuilder into a single chunk.
+    """
+    odict_ls_df_info = OrderedDict()
+    for chunk in ls_chunks:
+        for key, value in chunk['infos'].items():
+            if odict_ls_df_info.get(key) is None:
+                odict_ls_df_info[key] = [value]
+            else:
+                odict_ls_df_info[key].append(value)
+    out = OrderedDict()
+    for table_name in ['global_id', 'patients', 'positions']:
+        ls_df = [chunk[table_name] for chunk in ls_chunks if chunk[table_name] is not None]
+        out[table_name] = pd.concat(ls_df, ignore_index=True) if ls_df else None
+    out['infos'] = OrderedDict((key, pd.concat(value)) for key, value in odict_ls_df_info.items())
+    out['size'] = sum(chunk['size'] for chunk in ls_chunks)
+    return out
+
+def _size_class(size: int, fanout: int) -> int:
+    # floor(log_fanout(size))
+    n = 0
+    while size >= fanout:
+        size //= fanout
+        n += 1
+    return n
+
+class CohortBuilder(object):
+    """
+    Append-oriented container to build a MultiBedpe object patient by patient.
+
+    append() stores the tables of the new patients as a new chunk, so that its cost
+    depends only on the size of the new data, instead of rebuilding the whole cohort.
+    Whenever 16 recent chunks with a similar number of patients accumulate,
+    they are compacted into one chunk. build() concatenates the remaining chunks.
+
+    Parameters
+    ----------
+    obj: Bedpe, Vcf, MultiBedpe or MultiVcf, default None
+        The initial cohort.
+
+    Examples
+    ---------
+    >>> import viola
+    >>> builder = viola.CohortBuilder(multi_bedpe)
+    >>> builder.append(bedpe3, 'patient3')
+    >>> builder.append(vcf4, 'patient4')
+    >>> multi_bedpe = builder.build()
+    """
+    _COMPACTION_FANOUT = 16
+
+    def __init__(self, obj=None):
+        self._ls_chunks = []
+        self._ls_patients = []
+        self._set_patients = set()
+        self._max_patient_id = -1
+        if obj is not None:
+            self.append(obj)
+
+    @property
+    def patients(self) -> List[str]:
+        """
+        The names of the patients in the order of appending.
+        """
+        return list(self._ls_patients)
+
+    def __len__(self):
+        return len(self._ls_patients)
+
+    def __contains__(self, patient_name):
+        return str(patient_name) in self._set_patients
+
+    def append(self, obj, patient_name=None):
+        """
+        append(obj, patient_name=None)
+        Add the SV records of one or more new patients.
+
+        Parameters
+        ----------
+        obj: Bedpe, Vcf, MultiBedpe or MultiVcf
+            The SV records to add. Vcf and MultiVcf objects are converted with as_bedpe().
+        patient_name: str, default None
+            Name of the patient of a Bedpe or Vcf object.
+            If None, obj.patient_name is used. Ignored for MultiBedpe and MultiVcf.
+
+        Returns
+        ----------
+        CohortBuilder
+            self, so that the calls can be chained.
+
+        Raises
+        ----------
+        DuplicatedPatientIDError
+            If any of the patients is already in the cohort. Nothing is added in this case.
+        """
+        if isinstance(obj, MultiVcf):
+            obj = obj.as_bedpe_multi()
+        elif isinstance(obj, Vcf):
+            if patient_name is None:
+                patient_name = obj.patient_name
+            obj = obj.as_bedpe()
+        if not isinstance(obj, Bedpe):
+            raise TypeError('Input values should be Bedpe, Vcf, MultiBedpe or MultiVcf class.')
+        if isinstance(obj, MultiBedpe):
+            df_patients = obj.get_table('patients')
+        else:
+            if patient_name is None:
+                patient_name = obj.patient_name
+            df_patients = pd.DataFrame({'id': [0], 'patients': [patient_name]})
+        ls_patients = [str(i) for i in df_patients['patients']]
+        # O(len(ls_patients)) check against the names kept in self._set_patients,
+        # including the duplicates within the appended patients.
+        set_new = set()
+        ls_duplicated_patients = []
+        for name in ls_patients:
+            if name in self._set_patients or name in set_new:
+                ls_duplicated_patients.append(name)
+            set_new.add(name)
+        if ls_duplicated_patients:
+            raise DuplicatedPatientIDError(', '.join(dict.fromkeys(ls_duplicated_patients)))
+
+        chunk = OrderedDict([('global_id', None), ('patients', None), ('positions', None), ('infos', OrderedDict()), ('size', len(ls_patients))])
+        offset = self._max_patient_id + 1
+        df_patients['id'] = df_patients['id'] + offset
+        chunk['patients'] = df_patients
+        if obj.sv_count > 0:
+            if isinstance(obj, MultiBedpe):
+                df_global_id = obj.get_table('global_id')
+                df_global_id['patient_id'] = df_global_id['patient_id'] + offset
+                chunk['positions'] = obj._odict_alltables.get_raw('positions')
+                chunk['infos'] = OrderedDict((key, value) for key, value in obj._odict_df_info.items())
+            else:
+                # the same tables as MultiBedpe([obj], [patient_name]) without building the object
+                df_global_id, chunk['positions'], chunk['infos'] = _bedpe_tables_with_global_id(obj, offset, patient_name)
+            chunk['global_id'] = df_global_id
+        if len(df_patients) > 0:
+            self._max_patient_id = df_patients['id'].max()
+
+        self._ls_patients += ls_patients
+        self._set_patients.update(ls_patients)
+        self._ls_chunks.append(chunk)
+        # size-tiered compaction: the last chunks are merged when there are
+        # _COMPACTION_FANOUT of them of the same size class, so that each record is
+        # copied O(log n) times and there are O(log n) chunks.
+        f = self._COMPACTION_FANOUT
+        while len(self._ls_chunks) >= f and len(set(_size_class(chunk['size'], f) for chunk in self._ls_chunks[-f:])) == 1:
+            self._ls_chunks[-f:] = [_concat_chunks(self._ls_chunks[-f:])]
+        return self
+
+    def compact(self):
+        """
+        compact()
+        Concatenate all chunks into one.
+        """
+        if len(self._ls_chunks) > 1:
+            self._ls_chunks = [_concat_chunks(self._ls_chunks)]
+
+    def build(self) -> MultiBedpe:
+        """
+        build()
+        Return a MultiBedpe object of all the patients appended so far.
+        The builder can still be used after calling this method.
+        """
+        self.compact()
+        if not self._ls_chunks or self._ls_chunks[0]['global_id'] is None:
+            raise ValueError('No SV records to concatenate.')
+        chunk = self._ls_chunks[0]
+        return MultiBedpe(direct_tables=[chunk['global_id'], chunk['patients'], chunk['positions'], OrderedDict(chunk['infos'])])
 
 def concat_bedpe(ls_objs):
-    dict_ls_df_info = dict() 
-    loop_count = 0
-    ls_patients = []
-    ls_df_global_id = []
-    ls_df_patients = []
-    ls_df_positions = []
-    max_patient_id = -1
+    builder = CohortBuilder()
     for obj in ls_objs:
         # checking type
         if not isinstance(obj, Bedpe) | isinstance(obj, MultiBedpe):
             raise TypeError('Input values should be Bedpe or MultiBedpe class.')
-        if type(obj) is Bedpe:
-            obj = MultiBedpe([obj], [obj.patient_name])
-        if obj.sv_count == 0:
-            df_patients_current = obj.get_table('patients')
-            ls_patients_current = df_patients_current.loc[:, 'patients'].to_list()
-            df_patients_current.loc[:, 'id'] = df_patients_current.loc[:, 'id'] + max_patient_id + 1
-            ls_df_patients.append(df_patients_current)
-            max_patient_id = df_patients_current.loc[:, 'id'].max()
-            _detect_patient_name_duplication(ls_patients, ls_patients_current)
-            ls_patients += ls_patients_current
-            continue
-        df_patients_current = obj.get_table('patients')
-        ls_patients_current = df_patients_current.loc[:, 'patients'].to_list()
-        df_patients_current.loc[:, 'id'] = df_patients_current.loc[:, 'id'] + max_patient_id + 1
-        ls_df_patients.append(df_patients_current)
-
-        _detect_patient_name_duplication(ls_patients, ls_patients_current)
-
-        ls_patients += ls_patients_current
-
-        df_global_id_current = obj.get_table('global_id')
-        df_global_id_current.loc[:, 'patient_id'] = df_global_id_current.loc[:, 'patient_id'] + max_patient_id + 1
-        ls_df_global_id.append(df_global_id_current)
-        ls_df_positions.append(obj.get_table('positions'))
-
-        max_patient_id = df_patients_current.loc[:, 'id'].max() # update max_patient_id
-
-        if loop_count == 0:
-            for key, value in obj._odict_df_info.items():
-                dict_ls_df_info[key] = [value.copy()]
-            loop_count = loop_count + 1
-        else:
-            for key, value in obj._odict_df_info.items():
-                value = value.copy()
-                if dict_ls_df_info.get(key) is None:
-                    dict_ls_df_info[key] = [value]
-                else:
-                    dict_ls_df_info[key].append(value)
-
-    df_concat_global_id = pd.concat(ls_df_global_id, ignore_index=True)
-    df_concat_patients = pd.concat(ls_df_patients, ignore_index=True)
-    df_concat_positions = pd.concat(ls_df_positions, ignore_index=True)
-    odict_df_info = OrderedDict()
-    for key, value in dict_ls_df_info.items():
-        odict_df_info[key] = pd.concat(value)
-    
-    return MultiBedpe(direct_tables=[df_concat_global_id, df_concat_patients, df_concat_positions, odict_df_info])
+        builder.append(obj)
+    return builder.build()
         
 
 
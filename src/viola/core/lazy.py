@@ -0,0 +1,186 @@
+import inspect
+from typing import (
+    Callable,
+    Optional,
+    Set,
+)
+import numpy as np
+from viola._typing import IntOrStr
+
+class LazyPlan(object):
+    """
+    Deferred pipeline of operations on a Bedpe/Vcf object.
+    Create it with Bedpe.lazy() or Vcf.lazy(), chain the operations,
+    and run them with collect().
+
+    Consecutive filter(), filter_by_id() and drop_by_id() calls are fused into
+    a single id set, which is evaluated on the object the chain starts from,
+    without creating intermediate objects. The records are selected once,
+    before the next operation which needs them (e.g. breakend2breakpoint())
+    or at the end of the plan, and each table is filtered only when it is accessed.
+
+    The result of collect() is equal to that of the same chain of eager calls.
+    Errors in the queries are raised by collect().
+
+    Parameters
+    ----------
+    obj: Bedpe or Vcf
+        The object the plan starts from. It is never modified.
+    """
+    def __init__(self, obj, ls_steps=None):
+        self._obj = obj
+        self._ls_steps = [] if ls_steps is None else ls_steps
+
+    def _add_step(self, kind: str, description: str, func: Callable):
+        return LazyPlan(self._obj, self._ls_steps + [(kind, description, func)])
+
+    def filter(self, ls_query, query_logic: str = 'and'):
+        """
+        filter(ls_query, query_logic='and')
+        Add Bedpe.filter() / Vcf.filter() to the plan.
+        """
+        if isinstance(ls_query, str):
+            ls_query = [ls_query]
+        ls_query = list(ls_query)
+        description = 'filter({}, query_logic={})'.format(ls_query, repr(query_logic))
+        return self._add_step('select', description, lambda obj, set_ids: _intersect(set_ids, obj._filter(ls_query, query_logic)))
+
+    def filter_by_id(self, arrlike_id):
+        """
+        filter_by_id(arrlike_id)
+        Add filter_by_id() to the plan.
+        """
+        set_arg = set(arrlike_id)
+        description = 'filter_by_id({} ids)'.format(len(set_arg))
+        return self._add_step('select', description, lambda obj, set_ids: _intersect(set_ids, set_arg))
+
+    def drop_by_id(self, svid):
+        """
+        drop_by_id(svid)
+        Add drop_by_id() to the plan.
+        """
+        if not isinstance(svid, list):
+            svid = [svid]
+        set_arg = set(svid)
+        description = 'drop_by_id({} ids)'.format(len(set_arg))
+        def _drop(obj, set_ids):
+            if set_ids is None:
+                set_ids = set(obj.ids)
+            return set_ids - set_arg
+        return self._add_step('select', description, _drop)
+
+    def breakend2breakpoint(self):
+        """
+        breakend2breakpoint()
+        Add Vcf.breakend2breakpoint() to the plan.
+        """
+        self._check_method('breakend2breakpoint')
+        return self._add_step('apply', 'breakend2breakpoint()', lambda obj: obj.breakend2breakpoint())
+
+    def classify_manual_svtype(self, definitions=None, ls_conditions=None, ls_names=None):
+        """
+        classify_manual_svtype(definitions=None, ls_conditions=None, ls_names=None)
+        Add classify_manual_svtype() to the plan.
+        The collected object has the 'manual_sv_type' INFO.
+        Use get_feature_count_as_series() on it to count the classes.
+        """
+        self._check_method('classify_manual_svtype')
+        kwargs = {'definitions': definitions, 'ls_conditions': ls_conditions, 'ls_names': ls_names}
+        return self._add_inplace_step('classify_manual_svtype', kwargs)
+
+    def annotate_bed(self, bed, annotation: str, **kwargs):
+        """
+        annotate_bed(bed, annotation, **kwargs)
+        Add annotate_bed() to the plan.
+        """
+        self._check_method('annotate_bed')
+        kwargs = dict(kwargs, bed=bed, annotation=annotation)
+        return self._add_inplace_step('annotate_bed', kwargs)
+
+    def calculate_info(self, operation: str, name: str):
+        """
+        calculate_info(operation, name)
+        Add Bedpe.calculate_info() to the plan.
+        """
+        self._check_method('calculate_info')
+        return self._add_inplace_step('calculate_info', {'operation': operation, 'name': name})
+
+    def _add_inplace_step(self, method_name: str, kwargs):
+        # methods which add INFO tables to the object instead of returning a new one.
+        method = getattr(self._obj, method_name)
+        ls_params = inspect.signature(method).parameters
+        for param in ('return_series', 'return_data_frame'):
+            if param in ls_params:
+                kwargs = dict(kwargs, **{param: False})
+        description = '{}({})'.format(method_name, ', '.join(
+            '{}={}'.format(k, _short_repr(v)) for k, v in kwargs.items() if not k.startswith('return_')
+        ))
+        def _apply(obj):
+            out = obj.copy()
+            getattr(out, method_name)(**kwargs)
+            return out
+        return self._add_step('apply', description, _apply)
+
+    def _check_method(self, method_name: str):
+        if not hasattr(type(self._obj), method_name):
+            raise AttributeError("'{}' object has no attribute '{}'".format(type(self._obj).__name__, method_name))
+
+    def _stages(self):
+        """
+        Group the steps into stages of (select steps, the apply step or None).
+        """
+        ls_stages = []
+        ls_select = []
+        for step in self._ls_steps:
+            if step[0] == 'select':
+                ls_select.append(step)
+            else:
+                ls_stages.append((ls_select, step))
+                ls_select = []
+        if ls_select:
+            ls_stages.append((ls_select, None))
+        return ls_stages
+
+    def explain(self) -> str:
+        """
+        explain()
+        Return the optimized plan as a string.
+        """
+        ls_lines = ['LazyPlan on {} ({} SV records)'.format(type(self._obj).__name__, self._obj.sv_count)]
+        for ls_select, apply_step in self._stages():
+            if ls_select:
+                ls_lines.append('  select records: ' + ' & '.join(step[1] for step in ls_select))
+            if apply_step is not None:
+                ls_lines.append('  ' + apply_step[1])
+        return '\n'.join(ls_lines)
+
+    def __repr__(self):
+        return self.explain()
+
+    def collect(self):
+        """
+        collect()
+        Run the plan and return the resulting object.
+        """
+        obj = self._obj
+        for ls_select, apply_step in self._stages():
+            if ls_select:
+                set_ids = None
+                for step in ls_select:
+                    set_ids = step[2](obj, set_ids)
+                obj = obj.filter_by_id(set_ids)
+            if apply_step is not None:
+                obj = apply_step[2](obj)
+        if obj is self._obj:
+            obj = obj.copy()
+        return obj
+
+def _intersect(set_ids: Optional[Set[IntOrStr]], set_other: Set[IntOrStr]) -> Set[IntOrStr]:
+    if set_ids is None:
+        return set(set_other)
+    return set_ids & set_other
+
+def _short_repr(value) -> str:
+    if isinstance(value, (list, tuple, set, np.ndarray)) and len(value) > 3:
+        return '<{} of {} items>'.format(type(value).__name__, len(value))
+    return repr(value)
@@ -5,6 +5,7 @@ from viola.core.vcf import Vcf
 from viola.core.bedpe import Bedpe
 from viola.core.cohort import MultiVcf
 from collections import OrderedDict
+from viola.core._table_store import TableStore, raw_values
 from typing import (
     List,
     Optional
@@ -217,15 +218,15 @@ class TmpVcfForMerge(MultiVcf):
         self._df_patients = df_patients
         self._df_svpos = df_svpos
         self._df_filters = df_filters
-        self._odict_df_info = odict_df_info
+        self._odict_df_info = TableStore(odict_df_info)
         self._df_formats = df_formats
         self._odict_df_headers = odict_df_headers
         self._ls_patients = df_patients['patients'].to_list()
         self._ls_infokeys = [x.lower() for x in list(odict_df_info.keys())]
         ls_keys = ['global_id', 'patients', 'positions', 'filters'] + self._ls_infokeys + ['formats'] + \
         list(odict_df_headers.keys())
-        ls_values = [df_id, df_patients, df_svpos, df_filters] + list(odict_df_info.values()) + [df_formats] + list(odict_df_headers.values())
-        self._odict_alltables = OrderedDict([(k, v) for k, v in zip(ls_keys, ls_values)])
+        ls_values = [df_id, df_patients, df_svpos, df_filters] + raw_values(odict_df_info) + [df_formats] + list(odict_df_headers.values())
+        self._odict_alltables = TableStore([(k, v) for k, v in zip(ls_keys, ls_values)])
         self._repr_config = {
             'info': None,
         }
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+class PositionIndex(object):
+    """
+    Per-chromosome sorted index on the breakend coordinates of a positions table.
+
+    For each breakend (1 and 2), the rows of the positions table are sorted
+    by (chrom, pos) once, so that range lookups are two binary searches
+    instead of a scan over the whole table.
+
+    Parameters
+    ----------
+    df_svpos: DataFrame
+        The positions table. 'id', 'chrom1', 'pos1', 'chrom2' and 'pos2' columns are required.
+    """
+    def __init__(self, df_svpos: pd.DataFrame):
+        self._ids = df_svpos['id'].values
+        self._n = df_svpos.shape[0]
+        self._index = {}
+        for position_num in (1, 2):
+            arr_chrom = df_svpos['chrom{}'.format(position_num)].values
+            arr_pos = df_svpos['pos{}'.format(position_num)].values
+            codes, uniques = pd.factorize(arr_chrom)
+            order = np.lexsort((arr_pos, codes))
+            arr_pos_sorted = arr_pos[order]
+            arr_bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            dict_chrom = {}
+            for i, chrom in enumerate(uniques):
+                st, en = arr_bounds[i], arr_bounds[i+1]
+                dict_chrom[chrom] = (arr_pos_sorted[st:en], order[st:en])
+            self._index[position_num] = dict_chrom
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def ids(self) -> np.ndarray:
+        """
+        Return SV ids in the order of the positions table.
+        """
+        return self._ids
+
+    def query_rows(self, position_num: int, chrom: str, start=None, end=None, closed: bool = False) -> np.ndarray:
+        """
+        query_rows(position_num, chrom, start=None, end=None, closed=False)
+        Return row numbers of the positions table whose breakend lies in the range.
+
+        Parameters
+        ----------
+        position_num: int
+            1 for the first breakend and 2 for the other.
+        chrom: str
+            Chromosome name.
+        start: int or None
+            Lower bound (inclusive). None means no lower bound.
+        end: int or None
+            Upper bound. None means no upper bound.
+        closed: bool, default False
+            If True, the upper bound is inclusive, otherwise exclusive.
+
+        Returns
+        ----------
+        ndarray
+            Row numbers sorted by the breakend coordinate.
+        """
+        entry = self._index[position_num].get(chrom)
+        if entry is None:
+            return np.array([], dtype=np.int64)
+        arr_pos, arr_rows = entry
+        lo = 0 if start is None else np.searchsorted(arr_pos, start, side='left')
+        if end is None:
+            hi = arr_pos.shape[0]
+        else:
+            hi = np.searchsorted(arr_pos, end, side='right' if closed else 'left')
+        return arr_rows[lo:hi]
+
+    def query(self, position_num: int, chrom: str, start=None, end=None, closed: bool = False) -> np.ndarray:
+        """
+        query(position_num, chrom, start=None, end=None, closed=False)
+        Return SV ids whose breakend lies in the range. See query_rows() for the arguments.
+        """
+        return self._ids[self.query_rows(position_num, chrom, start, end, closed)]
+
+    def query_many_rows(self, position_num: int, chrom: str, starts, ends, closed: bool = False):
+        """
+        query_many_rows(position_num, chrom, starts, ends, closed=False)
+        Vectorized query_rows() for many ranges on the same chromosome.
+
+        Parameters
+        ----------
+        position_num: int
+            1 for the first breakend and 2 for the other.
+        chrom: str
+            Chromosome name.
+        starts: array_like
+            Lower bounds (inclusive).
+        ends: array_like
+            Upper bounds.
+        closed: bool, default False
+            If True, the upper bounds are inclusive, otherwise exclusive.
+
+        Returns
+        ----------
+        Tuple[ndarray, ndarray]
+            (range numbers, row numbers) of all hits.
+        """
+        starts = np.asarray(starts)
+        ends = np.asarray(ends)
+        entry = self._index[position_num].get(chrom)
+        if entry is None or starts.shape[0] == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        arr_pos, arr_rows = entry
+        arr_lo = np.searchsorted(arr_pos, starts, side='left')
+        arr_hi = np.searchsorted(arr_pos, ends, side='right' if closed else 'left')
+        arr_counts = np.maximum(arr_hi - arr_lo, 0)
+        arr_range = np.repeat(np.arange(starts.shape[0], dtype=np.int64), arr_counts)
+        arr_offsets = np.concatenate([[0], np.cumsum(arr_counts)[:-1]])
+        arr_sorted_idx = np.arange(arr_range.shape[0], dtype=np.int64) - np.repeat(arr_offsets, arr_counts) + np.repeat(arr_lo, arr_counts)
+        return arr_range, arr_rows[arr_sorted_idx]
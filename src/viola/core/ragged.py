@@ -0,0 +1,243 @@
+import numpy as np
+import pandas as pd
+from typing import (
+    Iterable,
+    Optional,
+)
+
+class RaggedInfo(object):
+    """
+    Compact, column-oriented representation of a single INFO table.
+
+    The long-form INFO table, one row per (id, value_idx), is stored as
+    three flat arrays:
+
+    * ``ids``: the unique SV ids, in order of first appearance.
+    * ``offsets``: int64 array of length ``len(ids) + 1``. The values of
+      ``ids[i]`` are ``values[offsets[i]:offsets[i+1]]``.
+    * ``values``: the INFO values, keeping the dtype of the long table.
+
+    Multi-valued INFO such as CIPOS/CIEND therefore cost one id per SV record
+    instead of one id per value, and the wide form needed by append_infos()
+    is a plain reshape when every SV record has the same number of values.
+
+    Parameters
+    ----------
+    name: str
+        The name of the INFO (lowercase), which is also the name of the value
+        column in the long form.
+    ids: array_like
+        Unique SV ids.
+    offsets: array_like
+        Start offsets of each SV record in ``values`` followed by ``len(values)``.
+    values: array_like
+        Flat INFO values.
+    """
+    def __init__(self, name: str, ids, offsets, values):
+        ids = np.asarray(ids, dtype=object)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        values = np.asarray(values)
+        if offsets.shape[0] != ids.shape[0] + 1:
+            raise ValueError('The length of "offsets" should be len(ids) + 1.')
+        if offsets[0] != 0 or offsets[-1] != values.shape[0]:
+            raise ValueError('"offsets" should start at 0 and end at len(values).')
+        self._name = name
+        self._ids = ids
+        self._offsets = offsets
+        self._values = values
+
+    @classmethod
+    def from_long(cls, df: pd.DataFrame, name: Optional[str] = None):
+        """
+        from_long(df, name=None)
+        Build a RaggedInfo from a long-form INFO table.
+
+        Parameters
+        ----------
+        df: DataFrame
+            INFO table whose columns are ['id', 'value_idx', name].
+        name: str, optional
+            The name of the INFO. The third column name is used if omitted.
+
+        Returns
+        ----------
+        RaggedInfo
+
+        Raises
+        ----------
+        ValueError
+            If the 'value_idx' of any SV record is not 0, 1, ..., n-1.
+        """
+        if name is None:
+            name = df.columns[2]
+        arr_id = df['id'].values
+        arr_value_idx = df['value_idx'].values.astype(np.int64)
+        arr_values = df[name].values
+        codes, uniques = pd.factorize(arr_id)
+        if (codes < 0).any():
+            raise ValueError('Missing SV ids cannot be stored in a RaggedInfo.')
+        # sort by (id in order of appearance, value_idx) while keeping the
+        # original row order of already grouped tables.
+        order = np.lexsort((arr_value_idx, codes))
+        codes = codes[order]
+        arr_value_idx = arr_value_idx[order]
+        counts = np.bincount(codes, minlength=len(uniques))
+        offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        expected_idx = np.arange(codes.shape[0], dtype=np.int64) - np.repeat(offsets[:-1], counts)
+        if not np.array_equal(arr_value_idx, expected_idx):
+            raise ValueError('The "value_idx" of the INFO "{}" is not contiguous.'.format(name))
+        if np.array_equal(order, np.arange(order.shape[0])):
+            values = arr_values
+        else:
+            values = arr_values[order]
+        return cls(name, np.asarray(uniques, dtype=object), offsets, values)
+
+    @property
+    def name(self) -> str:
+        """
+        Return the name of the INFO.
+        """
+        return self._name
+
+    @property
+    def ids(self) -> np.ndarray:
+        """
+        Return the unique SV ids.
+        """
+        return self._ids
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """
+        Return the offsets array.
+        """
+        return self._offsets
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Return the flat values array.
+        """
+        return self._values
+
+    @property
+    def dtype(self):
+        """
+        Return the dtype of the INFO values.
+        """
+        return self._values.dtype
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """
+        Return the number of values of each SV record.
+        """
+        return np.diff(self._offsets)
+
+    @property
+    def columns(self) -> pd.Index:
+        """
+        Return the column names of the long form.
+        """
+        return pd.Index(['id', 'value_idx', self._name])
+
+    @property
+    def empty(self) -> bool:
+        return self._values.shape[0] == 0
+
+    @property
+    def shape(self):
+        """
+        Return the shape of the long form.
+        """
+        return (self._values.shape[0], 3)
+
+    def __len__(self):
+        return self._values.shape[0]
+
+    def __repr__(self):
+        return 'RaggedInfo(name={}, n_ids={}, n_values={})'.format(self._name, self._ids.shape[0], self._values.shape[0])
+
+    def copy(self):
+        """
+        copy()
+        Return a copy of the instance.
+        """
+        return RaggedInfo(self._name, self._ids.copy(), self._offsets.copy(), self._values.copy())
+
+    def rename(self, name: str):
+        """
+        rename(name)
+        Return a RaggedInfo with a new INFO name. The arrays are shared.
+        """
+        return RaggedInfo(name, self._ids, self._offsets, self._values)
+
+    def replace_id(self, to_replace, value):
+        """
+        replace_id(to_replace, value)
+        Return a RaggedInfo whose SV id "to_replace" is renamed into "value".
+        The offsets and values arrays are shared.
+        """
+        mask = self._ids == to_replace
+        if not mask.any():
+            return self
+        ids = self._ids.copy()
+        ids[mask] = value
+        return RaggedInfo(self._name, ids, self._offsets, self._values)
+
+    def to_long(self) -> pd.DataFrame:
+        """
+        to_long()
+        Return the INFO table in the long form.
+
+        Returns
+        ----------
+        DataFrame
+            A DataFrame with the columns ['id', 'value_idx', name].
+        """
+        lengths = self.lengths
+        arr_id = np.repeat(self._ids, lengths)
+        arr_value_idx = np.arange(self._values.shape[0], dtype=np.int64) - np.repeat(self._offsets[:-1], lengths)
+        return pd.DataFrame({'id': arr_id, 'value_idx': arr_value_idx, self._name: self._values})
+
+    def to_wide(self) -> pd.DataFrame:
+        """
+        to_wide()
+        Return the INFO table in the wide form.
+        The index is SV id and the columns are value_idx.
+        Missing values are filled with NaN in the same manner as DataFrame.pivot.
+
+        Returns
+        ----------
+        DataFrame
+        """
+        n_ids = self._ids.shape[0]
+        lengths = self.lengths
+        n_cols = int(lengths.max()) if n_ids > 0 else 0
+        index = pd.Index(self._ids, name='id')
+        if n_ids > 0 and (lengths == n_cols).all():
+            arr_wide = self._values.reshape(n_ids, n_cols)
+        else:
+            if self._values.dtype.kind in 'iuf':
+                arr_wide = np.full((n_ids, n_cols), np.nan, dtype=np.float64)
+            else:
+                arr_wide = np.full((n_ids, n_cols), np.nan, dtype=object)
+            rows = np.repeat(np.arange(n_ids), lengths)
+            cols = np.arange(self._values.shape[0], dtype=np.int64) - np.repeat(self._offsets[:-1], lengths)
+            arr_wide[rows, cols] = self._values
+        return pd.DataFrame(arr_wide, index=index, columns=pd.RangeIndex(n_cols))
+
+    def filter_by_id(self, arrlike_id: Iterable):
+        """
+        filter_by_id(arrlike_id)
+        Return a RaggedInfo that contains only the SV ids in arrlike_id.
+        """
+        mask = pd.Index(self._ids).isin(arrlike_id)
+        if mask.all():
+            return self
+        lengths = self.lengths[mask]
+        offsets = np.zeros(lengths.shape[0] + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        value_mask = np.repeat(mask, self.lengths)
+        return RaggedInfo(self._name, self._ids[mask], offsets, self._values[value_mask])
@@ -14,7 +14,9 @@ import viola
 from viola.core.indexing import Indexer
 from viola.core.bed import Bed
 from viola.core.fasta import Fasta
-from viola.core.bedpe import Bedpe
+from viola.core.bedpe import Bedpe, _join_info_wide
+from viola.core.ragged import RaggedInfo
+from viola.core._table_store import TableStore, raw_values
 from viola.utils.microhomology import get_microhomology_from_positions
 from viola.utils.utils import get_inslen_and_insseq_from_alt
 from viola._typing import (
@@ -31,7 +33,6 @@ from viola._exceptions import (
     TableValueConfliction,
 )
 
-from sklearn.cluster import AgglomerativeClustering
 
 class Vcf(Bedpe):
     """
@@ -105,15 +106,18 @@ class Vcf(Bedpe):
         "svtype",
     ]
     _repr_column_names_set = set(_repr_column_names)
+    _view_doc_name = 'Vcf'
+    _view_doc_link = 'https://dermasugita.github.io/ViolaDocs/docs/html/reference/vcf.html'
     def __init__(self, df_svpos, df_filters, odict_df_info, df_formats, odict_df_headers = {}, metadata = None, patient_name = None):
         if not isinstance(odict_df_info, OrderedDict):
             raise TypeError('the type of the argument "odict_df_info" should be collections.OrderedDict')
         if not isinstance(odict_df_headers, OrderedDict):
             raise TypeError('the type of the argument "odict_df_headers" should be collections.OrderedDict')
-        df_svpos['alt'] = df_svpos['alt'].astype(str)
+        if pd.api.types.infer_dtype(df_svpos['alt'], skipna=False) != 'string':
+            df_svpos['alt'] = df_svpos['alt'].astype(str)
         self._df_svpos = df_svpos
         self._df_filters = df_filters
-        self._odict_df_info = odict_df_info
+        self._odict_df_info = TableStore(odict_df_info)
         self._df_formats = df_formats
         self._odict_df_headers = odict_df_headers
         self._metadata = metadata
@@ -121,9 +125,9 @@ class Vcf(Bedpe):
         self._ls_infokeys = [ x.lower() for x in odict_df_headers['infos_meta']['id'].tolist()]
         ls_keys = ['positions', 'filters'] + self._ls_infokeys + ['formats'] + \
         list(odict_df_headers.keys())
-        ls_values = [df_svpos, df_filters] + list(odict_df_info.values()) + [df_formats] + list(odict_df_headers.values())
+        ls_values = [df_svpos, df_filters] + raw_values(odict_df_info) + [df_formats] + list(odict_df_headers.values())
         # self._odict_alltables is a {tablename: table} dictionary
-        self._odict_alltables = OrderedDict([(k, v) for k, v in zip(ls_keys, ls_values)])
+        self._odict_alltables = TableStore([(k, v) for k, v in zip(ls_keys, ls_values)])
         self._repr_config = {
             'info': None,
         }
@@ -142,40 +146,6 @@ class Vcf(Bedpe):
     def __str__(self):
         return super().__repr__() 
 
-    def view(self, custom_infonames=None, return_as_dataframe=False):
-        """
-        view(custom_infonames, return_as_dataframe)
-        Quick view function of the Vcf object.
-
-        Parameters
-        -----------
-        custom_infonames: list_like or None, default None
-            The names of the INFO to show additionally.
-        return_as_dataframe: bool, default False
-            If true, return as pandas DataFrame.
-        """
-        df_svpos = self.get_table('positions')
-        ser_id = df_svpos['id']
-        ser_be1 = df_svpos['chrom1'].astype(str) + ':' + df_svpos['pos1'].astype(str)
-        ser_be2 = df_svpos['chrom2'].astype(str) + ':' + df_svpos['pos2'].astype(str)
-        ser_strand = df_svpos['strand1'] + df_svpos['strand2']
-        ser_qual = df_svpos['qual']
-        ser_svtype = df_svpos['svtype']
-        ls_ser = [ser_id, ser_be1, ser_be2, ser_strand, ser_qual, ser_svtype]
-        ls_key = ['id', 'be1', 'be2', 'strand', 'qual', 'svtype']
-        dict_ = {k: v for k, v in zip(ls_key, ls_ser)}
-        df_out = pd.DataFrame(dict_)
-        if custom_infonames is not None:
-            df_out = self.append_infos(df_out, ls_tablenames=custom_infonames)
-        str_df_out = str(df_out)
-        str_infokeys = ','.join(list(self._ls_infokeys))
-        desc_info = 'INFO='
-        desc_doc = 'Documentation of Vcf object ==> '
-        doc_link = 'https://dermasugita.github.io/ViolaDocs/docs/html/reference/vcf.html'
-        out = desc_info + str_infokeys + '\n' + desc_doc + doc_link + '\n' + str_df_out
-        if return_as_dataframe:
-            return df_out
-        return str(out)
 
     def replace_svid(self, to_replace, value):
         """
@@ -201,11 +171,17 @@ class Vcf(Bedpe):
         set_table_list_without_header = set_table_list - set_table_list_header
         for rep, val in zip(to_replace, value):
             for table_name in set_table_list_without_header:
-                df_target = self._odict_alltables[table_name]
-                df_target.loc[df_target['id'] == rep, 'id'] = val
+                df_target = self._odict_alltables.get_raw(table_name)
+                if isinstance(df_target, RaggedInfo):
+                    df_target = df_target.replace_id(rep, val)
+                else:
+                    # the table may be shared with other objects.
+                    df_target = df_target.copy()
+                    df_target.loc[df_target['id'] == rep, 'id'] = val
                 self._odict_alltables[table_name] = df_target
                 if table_name in self._ls_infokeys:
                     self._odict_df_info[table_name.upper()] = df_target
+        self._invalidate_cache()
 
 
     
@@ -219,6 +195,7 @@ class Vcf(Bedpe):
         df_replace = pd.concat([df_meta, pd.DataFrame({'id': [table_name.upper()], 'number': [number], 'type': [type_], 'description': [description], 'source': [source], 'version': [version]})], ignore_index=True)
         self._odict_df_headers['infos_meta'] = df_replace
         self._odict_alltables['infos_meta'] = df_replace # not beautiful code...
+        self._invalidate_cache(table_name)
     
     def remove_info_table(self, table_name):
         del self._odict_df_info[table_name.upper()]
@@ -228,6 +205,7 @@ class Vcf(Bedpe):
         self._odict_df_headers['infos_meta'] = df_replace
         self._odict_alltables['infos_meta'] = df_replace
         self._ls_infokeys.remove(table_name)
+        self._invalidate_cache(table_name)
 
     def rename_info(self, table_name, value, safety_mode=True):
         '''
@@ -288,15 +266,22 @@ class Vcf(Bedpe):
         if value in self.table_list:
             raise TableValueConfliction('The table "' + value + '" already exists.')
         ## /Input value validation
-        self._odict_alltables[value] = self._odict_alltables.pop(table_name)
+        table = self._odict_alltables.pop_raw(table_name)
+        self._odict_df_info.pop_raw(table_name.upper())
+        if isinstance(table, RaggedInfo):
+            table = table.rename(value)
+        else:
+            # the table may be shared with other objects.
+            table = table.set_axis(['id', 'value_idx', value], axis=1)
+        self._odict_alltables[value] = table
         self._ls_infokeys = [value if i == table_name else i for i in self._ls_infokeys]
-        self._odict_alltables[value].columns = ['id', 'value_idx', value]
-        self._odict_df_info[value.upper()] = self._odict_df_info.pop(table_name.upper())
-        self._odict_df_info[value.upper()].columns = ['id', 'value_idx', value]
-        ### df_infos_meta is the "view" of the infos_meta table
-        ### The change of the value in this variable consequently results in the change of the involving items of OrderedDicts of this class.
-        df_infos_meta = self._odict_alltables['infos_meta']
+        self._odict_df_info[value.upper()] = table
+        self._invalidate_cache(table_name)
+        self._invalidate_cache(value)
+        df_infos_meta = self.get_table('infos_meta')
         df_infos_meta.loc[df_infos_meta.id == table_name.upper(), 'id'] = value.upper()
+        self._odict_df_headers['infos_meta'] = df_infos_meta
+        self._odict_alltables['infos_meta'] = df_infos_meta
 
 
     def set_value_for_info_by_id(self, table_name, sv_id, value_idx=0, value=None):
@@ -374,12 +359,14 @@ class Vcf(Bedpe):
         """
         copy()
         Return copy of the instance.
+        The tables are shared with the instance instead of being copied,
+        since they are never modified in place.
         """
-        df_svpos = self.get_table('positions')
-        df_filters = self.get_table('filters')
-        odict_df_infos = OrderedDict([(k, self.get_table(k.lower())) for k, v in self._odict_df_info.items()])
-        df_formats = self.get_table('formats')
-        odict_df_headers = OrderedDict([(k, self.get_table(k)) for k,v in self._odict_df_headers.items()])
+        df_svpos = self._odict_alltables.get_raw('positions')
+        df_filters = self._odict_alltables.get_stored('filters')
+        odict_df_infos = OrderedDict([(k, self._odict_alltables.get_stored(k.lower())) for k in self._odict_df_info.keys()])
+        df_formats = self._odict_alltables.get_stored('formats')
+        odict_df_headers = OrderedDict(self._odict_df_headers)
         metadata = self._metadata
         patient_name = self.patient_name
         return Vcf(df_svpos, df_filters, odict_df_infos, df_formats, odict_df_headers, metadata, patient_name)
@@ -681,7 +668,7 @@ class Vcf(Bedpe):
         """
         df_svpos = self.get_table('positions')
         odict_df_info_view = self._odict_df_info
-        odict_df_info = OrderedDict((k, v.copy()) for k, v in odict_df_info_view.items())
+        odict_df_info = OrderedDict((k, v.copy()) for k, v in odict_df_info_view.raw_items())
         bedpe = Bedpe(df_svpos, odict_df_info)
         return bedpe
 
@@ -715,10 +702,8 @@ class Vcf(Bedpe):
         df = base_df.copy()
         df_infometa = self.get_table('infos_meta')
         for tablename in ls_tablenames:
-            df_to_append_pre = self.get_table(tablename)
-            df_to_append_pre['new_column_names'] = tablename + '_' + df_to_append_pre['value_idx'].astype(str)
-            df_to_append = df_to_append_pre.pivot(index='id', columns='new_column_names', values=tablename)
-            df = pd.merge(df, df_to_append, how='left', left_on=left_on, right_index=True)
+            df_to_append, _ = self._get_info_wide(tablename)
+            df = _join_info_wide(df, df_to_append, left_on, keep_index=True)
             info_dtype = df_infometa.loc[df_infometa['id']==tablename.upper(), 'type'].iloc[0]
             len_info = df_to_append.shape[1]
             ls_ind_fancy = [tablename + '_' + str(i) for i in range(len_info)]
@@ -895,42 +880,16 @@ class Vcf(Bedpe):
         Return object is also an instance of the Vcf object
         """
         ### != operation is dangerous
-        if isinstance(ls_query, str):
-            ls_query = [ls_query]
-        if query_logic == 'and':
-            set_result = self.get_ids()
-            for query in ls_query:
-                set_query = self._parse_filter_query(query)
-                if set_query is None:
-                    set_query = set()
-                set_result = set_result & set_query
-        elif query_logic == 'or':
-            set_result = set()
-            for query in ls_query:
-                set_query = self._parse_filter_query(query)
-                if set_query is None:
-                    set_query = set()
-                set_result = set_result | set_query
-        else:
-            ls_set_query = [self._parse_filter_query(q) for q in ls_query]
-            ls_set_query = [set() if q is None else q for q in ls_set_query]
-            pattern = re.compile('([^0-9]*)([0-9]+)([^0-9]*)')
-            target = r"\1ls_set_query[\2]\3"
-            expr = pattern.sub(target, query_logic)
-            set_result = eval(expr)
-
+        set_result = self._filter(ls_query, query_logic)
         out = self.filter_by_id(set_result)
         return out
 
-    def _filter_by_id(self, tablename, arrlike_id):
-        df = self.get_table(tablename)
-        return df.loc[df['id'].isin(arrlike_id)].reset_index(drop=True)
-
     def filter_by_id(self, arrlike_id):
         """
         filter_by_id(arrlike_id)
         Filter Vcf object according to the list of SV ids.
-        Return object is also an instance of the Vcf object
+        Return object is also an instance of the Vcf object.
+        The tables other than positions are filtered when they are accessed for the first time.
 
         Parameters
         ---------------
@@ -945,9 +904,9 @@ class Vcf(Bedpe):
         
         """
         out_svpos = self._filter_by_id('positions', arrlike_id)
-        out_filters = self._filter_by_id('filters', arrlike_id)
-        out_odict_df_info = OrderedDict([(k.upper(), self._filter_by_id(k, arrlike_id)) for k in self._ls_infokeys])
-        out_formats = self._filter_by_id('formats', arrlike_id)
+        out_filters = self._select_by_id('filters', arrlike_id)
+        out_odict_df_info = OrderedDict([(k.upper(), self._select_by_id(k, arrlike_id)) for k in self._ls_infokeys])
+        out_formats = self._select_by_id('formats', arrlike_id)
         out_odict_df_headers = self._odict_df_headers.copy()
         out_metadata = self._metadata
         out_patient_name = self.patient_name
@@ -1200,8 +1159,8 @@ class Vcf(Bedpe):
         positions_table = multiobject.get_table("positions")
         N = len(positions_table)
         distance_matrix = np.full((N,N), penalty_length)
-        df_cipos = multiobject.get_table('cipos').pivot(values='cipos', index='id', columns='value_idx').astype(int)
-        df_ciend = multiobject.get_table('ciend').pivot(values='ciend', index='id', columns='value_idx').astype(int)
+        df_cipos = multiobject._get_info_ragged('cipos').to_wide().astype(int)
+        df_ciend = multiobject._get_info_ragged('ciend').to_wide().astype(int)
         positions_table.set_index('id', inplace=True)
         ind = positions_table.index.to_list()
         ser_pos1_chrom = positions_table['chrom1']
@@ -1218,8 +1177,9 @@ class Vcf(Bedpe):
         df_pos2_ci.columns = ['chrom', 'chromStart', 'chromEnd', 'strand']
         df_pos1_ci.reset_index(inplace=True)
         df_pos2_ci.reset_index(inplace=True)
-        bed_pos1 = viola.IntervalTreeForMerge(df_pos1_ci, 0)
-        bed_pos2 = viola.IntervalTreeForMerge(df_pos2_ci, 0)
+        from viola.core.merge import IntervalTreeForMerge
+        bed_pos1 = IntervalTreeForMerge(df_pos1_ci, 0)
+        bed_pos2 = IntervalTreeForMerge(df_pos2_ci, 0)
         
         id_int = 0
         for idx in range(N):
@@ -1291,7 +1251,10 @@ class Vcf(Bedpe):
         if ls_caller_names is None:
             ls_caller_names = [vcf._metadata["variantcaller"] for vcf in ls_vcf] 
 
-        multivcf = viola.TmpVcfForMerge(ls_vcf, ls_caller_names)
+        # viola.core.merge imports this module, and scikit-learn is imported here to keep "import viola" fast.
+        from viola.core.merge import TmpVcfForMerge
+        from sklearn.cluster import AgglomerativeClustering
+        multivcf = TmpVcfForMerge(ls_vcf, ls_caller_names)
         if mode == 'distance':
             distance_matrix = self._generate_distance_matrix_by_distance(multivcf, penalty_length=3e9, str_missing=str_missing)
             hcl_clustering_model = AgglomerativeClustering(n_clusters=None, affinity="precomputed", linkage=linkage, distance_threshold=threshold)
@@ -0,0 +1,163 @@
+"""
+Minimal pure-Python reader of BGZF (blocked gzip) files.
+
+A BGZF file is a series of gzip members of at most 64 KiB each. A position in
+the uncompressed stream is addressed by a "virtual offset",
+``(compressed offset of the block << 16) | offset within the block``,
+which is what tabix/CSI indices store.
+"""
+import struct
+import zlib
+from collections import OrderedDict
+
+_BGZF_MAGIC = b'\x1f\x8b\x08\x04'
+_GZIP_MAGIC = b'\x1f\x8b'
+
+def is_gzip(header: bytes) -> bool:
+    """
+    Return True if the bytes start with the gzip magic number.
+    """
+    return header[:2] == _GZIP_MAGIC
+
+def is_bgzf(header: bytes) -> bool:
+    """
+    Return True if the bytes look like the header of a BGZF block.
+    """
+    if len(header) < 18 or header[:4] != _BGZF_MAGIC:
+        return False
+    xlen = struct.unpack('<H', header[10:12])[0]
+    extra = header[12:12 + xlen]
+    i = 0
+    while i + 4 <= len(extra):
+        si1, si2, slen = extra[i], extra[i + 1], struct.unpack('<H', extra[i + 2:i + 4])[0]
+        if si1 == 66 and si2 == 67 and slen == 2:
+            return True
+        i += 4 + slen
+    return False
+
+def split_virtual_offset(voffset: int):
+    """
+    Return (compressed offset of the block, offset within the uncompressed block).
+    """
+    return voffset >> 16, voffset & 0xFFFF
+
+def make_virtual_offset(coffset: int, uoffset: int) -> int:
+    return (coffset << 16) | uoffset
+
+
+class BgzfReader(object):
+    """
+    Random access reader of a BGZF file.
+
+    Parameters
+    ----------
+    fileobj: binary file object
+        Seekable file object opened in binary mode.
+    max_cache: int, default 128
+        Maximum number of decompressed blocks kept in memory.
+    """
+    def __init__(self, fileobj, max_cache: int = 128):
+        self._f = fileobj
+        self._max_cache = max_cache
+        self._cache = OrderedDict()
+
+    @classmethod
+    def open(cls, path: str, max_cache: int = 128):
+        return cls(open(path, 'rb'), max_cache=max_cache)
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _read_block(self, coffset: int):
+        """
+        Return (decompressed data, compressed offset of the next block).
+        An empty bytes object is returned at EOF.
+        """
+        cached = self._cache.get(coffset)
+        if cached is not None:
+            self._cache.move_to_end(coffset)
+            return cached
+        self._f.seek(coffset)
+        header = self._f.read(12)
+        if len(header) < 12:
+            return b'', coffset
+        if header[:4] != _BGZF_MAGIC:
+            raise ValueError('Invalid BGZF block at offset {}.'.format(coffset))
+        xlen = struct.unpack('<H', header[10:12])[0]
+        extra = self._f.read(xlen)
+        bsize = None
+        i = 0
+        while i + 4 <= len(extra):
+            si1, si2, slen = extra[i], extra[i + 1], struct.unpack('<H', extra[i + 2:i + 4])[0]
+            if si1 == 66 and si2 == 67 and slen == 2:
+                bsize = struct.unpack('<H', extra[i + 4:i + 6])[0]
+            i += 4 + slen
+        if bsize is None:
+            raise ValueError('BGZF block at offset {} lacks the BC field.'.format(coffset))
+        cdata_size = bsize - xlen - 19
+        cdata = self._f.read(cdata_size)
+        self._f.read(8)  # CRC32 and ISIZE
+        data = zlib.decompress(cdata, -15)
+        result = (data, coffset + bsize + 1)
+        self._cache[coffset] = result
+        if len(self._cache) > self._max_cache:
+            self._cache.popitem(last=False)
+        return result
+
+    def iter_lines(self, voffset_beg: int = 0, voffset_end: int = None):
+        """
+        iter_lines(voffset_beg=0, voffset_end=None)
+        Iterate over (virtual offset of the line, line) from voffset_beg.
+        Iteration stops at the first line starting at or after voffset_end.
+
+        Lines are returned as bytes including the trailing newline.
+        """
+        coffset, uoffset = split_virtual_offset(voffset_beg)
+        data, next_coffset = self._read_block(coffset)
+        pending = b''
+        pending_voffset = None
+        while True:
+            if data == b'' and next_coffset == coffset:
+                # EOF
+                if pending:
+                    yield pending_voffset, pending
+                return
+            while uoffset < len(data):
+                line_voffset = make_virtual_offset(coffset, uoffset)
+                if pending_voffset is None and voffset_end is not None and line_voffset >= voffset_end:
+                    return
+                nl = data.find(b'\n', uoffset)
+                if nl < 0:
+                    if pending_voffset is None:
+                        pending_voffset = line_voffset
+                    pending += data[uoffset:]
+                    uoffset = len(data)
+                    break
+                if pending_voffset is None:
+                    yield line_voffset, data[uoffset:nl + 1]
+                else:
+                    yield pending_voffset, pending + data[uoffset:nl + 1]
+                    pending = b''
+                    pending_voffset = None
+                uoffset = nl + 1
+            coffset = next_coffset
+            uoffset = 0
+            data, next_coffset = self._read_block(coffset)
+
+    def read_header_lines(self, meta_char: bytes = b'#'):
+        """
+        read_header_lines(meta_char=b'#')
+        Return the header lines (lines starting with meta_char at the beginning of the file) as a list of bytes.
+        """
+        ls_header = []
+        for voffset, line in self.iter_lines(0):
+            if not line.startswith(meta_char):
+                break
+            ls_header.append(line)
+        return ls_header
@@ -0,0 +1,167 @@
+import io
+import queue
+import threading
+import zlib
+from viola.io._bgzf import is_gzip
+
+class _PrefixedRaw(io.RawIOBase):
+    """
+    Raw binary stream that returns the already consumed bytes "prefix" and
+    then the rest of "fileobj". Closing it does not close fileobj.
+    """
+    def __init__(self, prefix: bytes, fileobj):
+        self._prefix = prefix
+        self._f = fileobj
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._prefix:
+            n = min(len(b), len(self._prefix))
+            b[:n] = self._prefix[:n]
+            self._prefix = self._prefix[n:]
+            return n
+        data = self._f.read(len(b))
+        n = len(data)
+        b[:n] = data
+        return n
+
+
+class ThreadedGzipReader(io.RawIOBase):
+    """
+    Raw binary stream of the decompressed contents of a gzip or BGZF stream.
+
+    The compressed data is read and inflated on a background thread and handed
+    over through a bounded queue, so that decompression overlaps with parsing.
+    Multi-member gzip files such as BGZF are supported.
+
+    Parameters
+    ----------
+    fileobj: binary file object
+        Compressed stream.
+    close_fileobj: bool, default True
+        If True, fileobj is closed together with this stream.
+    chunk_size: int, default 1 MiB
+        Size of the compressed chunks read at once.
+    max_queue: int, default 8
+        Maximum number of decompressed chunks waiting to be consumed.
+    """
+    def __init__(self, fileobj, close_fileobj: bool = True, chunk_size: int = 1 << 20, max_queue: int = 8):
+        self._f = fileobj
+        self._close_fileobj = close_fileobj
+        self._chunk_size = chunk_size
+        self._queue = queue.Queue(max_queue)
+        self._stop = threading.Event()
+        self._buf = b''
+        self._pos = 0
+        self._eof = False
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _worker(self):
+        try:
+            d = zlib.decompressobj(31)
+            fed = False
+            while not self._stop.is_set():
+                chunk = self._f.read(self._chunk_size)
+                if not chunk:
+                    break
+                while chunk:
+                    fed = True
+                    out = d.decompress(chunk)
+                    if out:
+                        self._put(out)
+                    if d.eof:
+                        # the next gzip member (BGZF block) starts here
+                        chunk = d.unused_data
+                        d = zlib.decompressobj(31)
+                        fed = False
+                    else:
+                        chunk = b''
+            if fed and not d.eof:
+                raise EOFError('Compressed file ended before the end-of-stream marker was reached.')
+            self._put(None)
+        except BaseException as e:
+            self._put(e)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._pos >= len(self._buf):
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if item is None:
+                self._eof = True
+                return 0
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            self._buf = item
+            self._pos = 0
+        n = min(len(b), len(self._buf) - self._pos)
+        b[:n] = self._buf[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def close(self):
+        if self.closed:
+            return
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join()
+        if self._close_fileobj:
+            self._f.close()
+        super().close()
+
+
+def _text_stream(raw):
+    return io.TextIOWrapper(io.BufferedReader(raw), encoding='utf-8')
+
+def open_text(filepath_or_buffer):
+    """
+    open_text(filepath_or_buffer)
+    Open a plain, gzip or BGZF compressed file as a text stream.
+    Compression is detected by the magic bytes, not by the file extension.
+
+    Parameters
+    ----------
+    filepath_or_buffer: str or file-like object
+        Path to the file, a text stream (returned as is) or a binary stream.
+
+    Returns
+    ----------
+    text stream
+        Closing it closes the file opened from a path, but never closes
+        a stream passed as filepath_or_buffer.
+    """
+    if isinstance(filepath_or_buffer, io.TextIOBase):
+        return filepath_or_buffer
+    if isinstance(filepath_or_buffer, str):
+        f = open(filepath_or_buffer, 'rb')
+        if is_gzip(f.peek(2)[:2]):
+            return _text_stream(ThreadedGzipReader(f, close_fileobj=True))
+        f.close()
+        return open(filepath_or_buffer, 'r')
+    head = filepath_or_buffer.read(2)
+    if isinstance(head, str):
+        # text streams which are not io.TextIOBase
+        return io.StringIO(head + filepath_or_buffer.read())
+    raw = _PrefixedRaw(head, filepath_or_buffer)
+    if is_gzip(head):
+        return _text_stream(ThreadedGzipReader(raw, close_fileobj=False))
+    return _text_stream(raw)
@@ -0,0 +1,279 @@
+import os
+import re
+import struct
+import zlib
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+from viola.io._bgzf import BgzfReader
+
+class TabixIndex(object):
+    """
+    Pure-Python reader of tabix (.tbi) and CSI (.csi) indices.
+
+    Parameters
+    ----------
+    path: str
+        Path to the .tbi or .csi file.
+    """
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            data = _decompress_all(f.read())
+        magic = data[:4]
+        if magic == b'TBI\x01':
+            self._parse_tbi(data)
+        elif magic == b'CSI\x01':
+            self._parse_csi(data)
+        else:
+            raise ValueError('{} is neither a tabix nor a CSI index.'.format(path))
+
+    def _parse_tabix_conf(self, data, offset):
+        (self.format, self.col_seq, self.col_beg, self.col_end,
+         meta, self.skip, l_nm) = struct.unpack_from('<7i', data, offset)
+        offset += 28
+        self.meta_char = bytes([meta]) if meta > 0 else b'#'
+        names = data[offset:offset + l_nm].split(b'\x00')
+        self.names = [n.decode() for n in names if n != b'']
+        return offset + l_nm
+
+    def _parse_tbi(self, data):
+        self.min_shift = 14
+        self.depth = 5
+        n_ref = struct.unpack_from('<i', data, 4)[0]
+        offset = self._parse_tabix_conf(data, 8)
+        self._refs = []
+        for i in range(n_ref):
+            dict_bins = {}
+            n_bin = struct.unpack_from('<i', data, offset)[0]
+            offset += 4
+            for j in range(n_bin):
+                bin_, n_chunk = struct.unpack_from('<Ii', data, offset)
+                offset += 8
+                chunks = struct.unpack_from('<{}Q'.format(2 * n_chunk), data, offset)
+                offset += 16 * n_chunk
+                dict_bins[bin_] = list(zip(chunks[0::2], chunks[1::2]))
+            n_intv = struct.unpack_from('<i', data, offset)[0]
+            offset += 4
+            ioff = struct.unpack_from('<{}Q'.format(n_intv), data, offset)
+            offset += 8 * n_intv
+            self._refs.append((dict_bins, ioff, {}))
+
+    def _parse_csi(self, data):
+        self.min_shift, self.depth, l_aux = struct.unpack_from('<3i', data, 4)
+        offset = 16
+        if l_aux >= 28:
+            self._parse_tabix_conf(data, offset)
+        else:
+            self.format, self.col_seq, self.col_beg, self.col_end = 2, 1, 2, 0
+            self.meta_char = b'#'
+            self.skip = 0
+            self.names = []
+        offset += l_aux
+        n_ref = struct.unpack_from('<i', data, offset)[0]
+        offset += 4
+        self._refs = []
+        for i in range(n_ref):
+            dict_bins = {}
+            dict_loffset = {}
+            n_bin = struct.unpack_from('<i', data, offset)[0]
+            offset += 4
+            for j in range(n_bin):
+                bin_, loffset, n_chunk = struct.unpack_from('<IQi', data, offset)
+                offset += 16
+                chunks = struct.unpack_from('<{}Q'.format(2 * n_chunk), data, offset)
+                offset += 16 * n_chunk
+                dict_bins[bin_] = list(zip(chunks[0::2], chunks[1::2]))
+                dict_loffset[bin_] = loffset
+            self._refs.append((dict_bins, (), dict_loffset))
+
+    def _reg2bins(self, beg: int, end: int) -> List[int]:
+        # beg: 0-based inclusive, end: 0-based exclusive
+        ls_bins = []
+        end -= 1
+        s = self.min_shift + self.depth * 3
+        t = 0
+        for level in range(self.depth + 1):
+            b = t + (beg >> s)
+            e = t + (end >> s)
+            ls_bins.extend(range(b, e + 1))
+            s -= 3
+            t += 1 << (level * 3)
+        return ls_bins
+
+    def query_chunks(self, chrom: str, beg: int, end: int) -> List[Tuple[int, int]]:
+        """
+        query_chunks(chrom, beg, end)
+        Return sorted and merged (virtual offset begin, virtual offset end) chunks
+        that may contain records overlapping [beg, end) (0-based).
+        """
+        if chrom not in self.names:
+            return []
+        dict_bins, ioff, dict_loffset = self._refs[self.names.index(chrom)]
+        if len(ioff) > 0:
+            i = beg >> self.min_shift
+            min_off = ioff[i] if i < len(ioff) else ioff[-1]
+        else:
+            min_off = 0
+        ls_chunks = []
+        for bin_ in self._reg2bins(beg, end):
+            if bin_ not in dict_bins:
+                continue
+            for cbeg, cend in dict_bins[bin_]:
+                if cend > min_off:
+                    ls_chunks.append((cbeg, cend))
+        ls_chunks.sort()
+        ls_merged = []
+        for cbeg, cend in ls_chunks:
+            if ls_merged and cbeg <= ls_merged[-1][1]:
+                if cend > ls_merged[-1][1]:
+                    ls_merged[-1] = (ls_merged[-1][0], cend)
+            else:
+                ls_merged.append((cbeg, cend))
+        return ls_merged
+
+
+def _decompress_all(data: bytes) -> bytes:
+    # .tbi and .csi files are BGZF-compressed, i.e. concatenated gzip members.
+    out = []
+    while data:
+        d = zlib.decompressobj(31)
+        out.append(d.decompress(data))
+        data = d.unused_data
+    return b''.join(out)
+
+def find_index(path: str) -> Optional[str]:
+    """
+    Return the path of the tabix or CSI index of a bgzipped file, or None.
+    """
+    for suffix in ('.tbi', '.csi'):
+        if os.path.exists(path + suffix):
+            return path + suffix
+    return None
+
+_re_region = re.compile(r'^(?P<chrom>.+?)(:(?P<start>[0-9,]+)?(-(?P<end>[0-9,]+)?)?)?$')
+
+def parse_region(region) -> Tuple[str, int, int]:
+    """
+    parse_region(region)
+    Parse a region into (chrom, start, end) in 1-based closed coordinates.
+
+    "chr17", "chr17:1000-2000" (samtools/tabix style) and (chrom, start, end)
+    tuples are accepted. An omitted start or end means the chromosome end.
+    """
+    max_pos = (1 << 31) - 1
+    if isinstance(region, (tuple, list)):
+        chrom = region[0]
+        start = region[1] if len(region) > 1 and region[1] is not None else 1
+        end = region[2] if len(region) > 2 and region[2] is not None else max_pos
+        return str(chrom), int(start), int(end)
+    m = _re_region.match(region)
+    if m is None:
+        raise ValueError('Invalid region: {}'.format(region))
+    chrom = m.group('chrom')
+    start = m.group('start')
+    end = m.group('end')
+    start = 1 if start is None else int(start.replace(',', ''))
+    if end is None:
+        end = max_pos if m.group(2) is None or '-' in m.group(2) else start
+    else:
+        end = int(end.replace(',', ''))
+    return chrom, start, end
+
+_re_info_end = re.compile(r'(?:^|;)END=([0-9]+)')
+_re_mateid = re.compile(r'(?:^|;)MATEID=([^;]+)')
+_re_bnd_mate = re.compile(r'[\[\]]([^\[\]]+):([0-9]+)[\[\]]')
+
+def _record_span(fields: List[bytes]) -> Tuple[int, int]:
+    # 1-based closed span of a VCF record, following the tabix VCF preset.
+    pos = int(fields[1])
+    end = pos + len(fields[3]) - 1
+    if len(fields) > 7:
+        m = _re_info_end.search(fields[7].decode())
+        if m is not None and fields[4].startswith(b'<'):
+            end = max(end, int(m.group(1)))
+    return pos, end
+
+def fetch_vcf_regions(path: str, regions, include_mates: bool = True) -> str:
+    """
+    fetch_vcf_regions(path, regions, include_mates=True)
+    Read the header and the records overlapping the regions of a bgzipped,
+    tabix/CSI-indexed VCF file, and return them as a VCF-formatted string.
+
+    Only the BGZF blocks pointed by the index are decompressed.
+
+    Parameters
+    ----------
+    path: str
+        Path to the bgzipped VCF file. The index is searched at path + '.tbi'
+        and then path + '.csi'.
+    regions: str or tuple or list of them
+        Regions to read. See parse_region().
+    include_mates: bool, default True
+        If True, the mate records of the breakends found in the regions
+        are read as well, even if they are outside the regions.
+
+    Returns
+    ----------
+    str
+        Header lines followed by the records in the order of the file.
+    """
+    index_path = find_index(path)
+    if index_path is None:
+        raise FileNotFoundError('Tabix or CSI index of {} is not found.'.format(path))
+    index = TabixIndex(index_path)
+    if isinstance(regions, (str, tuple)):
+        regions = [regions]
+    ls_regions = [parse_region(r) for r in regions]
+
+    dict_records = {}
+    with BgzfReader.open(path) as reader:
+        ls_header = reader.read_header_lines(index.meta_char)
+
+        def _fetch(chrom, start, end):
+            ls_hits = []
+            for cbeg, cend in index.query_chunks(chrom, start - 1, end):
+                for voffset, line in reader.iter_lines(cbeg, cend):
+                    if line.startswith(index.meta_char):
+                        continue
+                    fields = line.rstrip(b'\n').split(b'\t')
+                    if fields[0].decode() != chrom:
+                        continue
+                    rec_start, rec_end = _record_span(fields)
+                    if rec_start > end:
+                        break
+                    if rec_end < start:
+                        continue
+                    ls_hits.append((voffset, line, fields))
+            return ls_hits
+
+        ls_hits = []
+        for chrom, start, end in ls_regions:
+            ls_hits += _fetch(chrom, start, end)
+        for voffset, line, fields in ls_hits:
+            dict_records[voffset] = line
+
+        if include_mates:
+            for voffset, line, fields in ls_hits:
+                if len(fields) < 8:
+                    continue
+                m_mate = _re_bnd_mate.search(fields[4].decode())
+                if m_mate is None:
+                    continue
+                mate_chrom, mate_pos = m_mate.group(1), int(m_mate.group(2))
+                m_mateid = _re_mateid.search(fields[7].decode())
+                set_mateid = set(m_mateid.group(1).split(',')) if m_mateid is not None else set()
+                for mate_voffset, mate_line, mate_fields in _fetch(mate_chrom, mate_pos, mate_pos):
+                    if mate_voffset in dict_records:
+                        continue
+                    if set_mateid:
+                        is_mate = mate_fields[2].decode() in set_mateid
+                    else:
+                        m_back = _re_bnd_mate.search(mate_fields[4].decode())
+                        is_mate = m_back is not None and m_back.group(1) == fields[0].decode() and int(m_back.group(2)) == int(fields[1])
+                    if is_mate:
+                        dict_records[mate_voffset] = mate_line
+
+    ls_lines = ls_header + [dict_records[k] for k in sorted(dict_records.keys())]
+    return b''.join(ls_lines).decode()
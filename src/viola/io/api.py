@@ -1,6 +1,7 @@
 from viola.io.parser import (
     read_vcf,
     read_vcf2,
+    read_vcf_chunks,
     read_bedpe,
     read_bed,
 )
@@ -10,6 +11,8 @@ from viola.io.multi_parser import (
     read_bedpe_multi,
 )
 
-from viola.io.fasta_io import (
-    read_fasta,
-)
\ No newline at end of file
+# viola.io.fasta_io imports Biopython and is loaded on the first access.
+from viola._lazy import set_lazy_attributes
+set_lazy_attributes(__name__, {
+    'read_fasta': 'viola.io.fasta_io',
+})
@@ -2,6 +2,22 @@ import os
 from viola.io.parser import read_bedpe, read_vcf
 from viola.core.cohort import MultiBedpe, MultiVcf
 
+def _list_input_files(dir_path: str, format_: str, file_extension, escape_dot_files: bool = True):
+    """
+    Return the (absolute path, patient name) pairs of the files which
+    read_vcf_multi() (format_='vcf') or read_bedpe_multi() (format_='bedpe') reads, in the same order.
+    """
+    ls_files = []
+    for f in os.listdir(dir_path):
+        if escape_dot_files and f.startswith('.'): continue
+        # "xxx.vcf.gz" is regarded as a compressed "xxx.vcf"
+        f_uncompressed = f[:-len('.gz')] if (format_ == 'vcf') and f.endswith('.gz') else f
+        if (file_extension is not None) and (f_uncompressed.split('.')[-1] != file_extension): continue
+        abspath = os.path.abspath(os.path.join(dir_path, f))
+        patient_id = f_uncompressed.replace('.' + format_, '')
+        ls_files.append((abspath, patient_id))
+    return ls_files
+
 def read_vcf_multi(dir_path: str,
     variant_caller: str = 'manta',
     as_breakpoint: bool = False,
@@ -24,23 +40,20 @@ def read_vcf_multi(dir_path: str,
     exclude_empty_cases: bool, default False
         If True, skip reading empty VCF files.
     file_extension: str or None, default 'vcf'
-        File extension of BEDPE files. If you want to load files with no extension, specify None.
+        File extension of VCF files. If you want to load files with no extension, specify None.
+        Gzip/BGZF compressed files with an additional '.gz' extension are also loaded.
     escape_dot_files: bool, default True
         If True, avoid reading hidden files in the directory.
     """
     ls_vcf = []
     ls_names = []
-    for f in os.listdir(dir_path):
-        if escape_dot_files and f.startswith('.'): continue
-        if (file_extension is not None) and (f.split('.')[-1] != file_extension): continue
-        abspath = os.path.abspath(os.path.join(dir_path, f))
+    for abspath, patient_id in _list_input_files(dir_path, 'vcf', file_extension, escape_dot_files):
         vcf = read_vcf(abspath, variant_caller=variant_caller)
         if exclude_empty_cases & (vcf.sv_count == 0):
             continue
         if as_breakpoint:
             vcf = vcf.breakend2breakpoint()
         ls_vcf.append(vcf)
-        patient_id = f.replace('.vcf', '')
         ls_names.append(patient_id)
     multi_vcf = MultiVcf(ls_vcf, ls_names)
     return multi_vcf
@@ -71,14 +84,10 @@ def read_bedpe_multi(dir_path: str,
     """
     ls_bedpe = []
     ls_names = []
-    for f in os.listdir(dir_path):
-        if escape_dot_files and f.startswith('.'): continue
-        if (file_extension is not None) and (f.split('.')[-1] != file_extension): continue
-        abspath = os.path.abspath(os.path.join(dir_path, f))
+    for abspath, patient_id in _list_input_files(dir_path, 'bedpe', file_extension, escape_dot_files):
         bedpe = read_bedpe(abspath, svtype_col_name=svtype_col_name)
         if exclude_empty_cases & (bedpe.sv_count == 0): continue
         ls_bedpe.append(bedpe)
-        patient_id = f.replace('.bedpe', '')
         ls_names.append(patient_id)
     multi_bedpe = MultiBedpe(ls_bedpe, ls_names)
     return multi_bedpe
\ No newline at end of file
@@ -2,19 +2,25 @@ import vcf
 import numpy as np
 import pandas as pd
 import re
+import os
 import itertools
+import copy
 import urllib.request
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import warnings
 from typing import (
     Union,
     Optional,
 )
-from io import StringIO
+from io import StringIO, BytesIO
 from viola.core.bedpe import Bedpe
 from viola.core.vcf import Vcf
 from viola.core.bed import Bed
-from viola.utils.utils import is_url
+from viola.utils.utils import is_url, _check_n_jobs
+from viola.io._tabix import fetch_vcf_regions
+from viola.io._compression import open_text
+from viola.io._bgzf import is_gzip
 from viola.io._vcf_parser import (
     read_vcf_manta,
     read_vcf_delly,
@@ -26,8 +32,84 @@ pd.set_option('display.max_colwidth', 30)
 pd.set_option('display.width', 1000)
 
 
+def _post_decode_default(reader, svid, ls_line, ls_decoded):
+    """
+    Store the decoded INFO of a record and return them as an OrderedDict.
+    Post-decoders take (reader, svid, ls_line, ls_decoded), where ls_decoded
+    is the list of (info name, list of values) in the order of the line.
+    """
+    odict_infos_out = OrderedDict()
+    for k, ls_v in ls_decoded:
+        reader._append_info(svid, k, ls_v)
+        odict_infos_out[k] = ls_v
+    return odict_infos_out
+
+def _post_decode_delly(reader, svid, ls_line, ls_decoded):
+    # The original SVLEN is stored as SVLENORG and SVLEN is recalculated.
+    odict_infos_out = _post_decode_default(reader, svid, ls_line, ls_decoded)
+    svtype = odict_infos_out['svtype'][0]
+    pos1 = int(ls_line[1])
+    end = odict_infos_out['end'][0]
+    if svtype == 'DEL':
+        svlen = pos1 - end
+    elif svtype == 'DUP':
+        svlen = end - pos1
+    elif svtype == 'INV':
+        svlen = end - pos1
+    else:
+        svlen = 0
+    reader._append_info(svid, 'svlen', [svlen])
+    odict_infos_out['svlen'] = [svlen]
+    return odict_infos_out
+
+def _post_decode_lumpy(reader, svid, ls_line, ls_decoded):
+    # An INV record is split into two SV records ("<ID>_1" and "<ID>_2")
+    # according to its STRANDS.
+    is_inv = reader._get_sv_type(ls_line[7].split(';')) == 'INV'
+    if not is_inv:
+        return _post_decode_default(reader, svid, ls_line, ls_decoded)
+    odict_infos_out = OrderedDict()
+    svid1 = str(svid) + '_1'
+    svid2 = str(svid) + '_2'
+    for k, ls_v in ls_decoded:
+        if k == 'strands':
+            for idx_v, each_v in enumerate(ls_v):
+                svid_ = str(svid) + '_' + str(idx_v + 1)
+                su = int(each_v.split(':')[1])
+                reader._append_info(svid_, k, [each_v])
+                reader._append_info(svid_, 'su', [su])
+                odict_infos_out[k] = [each_v]
+                odict_infos_out['su'] = [su]
+            continue
+        if k == 'su':
+            k = 'suorg'
+        reader._append_info(svid1, k, ls_v)
+        reader._append_info(svid2, k, ls_v)
+        odict_infos_out[k] = ls_v
+    odict_infos_out['event'] = [svid]
+    reader._append_info(svid1, 'event', [svid])
+    reader._append_info(svid2, 'event', [svid])
+    return odict_infos_out
+
+def _post_decode_gridss(reader, svid, ls_line, ls_decoded):
+    # CIPOS of the records without it is set to [0, 0], as read_vcf_gridss does.
+    odict_infos_out = _post_decode_default(reader, svid, ls_line, ls_decoded)
+    if 'cipos' not in odict_infos_out:
+        odict_infos_out['cipos'] = [0, 0]
+        reader._append_info(svid, 'cipos', [0, 0])
+    return odict_infos_out
+
+
 class _VcfReader():
     _singular_metadata = ['fileformat', 'fileDate', 'reference', 'variantcaller']
+    # INFO names renamed when stored, per variant caller
+    _info_key_rename = {'delly': {'svlen': 'svlenorg'}}
+    # caller-specific rules applied to the decoded INFO of each record
+    _info_post_decoders = {
+        'delly': _post_decode_delly,
+        'lumpy': _post_decode_lumpy,
+        'gridss': _post_decode_gridss,
+    }
     def __init__(self, variant_caller, patient_name):
         self.variant_caller = variant_caller
         self.patient_name = patient_name
@@ -51,6 +133,8 @@ class _VcfReader():
             'alt': [],
             'svtype': [],
         })
+        self._info_decoders = None
+        self._format_decoders = None
         self.re_header_split = re.compile(r"^(?P<key>[^=]*)=(?P<items>.*)")
         self.re_header_items = re.compile(r'([^<=,\s]*)=([^,\s]*|".*")[,>]')
 
@@ -164,6 +248,7 @@ class _VcfReader():
         ls_samples = ls_header_line[9:]
         self.ls_samples = ls_samples
         self.odict_odict_headers['samples_meta'] = OrderedDict({'id': ls_samples})
+        self._compile_decoders()
     
     def _filter_parser(self, ls_line):
         svid = ls_line[2]
@@ -188,139 +273,94 @@ class _VcfReader():
                 self._svtype = ls_key_item[1]
                 return ls_key_item[1]
     
+    def _make_decoder(self, key, dtype):
+        """
+        Return a function decoding a comma-separated INFO/FORMAT value into
+        a list of typed values, equivalent to _refine_items() on each item.
+        """
+        if dtype == 'Integer':
+            conv = int
+        elif dtype == 'Float':
+            conv = float
+        elif dtype == 'Flag':
+            conv = bool
+        elif dtype is None:
+            conv = lambda item: self._refine_items(key, None, item)
+        else:
+            conv = None
+        def _decoder(v):
+            if '"' in v:
+                v = v.replace('"', '')
+            ls_v = v.split(',')
+            if conv is None:
+                return ls_v
+            return list(map(conv, ls_v))
+        return _decoder
+
+    def _compile_decoders(self):
+        """
+        Build the INFO and FORMAT decoders from the header lines.
+        self._info_decoders maps INFO ID to (table name, decoder) and
+        self._format_decoders maps FORMAT ID to decoder.
+        """
+        dict_rename = self._info_key_rename.get(self.variant_caller, {})
+        self._info_decoders = {}
+        odict_infos_meta = self.odict_odict_headers.get('infos_meta', {'id': [], 'type': []})
+        for k, dtype in zip(odict_infos_meta['id'], odict_infos_meta['type']):
+            if k in self._info_decoders:
+                continue
+            k_lower = k.lower()
+            self._info_decoders[k] = (dict_rename.get(k_lower, k_lower), self._make_decoder(None, dtype))
+        self._format_decoders = {}
+        odict_formats_meta = self.odict_odict_headers.get('formats_meta', {'id': [], 'type': []})
+        for k, dtype in zip(odict_formats_meta['id'], odict_formats_meta['type']):
+            if k not in self._format_decoders:
+                self._format_decoders[k] = self._make_decoder(k, dtype)
+        self._dict_format_fields = {}
+
+    def _append_info(self, svid, k, ls_v):
+        odict_info = self.odict_odict_infos.get(k)
+        if odict_info is None:
+            odict_info = OrderedDict({'id': [], 'value_idx': [], k: []})
+            self.odict_odict_infos[k] = odict_info
+        len_v = len(ls_v)
+        odict_info['id'].extend([svid] * len_v)
+        odict_info['value_idx'].extend(range(len_v))
+        odict_info[k].extend(ls_v)
+
     def _info_parser(self, ls_line):
-        odict_infos = OrderedDict()
-        odict_infos_out = OrderedDict()
         svid = ls_line[2]
-        info_line = ls_line[7]
-        ls_info = info_line.split(';')
-        if self.variant_caller == 'lumpy':
-            is_inv = self._get_sv_type(ls_info) == 'INV'
-        
-        def _append_info_to_odict(svid, ls_key_item, k, info_dtype):
-            if len(ls_key_item) == 1:
-                ls_v = [True]
-                odict_infos = OrderedDict({'id': [svid], \
-                    'value_idx': [0], k: ls_v})
-            else:
-                v = ls_key_item[1]
-                ls_v = v.split(',')
-                ls_v = [self._refine_items(None, info_dtype, item) for item in ls_v]
-                len_v = len(ls_v)
-                ls_svid = [svid] * len_v
-                odict_infos = OrderedDict({'id': ls_svid, \
-                    'value_idx': list(range(len_v)), k: ls_v})
-            odict_infos_out[k] = ls_v
-            if self.odict_odict_infos.get(k) is None:
-                self.odict_odict_infos[k] = odict_infos
-            else:
-                for table_key, table_value in odict_infos.items():
-                    self.odict_odict_infos[k][table_key].extend(table_value)
-        
-        for info in ls_info:
+        ls_decoded = []
+        for info in ls_line[7].split(';'):
             ls_key_item = info.split('=')
-            k = ls_key_item[0]
-            info_dtype_idx = self.odict_odict_headers['infos_meta']['id'].index(k)
-            info_dtype = self.odict_odict_headers['infos_meta']['type'][info_dtype_idx]
-            k = k.lower()
-            if self.variant_caller == 'delly' and k == 'svlen':
-                k = 'svlenorg'
-            if self.variant_caller == 'lumpy' and is_inv:
-                if k == 'strands':
-                    ls_v = ls_key_item[1].split(',')
-                    for idx_v, each_v in enumerate(ls_v):
-                        svid_ = str(svid) + '_' + str(idx_v + 1)
-                        su = each_v.split(':')[1]
-                        k_su = 'su'
-                        ls_key_item = [k, each_v]
-                        ls_key_item_su = ['su', su]
-                        info_dtype_su = 'Integer'
-                        _append_info_to_odict(svid_, ls_key_item, k, info_dtype)
-                        _append_info_to_odict(svid_, ls_key_item_su, k_su, info_dtype_su)
-                else:
-                    if k == 'su':
-                        k = 'suorg'
-                        ls_key_item[0] = k
-                    svid1 = str(svid) + '_1'
-                    svid2 = str(svid) + '_2'
-                    _append_info_to_odict(svid1, ls_key_item, k, info_dtype)
-                    _append_info_to_odict(svid2, ls_key_item, k, info_dtype)
-                continue
-                    
-            _append_info_to_odict(svid, ls_key_item, k, info_dtype)
-        
-        if self.variant_caller == 'delly':
-            svtype = odict_infos_out['svtype'][0]
-            pos1 = int(ls_line[1])
-            end = odict_infos_out['end'][0]
-            if svtype == 'BND':
-                svlen = 0
-            elif svtype == 'TRA':
-                svlen = 0
-            elif svtype == 'DEL':
-                svlen = pos1 - end
-            elif svtype == 'DUP':
-                svlen = end - pos1
-            elif svtype == 'INV':
-                svlen = end - pos1
-            else:
-                svlen = 0
-            if 'svlen' not in self.odict_odict_infos:
-                self.odict_odict_infos['svlen'] = OrderedDict({
-                    'id': [],
-                    'value_idx': [],
-                    'svlen': []
-                })
-            self.odict_odict_infos['svlen']['id'].extend([svid])
-            self.odict_odict_infos['svlen']['value_idx'].extend([0])
-            self.odict_odict_infos['svlen']['svlen'].extend([svlen])
-            odict_infos_out['svlen'] = [svlen]
-        elif self.variant_caller == 'lumpy' and is_inv:
-            odict_infos_out['event'] = [svid]
-            svid1 = str(svid) + '_1'
-            svid2 = str(svid) + '_2'
-            if 'event' not in self.odict_odict_infos:
-                self.odict_odict_infos['event'] = OrderedDict({
-                    'id': [svid1, svid2],
-                    'value_idx': [0, 0],
-                    'event': [svid, svid]
-                })
-            else:
-                self.odict_odict_infos['event']['id'].extend([svid1, svid2])
-                self.odict_odict_infos['event']['value_idx'].extend([0, 0])
-                self.odict_odict_infos['event']['event'].extend([svid, svid])
-        elif self.variant_caller == 'gridss' and odict_infos.get('cipos') is None:
-            odict_infos_out['cipos'] = [0, 0]
-            if self.odict_odict_infos.get('cipos') is None:
-                self.odict_odict_infos['cipos'] = OrderedDict({
-                    'id': [svid, svid],
-                    'value_idx': [0, 1],
-                    'cipos': [0, 0]
-                })
+            k, decoder = self._info_decoders[ls_key_item[0]]
+            if len(ls_key_item) == 1:
+                ls_decoded.append((k, [True]))
             else:
-                self.odict_odict_infos['cipos']['id'].extend([svid, svid])
-                self.odict_odict_infos['cipos']['value_idx'].extend([0, 1])
-                self.odict_odict_infos['cipos']['cipos'].extend([0, 0])
-        
-        return odict_infos_out
+                ls_decoded.append((k, decoder(ls_key_item[1])))
+        post_decoder = self._info_post_decoders.get(self.variant_caller, _post_decode_default)
+        return post_decoder(self, svid, ls_line, ls_decoded)
     
     def _format_parser(self, ls_line):
         svid = ls_line[2]
         format_ = ls_line[8]
-        ls_formats_names = format_.split(':')
+        ls_format_fields = self._dict_format_fields.get(format_)
+        if ls_format_fields is None:
+            ls_format_fields = [(formats_name, self._format_decoders[formats_name]) for formats_name in format_.split(':')]
+            self._dict_format_fields[format_] = ls_format_fields
+        is_lumpy_inv = self.variant_caller == 'lumpy' and self._svtype == 'INV'
+        if is_lumpy_inv:
+            svid1 = str(svid) + '_1'
+            svid2 = str(svid) + '_2'
+        odict_formats = self.odict_formats
         idx_sample = 9
         for sample in self.ls_samples:
             each_format = ls_line[idx_sample]
             ls_each_format = each_format.split(':')
-            for formats_name, each_format_values in zip(ls_formats_names, ls_each_format):
-                formats_dtype_idx = self.odict_odict_headers['formats_meta']['id'].index(formats_name)
-                formats_dtype = self.odict_odict_headers['formats_meta']['type'][formats_dtype_idx]
-                ls_each_format_values = each_format_values.split(',')
-                ls_each_format_values = [self._refine_items(formats_name, formats_dtype, item) for item in ls_each_format_values]
+            for (formats_name, decoder), each_format_values in zip(ls_format_fields, ls_each_format):
+                ls_each_format_values = decoder(each_format_values)
                 len_each_format_values = len(ls_each_format_values)
-                if self.variant_caller == 'lumpy' and self._svtype == 'INV':
-                    svid1 = str(svid) + '_1'
-                    svid2 = str(svid) + '_2'
+                if is_lumpy_inv:
                     ls_svid = [svid1, svid2] * len_each_format_values
                     ls_sample = [sample] * len_each_format_values * 2
                     ls_format_names = [formats_name] * len_each_format_values * 2
@@ -330,12 +370,12 @@ class _VcfReader():
                     ls_svid = [svid] * len_each_format_values
                     ls_sample = [sample] * len_each_format_values
                     ls_format_names = [formats_name] * len_each_format_values
-                    ls_value_idx = list(range(len_each_format_values))
-                self.odict_formats['id'].extend(ls_svid)
-                self.odict_formats['sample'].extend(ls_sample)
-                self.odict_formats['format'].extend(ls_format_names)
-                self.odict_formats['value_idx'].extend(ls_value_idx)
-                self.odict_formats['value'].extend(ls_each_format_values)
+                    ls_value_idx = range(len_each_format_values)
+                odict_formats['id'].extend(ls_svid)
+                odict_formats['sample'].extend(ls_sample)
+                odict_formats['format'].extend(ls_format_names)
+                odict_formats['value_idx'].extend(ls_value_idx)
+                odict_formats['value'].extend(ls_each_format_values)
             idx_sample += 1
     
     def _alt_parser_for_bnd(self, alt):
@@ -434,12 +474,46 @@ class _VcfReader():
     def _main_line_parser(self, line):
         line = line.replace('\n', '')
         ls_line = line.split('\t')
+        if self._info_decoders is None:
+            self._compile_decoders()
         odict_infos = self._info_parser(ls_line)
         self._filter_parser(ls_line)
         self._format_parser(ls_line)
         self._positions_parser(ls_line, odict_infos)
 
     
+    def _copy_header(self):
+        """
+        Return a new _VcfReader which has the same header and no records.
+        """
+        reader = _VcfReader(self.variant_caller, self.patient_name)
+        reader.metadata = copy.deepcopy(self.metadata)
+        reader.odict_odict_headers = copy.deepcopy(self.odict_odict_headers)
+        if hasattr(self, 'ls_samples'):
+            reader.ls_samples = self.ls_samples
+        if self._info_decoders is not None:
+            reader._compile_decoders()
+        return reader
+
+    def _get_buffers(self):
+        return self.odict_odict_infos, self.odict_filters, self.odict_formats, self.odict_svpos
+
+    def _extend_buffers(self, buffers):
+        """
+        Append the column buffers parsed by another _VcfReader from the subsequent lines.
+        """
+        odict_odict_infos, odict_filters, odict_formats, odict_svpos = buffers
+        for k, odict_info in odict_odict_infos.items():
+            if self.odict_odict_infos.get(k) is None:
+                self.odict_odict_infos[k] = odict_info
+            else:
+                for table_key, table_value in odict_info.items():
+                    self.odict_odict_infos[k][table_key].extend(table_value)
+        for odict_self, odict_other in zip((self.odict_filters, self.odict_formats, self.odict_svpos), \
+            (odict_filters, odict_formats, odict_svpos)):
+            for k, v in odict_other.items():
+                odict_self[k].extend(v)
+
     def _filter_df_constructor(self):
         df_filters = pd.DataFrame(self.odict_filters)
         self.df_filters = df_filters
@@ -487,27 +561,127 @@ class _VcfReader():
     
 
         
-def read_vcf2(filepath_or_buffer, variant_caller, patient_name=None):
+def _parse_vcf_byte_range(args):
+    # Worker of read_vcf2(n_jobs=...). Parse the data lines in [start, end)
+    # and return the column buffers.
+    filepath, start, end, variant_caller, patient_name, odict_odict_headers, ls_samples = args
+    reader = _VcfReader(variant_caller, patient_name)
+    reader.odict_odict_headers = odict_odict_headers
+    reader.ls_samples = ls_samples
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    for line in StringIO(data.decode(), newline=None):
+        reader._main_line_parser(line)
+    return reader._get_buffers()
+
+def _split_vcf_body(filepath, n_ranges):
+    """
+    Return the header lines and newline-aligned byte ranges covering the data lines.
+    """
+    ls_header = []
+    with open(filepath, 'rb') as f:
+        while True:
+            body_start = f.tell()
+            line = f.readline()
+            if not line.startswith(b'#'):
+                break
+            ls_header.append(line)
+        file_size = os.fstat(f.fileno()).st_size
+        ls_bounds = [body_start]
+        for i in range(1, n_ranges):
+            offset = body_start + (file_size - body_start) * i // n_ranges
+            if offset <= ls_bounds[-1]:
+                continue
+            f.seek(offset - 1)
+            f.readline()
+            offset = f.tell()
+            if offset >= file_size:
+                break
+            if offset > ls_bounds[-1]:
+                ls_bounds.append(offset)
+        ls_bounds.append(file_size)
+    ls_ranges = [(st, en) for st, en in zip(ls_bounds[:-1], ls_bounds[1:]) if en > st]
+    return ls_header, ls_ranges
+
+def _is_plain_file(filepath_or_buffer):
+    if not isinstance(filepath_or_buffer, str) or is_url(filepath_or_buffer):
+        return False
+    with open(filepath_or_buffer, 'rb') as f:
+        return not is_gzip(f.read(2))
+
+def read_vcf2(filepath_or_buffer, variant_caller, patient_name=None, regions=None, n_jobs=1):
+    """
+    read_vcf2(filepath_or_buffer, variant_caller, patient_name=None, regions=None, n_jobs=1)
+    Read vcf file of SV and return Vcf object, without PyVCF.
+
+    Parameters
+    ---------------
+    filepath_or_buffer: str or file-like object
+        Path to the vcf file (plain, gzip or BGZF) or a text/binary stream.
+    variant_caller: str
+        Let this function know which SV caller was used to create vcf file.
+    patient_name: str or None, default None
+    regions: str or tuple or list of them, default None
+        Regions to read from a bgzipped and indexed vcf file. See read_vcf().
+    n_jobs: int, default 1
+        Number of processes used to parse the data lines. -1 means all CPUs.
+        The data lines of an uncompressed file are split at newline-aligned
+        byte offsets and parsed in parallel, and the results are concatenated
+        in the order of the file, so that the output is the same as n_jobs=1.
+        Compressed files, streams and region queries are parsed serially.
+
+    Returns
+    ---------------
+    A Vcf object
+    """
     if patient_name is None:
         warnings.warn(
             'Passing NoneType to the "patient_name" argument is deprecated.',
             DeprecationWarning
         )
+    n_jobs = _check_n_jobs(n_jobs)
     reader = _VcfReader(variant_caller, patient_name)
-    if isinstance(filepath_or_buffer, StringIO):
-        f = filepath_or_buffer
+    if n_jobs > 1 and regions is None and _is_plain_file(filepath_or_buffer):
+        ls_header, ls_ranges = _split_vcf_body(filepath_or_buffer, n_jobs * 4)
+        for line in StringIO(b''.join(ls_header).decode(), newline=None):
+            if line.startswith('##'):
+                reader._vcf_header_parser(line)
+            else:
+                reader._sample_extractor(line)
+        ls_args = [(filepath_or_buffer, st, en, variant_caller, patient_name, \
+            reader.odict_odict_headers, getattr(reader, 'ls_samples', [])) for st, en in ls_ranges]
+        with ProcessPoolExecutor(max_workers=min(n_jobs, max(len(ls_args), 1))) as executor:
+            for buffers in executor.map(_parse_vcf_byte_range, ls_args):
+                reader._extend_buffers(buffers)
     else:
-        f = open(filepath_or_buffer, 'r')
-
-    for line in f:
-        if line.startswith('##'):
-            reader._vcf_header_parser(line)
-            continue
-        elif line.startswith('#'):
-            reader._sample_extractor(line)
-            continue
-        reader._main_line_parser(line)
+        if regions is not None:
+            f = StringIO(fetch_vcf_regions(filepath_or_buffer, regions))
+        else:
+            f = open_text(filepath_or_buffer)
+
+        try:
+            for line in f:
+                if line.startswith('##'):
+                    reader._vcf_header_parser(line)
+                    continue
+                elif line.startswith('#'):
+                    reader._sample_extractor(line)
+                    continue
+                reader._main_line_parser(line)
+        finally:
+            if isinstance(filepath_or_buffer, str):
+                f.close()
         
+    return _vcf_from_reader(reader)
+
+
+
+def _vcf_from_reader(reader):
+    """
+    Build a Vcf object from the header and the records parsed by a _VcfReader.
+    """
+    variant_caller = reader.variant_caller
     reader._header_df_constructor()
     reader._filter_df_constructor()
     reader._info_df_constructor()
@@ -533,27 +707,138 @@ def read_vcf2(filepath_or_buffer, variant_caller, patient_name=None):
         reader.df_formats,
         reader.odict_df_headers,
         reader.metadata,
-        patient_name
+        reader.patient_name
     ]
 
     return Vcf(*args)
 
+def read_vcf_chunks(filepath_or_buffer, variant_caller, patient_name=None, chunksize=10000):
+    """
+    read_vcf_chunks(filepath_or_buffer, variant_caller, patient_name=None, chunksize=10000)
+    Read vcf file of SV chunksize records at a time, and yield a Vcf object for each chunk.
+    All the chunks have the header of the file.
+    Only one chunk is kept in memory, so that files larger than memory can be processed.
+
+    The breakends of a pair are yielded in the same chunk, so that the INFO values
+    derived from the mate records, such as CIEND of the breakends of Manta, are the same
+    as those of read_vcf2. A breakend whose mate has not been read when a chunk is full
+    is carried to the next chunk. Once the input has passed the mate position in ALT,
+    the mate is regarded as missing (e.g. removed by filtering) and the breakend is yielded
+    without it. Thus a chunk may have more records than chunksize by the number of the
+    breakends whose mates are ahead. If the input is not sorted by position, the breakends
+    whose mate is not found are carried to the last chunk.
 
+    Parameters
+    ---------------
+    filepath_or_buffer: str or file-like object
+        Path to the vcf file (plain, gzip or BGZF) or a text/binary stream such as the standard input.
+    variant_caller: str
+        Let this function know which SV caller was used to create vcf file.
+    patient_name: str or None, default None
+    chunksize: int, default 10000
+        Number of records in each chunk.
 
-def read_vcf(filepath_or_buffer: Union[str, StringIO], variant_caller: str = "manta", patient_name = None):
+    Yields
+    ---------------
+    Vcf objects
+        At least one Vcf object is yielded, even if the file has no record.
     """
-    read_vcf(filepath_or_buffer, variant_callser = "manta", patient_name = None)
+    if chunksize < 1:
+        raise ValueError('chunksize should be a positive integer but {} was passed.'.format(chunksize))
+    reader = _VcfReader(variant_caller, patient_name)
+    f = open_text(filepath_or_buffer)
+    re_mateid = re.compile(r'(?:^|;)MATEID=([^;,\s]+)')
+    re_mate_position = re.compile(r'[\[\]]([^\[\]]+):([0-9]+)[\[\]]')
+    try:
+        # lines of the current chunk, and the breakends among them waiting for their mates
+        # with the positions of the mates taken from ALT
+        ls_lines = []
+        ls_ids = []
+        dict_pending = {}
+        # contigs passed in the input, which is checked to be sorted
+        set_passed_contigs = set()
+        chrom = None
+        pos = 0
+        is_sorted = True
+        is_yielded = False
+        for line in f:
+            if line.startswith('##'):
+                reader._vcf_header_parser(line)
+                continue
+            elif line.startswith('#'):
+                reader._sample_extractor(line)
+                continue
+            ls_fields = line.split('\t', 8)
+            if ls_fields[0] != chrom:
+                set_passed_contigs.add(chrom)
+                chrom = ls_fields[0]
+                is_sorted = is_sorted and chrom not in set_passed_contigs
+            elif int(ls_fields[1]) < pos:
+                is_sorted = False
+            pos = int(ls_fields[1])
+            match_mateid = re_mateid.search(ls_fields[7])
+            if match_mateid is not None:
+                if match_mateid.group(1) in dict_pending:
+                    del dict_pending[match_mateid.group(1)]
+                else:
+                    match_mate_position = re_mate_position.search(ls_fields[4])
+                    if match_mate_position is None:
+                        dict_pending[ls_fields[2]] = None
+                    else:
+                        dict_pending[ls_fields[2]] = (match_mate_position.group(1), int(match_mate_position.group(2)))
+            ls_lines.append(line)
+            ls_ids.append(ls_fields[2])
+            if len(ls_lines) - len(dict_pending) >= chunksize:
+                # The breakends whose mate position has been passed lack their mates in the file,
+                # and are yielded in this chunk. The others are carried to the next chunk.
+                for sv_id, mate_position in list(dict_pending.items()):
+                    if not is_sorted or mate_position is None:
+                        continue
+                    mate_chrom, mate_pos = mate_position
+                    if mate_chrom in set_passed_contigs or (mate_chrom == chrom and mate_pos < pos):
+                        del dict_pending[sv_id]
+                next_reader = reader._copy_header()
+                ls_carried = []
+                for sv_id, chunk_line in zip(ls_ids, ls_lines):
+                    if sv_id in dict_pending:
+                        ls_carried.append((sv_id, chunk_line))
+                    else:
+                        reader._main_line_parser(chunk_line)
+                yield _vcf_from_reader(reader)
+                is_yielded = True
+                reader = next_reader
+                ls_ids = [sv_id for sv_id, _ in ls_carried]
+                ls_lines = [chunk_line for _, chunk_line in ls_carried]
+        for chunk_line in ls_lines:
+            reader._main_line_parser(chunk_line)
+        if len(ls_lines) > 0 or not is_yielded:
+            yield _vcf_from_reader(reader)
+    finally:
+        if isinstance(filepath_or_buffer, str):
+            f.close()
+
+def read_vcf(filepath_or_buffer: Union[str, StringIO], variant_caller: str = "manta", patient_name = None, regions = None):
+    """
+    read_vcf(filepath_or_buffer, variant_callser = "manta", patient_name = None, regions = None)
     Read vcf file of SV and return Vcf object.
 
     Parameters
     ---------------
     filepath_or_buffer: str or StringIO
         String path to the vcf file. StringIO is also acceptable.
+        Binary streams and gzip/BGZF compressed files are also accepted;
+        the compression is detected from the content.
         (Wether URL is acceptable or not hasn't been tested.)
         (Acceptable types should be extended in the future)
     variant_caller: str
         Let this function know which SV caller was used to create vcf file.
     patient name: str or None, default None
+    regions: str or tuple or list of them, default None
+        Regions to read, such as "chr1", "chr1:10000-20000" (1-based, closed)
+        or ("chr1", 10000, 20000). If specified, filepath_or_buffer must be a path
+        to a bgzipped VCF file indexed with tabix (.tbi) or CSI (.csi), and only
+        the records overlapping the regions, together with their mate breakends,
+        are read.
     
     Returns
     ---------------
@@ -565,15 +850,17 @@ def read_vcf(filepath_or_buffer: Union[str, StringIO], variant_caller: str = "ma
             DeprecationWarning
         )
     # read vcf files using PyVcf package
-    if isinstance(filepath_or_buffer, str) and is_url(filepath_or_buffer):
-        b = StringIO(urllib.request.urlopen(filepath_or_buffer).read().decode('utf-8'))
+    if regions is not None:
+        vcf_reader = vcf.Reader(StringIO(fetch_vcf_regions(filepath_or_buffer, regions)))
+    elif isinstance(filepath_or_buffer, str) and is_url(filepath_or_buffer):
+        b = StringIO(open_text(BytesIO(urllib.request.urlopen(filepath_or_buffer).read())).read())
         vcf_reader = vcf.Reader(b)
-    elif isinstance(filepath_or_buffer, str):
-        vcf_reader = vcf.Reader(open(filepath_or_buffer, 'r'))
     elif isinstance(filepath_or_buffer, StringIO):
         vcf_reader = vcf.Reader(filepath_or_buffer)
     else:
-        vcf_reader = vcf.Reader(filepath_or_buffer)
+        # plain/gzip/BGZF paths and binary streams are decoded by open_text,
+        # so PyVCF must not guess the compression from the file name.
+        vcf_reader = vcf.Reader(open_text(filepath_or_buffer), compressed=False)
         #raise TypeError("should be file or buffer")
 
     if variant_caller == 'manta':
@@ -793,9 +1080,11 @@ def _read_bedpe_empty(df_bedpe, patient_name):
 def read_bedpe(filepath,
     header_info_path = None,
     svtype_col_name: Optional[str] = None,
-    patient_name = None):
+    patient_name = None,
+    dtype = None,
+    usecols = None):
     """
-    read_bedpe(filepath, header_info_path, svtype_col_name)
+    read_bedpe(filepath, header_info_path, svtype_col_name, patient_name, dtype, usecols)
     Read a BEDPE file of SV and return Bedpe object.
 
     Parameters
@@ -808,6 +1097,12 @@ def read_bedpe(filepath,
         If the bedpe file has a svtype column, please pass the column name to this argument.
     patient_name: str or None, default None
         The patient name
+    dtype: dict or None, default None
+        Passed to pandas.read_csv(). Useful to load large files with compact
+        types, e.g. {'chrom1': 'category', 'chrom2': 'category'}.
+    usecols: list or None, default None
+        Passed to pandas.read_csv(). The first ten BEDPE columns must be included;
+        the other columns are loaded as INFO.
     
     Returns
     ---------------
@@ -818,7 +1113,7 @@ def read_bedpe(filepath,
             'Passing NoneType to the "patient_name" argument is deprecated.',
             DeprecationWarning
         )
-    df_bedpe = pd.read_csv(filepath, sep='\t')
+    df_bedpe = pd.read_csv(filepath, sep='\t', dtype=dtype, usecols=usecols)
     if df_bedpe.shape[0] == 0:
         return _read_bedpe_empty(df_bedpe, patient_name)
     ls_header = list(df_bedpe.columns)
@@ -843,55 +1138,51 @@ def read_bedpe(filepath,
     df_svpos = df_svpos[['id', 'chrom1', 'pos1', 'chrom2', 'pos2', 'strand1', 'strand2', 'ref', 'alt', 'qual', 'svtype']]
 
     ## below: construct INFO tables
+    arr_id = df_svpos['id'].values
+    n_sv = arr_id.shape[0]
 
     ### svlen table
-    def _add_svlen(x):
-        x['value_idx'] = 0
-        if x.name == 'BND':
-            x['svlen'] = 0
-            return x
-        elif x.name == 'TRA':
-            x['svlen'] = 0
-            return x
-        elif x.name == 'DEL':
-            x['svlen'] = x['pos1'] - x['pos2'] + 1
-            return x
-        elif x.name == 'DUP':
-            x['svlen'] = x['pos2'] - x['pos1'] + 1
-            return x
-        elif x.name == 'INV':
-            x['svlen'] = x['pos2'] - x['pos1']
-            return x
-        else:
-            x['svlen'] = abs(x['pos2'] - x['pos1'])
-            return x
-    df_svlen = df_svpos.groupby('svtype').apply(_add_svlen)[['id', 'value_idx', 'svlen']]
+    arr_svtype = df_svpos['svtype'].values
+    arr_pos1 = df_svpos['pos1'].values
+    arr_pos2 = df_svpos['pos2'].values
+    arr_svlen = np.select(
+        [
+            (arr_svtype == 'BND') | (arr_svtype == 'TRA'),
+            arr_svtype == 'DEL',
+            arr_svtype == 'DUP',
+            arr_svtype == 'INV',
+        ],
+        [
+            0,
+            arr_pos1 - arr_pos2 + 1,
+            arr_pos2 - arr_pos1 + 1,
+            arr_pos2 - arr_pos1,
+        ],
+        default=np.abs(arr_pos2 - arr_pos1)
+    )
+    df_svlen = pd.DataFrame({'id': arr_id, 'value_idx': 0, 'svlen': arr_svlen}, index=df_svpos.index)
 
     ### svtype table
-    df_svtype = df_svpos[['id', 'svtype']].copy()
-    df_svtype['value_idx'] = 0
-    df_svtype = df_svtype[['id', 'value_idx', 'svtype']]
+    df_svtype = pd.DataFrame({'id': arr_id, 'value_idx': 0, 'svtype': arr_svtype}, index=df_svpos.index)
 
     ### cipos and ciend
-    df_ci = df_bedpe.copy()
-    df_ci[0] = df_ci['start1'] - (df_ci['pos1'] - 1)
-    df_ci[1] = df_ci['end1'] - df_ci['pos1']
-    df_cipos = df_ci[['name', 0, 1]].rename(columns={'name': 'id'}).set_index('id')
-    df_cipos = df_cipos.stack()
-    df_cipos = df_cipos.reset_index().rename(columns={'level_1': 'value_idx', 0: 'cipos'})
-    
-    df_ci = df_bedpe.copy()
-    df_ci[0] = df_ci['start2'] - (df_ci['pos2'] - 1)
-    df_ci[1] = df_ci['end2'] - df_ci['pos2']
-    df_ciend = df_ci[['name', 0, 1]].rename(columns={'name': 'id'}).set_index('id')
-    df_ciend = df_ciend.stack()
-    df_ciend = df_ciend.reset_index().rename(columns={'level_1': 'value_idx', 0: 'ciend'})
+    def _ci_table(position_num, name):
+        arr_pos = df_bedpe['pos{}'.format(position_num)].values
+        arr_ci = np.column_stack([
+            df_bedpe['start{}'.format(position_num)].values - (arr_pos - 1),
+            df_bedpe['end{}'.format(position_num)].values - arr_pos,
+        ]).ravel()
+        return pd.DataFrame({
+            'id': np.repeat(df_bedpe['name'].values, 2),
+            'value_idx': np.tile(np.array([0, 1], dtype=np.int64), n_sv),
+            name: arr_ci,
+        })
+    df_cipos = _ci_table(1, 'cipos')
+    df_ciend = _ci_table(2, 'ciend')
 
     ls_df_infos = []
     for info in ls_header_option:
-        df_info = df_bedpe[['name', info]].rename(columns={'name': 'id'}).copy()
-        df_info['value_idx'] = 0
-        df_info = df_info[['id', 'value_idx', info]]
+        df_info = pd.DataFrame({'id': df_bedpe['name'].values, 'value_idx': 0, info: df_bedpe[info].values}, index=df_bedpe.index)
         ls_df_infos.append(df_info)
     ls_df_infos = [df_svlen, df_svtype, df_cipos, df_ciend] + ls_df_infos   
     ls_infokeys = ['svlen', 'svtype', 'cipos', 'ciend'] + ls_header_option
@@ -900,6 +1191,13 @@ def read_bedpe(filepath,
     args = [df_svpos, odict_df_infos, patient_name]
     return Bedpe(*args)
 
+_re_chrom_number = re.compile(r"^([0-9]+|[XY]|MT)")
+_re_chrom_m = re.compile(r"^(M)")
+
+def _prepend_chr_single(chrom):
+    chrom = _re_chrom_number.sub(r"chr\1", chrom)
+    return _re_chrom_m.sub(r"chrMT", chrom)
+
 def prepend_chr(ser):
     """
     prepend_chr(ser)
@@ -916,8 +1214,11 @@ def prepend_chr(ser):
     -------
     A Series of chromosome numbers in "chr" notation.
     """
-    dict_regex = {"^([0-9]+|[XY]|MT)":r"chr\1", r"^(M)":r"chrMT"}
-    return ser.astype(str).replace(regex=dict_regex)
+    # Chromosome names are highly repetitive, so each distinct name is
+    # converted once and the result is looked up by its code.
+    codes, uniques = pd.factorize(ser.astype(str))
+    arr_lookup = np.array([_prepend_chr_single(chrom) for chrom in uniques], dtype=object)
+    return pd.Series(arr_lookup[codes], index=ser.index, name=ser.name)
 
 def infer_svtype_from_position(position_table):
     df = position_table.copy()
@@ -942,33 +1243,31 @@ def create_alt_field_from_position(position_table):
     '''
     svtype column is required
     '''
-    def _f(x):
-        if x.name == '.':
-            x['alt'] = '.'
-            return x
-        elif (x.name != 'BND') & (x.name != 'TRA'):
-            x['alt'] = "<{}>".format(x.name)
-            return x
-        ls_alt = []
-        for idx, row in x.iterrows():
-            strand1 = row['strand1']
-            strand2 = row['strand2']
-            chrom2 = row['chrom2']
-            pos2 = row['pos2']
-            ref = row['ref']
-            if (strand1 == '+') & (strand2 == '-'):
-                alt = '{0}[{1}:{2}['.format(ref, chrom2, pos2)
-            elif (strand1 == '+') & (strand2 == '+'):
-                alt = '{0}]{1}:{2}]'.format(ref, chrom2, pos2)
-            elif (strand1 == '-') & (strand2 == '+'):
-                alt = ']{0}:{1}]{2}'.format(chrom2, pos2, ref)
-            else:
-                alt = '[{0}:{1}[{2}'.format(chrom2, pos2, ref)
-            ls_alt.append(alt)
-        x['alt'] = ls_alt
-        return x
     df = position_table.copy()
-    df = df.groupby('svtype').apply(_f)
+    ser_svtype = df['svtype'].astype(str)
+    ser_alt = '<' + ser_svtype + '>'
+    ser_alt[ser_svtype == '.'] = '.'
+    mask_bnd = (ser_svtype == 'BND') | (ser_svtype == 'TRA')
+    if mask_bnd.any():
+        df_bnd = df.loc[mask_bnd]
+        ser_ref = df_bnd['ref'].astype(str)
+        ser_mate = df_bnd['chrom2'].astype(str) + ':' + df_bnd['pos2'].astype(str)
+        ser_strand1 = df_bnd['strand1']
+        ser_strand2 = df_bnd['strand2']
+        ser_alt[mask_bnd] = np.select(
+            [
+                (ser_strand1 == '+') & (ser_strand2 == '-'),
+                (ser_strand1 == '+') & (ser_strand2 == '+'),
+                (ser_strand1 == '-') & (ser_strand2 == '+'),
+            ],
+            [
+                ser_ref + '[' + ser_mate + '[',
+                ser_ref + ']' + ser_mate + ']',
+                ']' + ser_mate + ']' + ser_ref,
+            ],
+            default='[' + ser_mate + '[' + ser_ref
+        )
+    df['alt'] = ser_alt
     return df
 
 def read_bed(filepath_or_buffer):
@@ -0,0 +1,63 @@
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+def assignment_kmeans(dataset, k, max_iter=300, tol=1e-4, random_state=None):
+    """
+    assignment_kmeans(dataset, k, max_iter=300, tol=1e-4, random_state=None)
+    k-means clustering in which each replicate contributes exactly one vector to each cluster.
+
+    The rows of dataset are consecutive blocks of k vectors, one block per replicate.
+    In each iteration, the k vectors of each replicate are matched to the k centers
+    by an optimal assignment (Hungarian algorithm) of the squared L2 distances,
+    and the centers are updated to the means of the matched vectors.
+    The cost is linear in the number of replicates.
+
+    Parameters
+    ----------
+    dataset: array-like
+        (n_replicates * k, n_features) shaped array.
+    k: int
+        Number of clusters, i.e. number of vectors per replicate.
+    max_iter: int, default 300
+        Maximum number of iterations.
+    tol: float, default 1e-4
+        Relative tolerance of the center shift to declare convergence,
+        in the same way as cop_kmeans.
+    random_state: int or None, default None
+        Seed to choose the replicate whose vectors are the initial centers.
+
+    Returns
+    ----------
+    (list, list)
+        Cluster index of each vector and the centers.
+    """
+    dataset = np.asarray(dataset, dtype=float)
+    n, dim = dataset.shape
+    if n == 0 or n % k != 0:
+        raise ValueError('The number of vectors ({}) should be a positive multiple of k ({}).'.format(n, k))
+    n_replicates = n // k
+    arr_blocks = dataset.reshape(n_replicates, k, dim)
+    tol = tol * dataset.var(axis=0).mean()
+
+    rng = np.random.default_rng(random_state)
+    centers = arr_blocks[rng.integers(n_replicates)].copy()
+    arr_labels = np.full((n_replicates, k), -1)
+    for _ in range(max_iter):
+        # (n_replicates, k vectors, k centers) squared distances
+        arr_cost = ((arr_blocks[:, :, np.newaxis, :] - centers[np.newaxis, np.newaxis, :, :]) ** 2).sum(axis=3)
+        arr_new_labels = np.empty_like(arr_labels)
+        for i in range(n_replicates):
+            arr_rows, arr_cols = linear_sum_assignment(arr_cost[i])
+            arr_new_labels[i, arr_rows] = arr_cols
+        # every cluster has exactly one vector of each replicate.
+        new_centers = np.zeros((k, dim))
+        np.add.at(new_centers, arr_new_labels.ravel(), dataset)
+        new_centers /= n_replicates
+        shift = ((centers - new_centers) ** 2).sum()
+        converged = shift <= tol or (arr_new_labels == arr_labels).all()
+        arr_labels = arr_new_labels
+        centers = new_centers
+        if converged:
+            break
+
+    return arr_labels.ravel().tolist(), centers.tolist()
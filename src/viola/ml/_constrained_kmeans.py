@@ -1,88 +1,98 @@
 #############################
-# This module is the exact copy of "cop_kmeans" module of "COP-Kmeans" repository on MIT Licence (https://github.com/Behrouz-Babaki/COP-Kmeans).
+# This module is based on "cop_kmeans" module of "COP-Kmeans" repository on MIT Licence (https://github.com/Behrouz-Babaki/COP-Kmeans).
 # We thanks Mr. Behrouz-Babaki and Mr. Kensuke-Mitsuzawa, developers of this code.
+# In Viola, the distances and the centroids are computed with NumPy. The clusters are the same as the original module.
 #############################
 import random
+import numpy as np
 
 def cop_kmeans(dataset, k, ml=[], cl=[],
                initialization='kmpp',
-               max_iter=300, tol=1e-4):
+               max_iter=300, tol=1e-4, random_state=None):
 
-    ml, cl = transitive_closure(ml, cl, len(dataset))
+    dataset = np.asarray(dataset, dtype=float)
+    n = len(dataset)
+    ml, cl = transitive_closure(ml, cl, n)
     ml_info = get_ml_info(ml, dataset)
     tol = tolerance(tol, dataset)
 
-    centers = initialize_centers(dataset, k, initialization)
+    # random_state was added in Viola to make the initialization reproducible.
+    rand = random if random_state is None else random.Random(random_state)
+    centers = initialize_centers(dataset, k, initialization, rand)
 
     for _ in range(max_iter):
-        clusters_ = [-1] * len(dataset)
-        for i, d in enumerate(dataset):
-            indices, _ = closest_clusters(centers, d)
-            counter = 0
-            if clusters_[i] == -1:
-                found_cluster = False
-                while (not found_cluster) and counter < len(indices):
-                    index = indices[counter]
-                    if not violate_constraints(i, index, clusters_, ml, cl):
-                        found_cluster = True
-                        clusters_[i] = index
-                        for j in ml[i]:
-                            clusters_[j] = index
-                    counter += 1
-
-                if not found_cluster:
-                    return None, None
+        clusters_ = [-1] * n
+        # distances between all the points and all the centers at once
+        ls_order = np.argsort(_squared_distances(dataset, centers), axis=1, kind='stable').tolist()
+        for i in range(n):
+            if clusters_[i] != -1:
+                continue
+            # equivalent to violate_constraints() for each of the clusters
+            set_cl_clusters = {clusters_[j] for j in cl[i]}
+            set_ml_clusters = {clusters_[j] for j in ml[i]} - {-1}
+            found_cluster = False
+            for index in ls_order[i]:
+                if index not in set_cl_clusters and set_ml_clusters <= {index}:
+                    found_cluster = True
+                    clusters_[i] = index
+                    for j in ml[i]:
+                        clusters_[j] = index
+                    break
+
+            if not found_cluster:
+                return None, None
 
         clusters_, centers_ = compute_centers(clusters_, dataset, k, ml_info)
-        shift = sum(l2_distance(centers[i], centers_[i]) for i in range(k))
+        shift = ((centers - centers_) ** 2).sum()
         if shift <= tol:
             break
 
         centers = centers_
 
-    return clusters_, centers_
+    return clusters_.tolist(), centers_.tolist()
+
+def _squared_distances(points, centers):
+    # (n_points, n_centers) matrix of the squared L2 distances
+    return ((points[:, np.newaxis, :] - centers[np.newaxis, :, :]) ** 2).sum(axis=2)
 
 def l2_distance(point1, point2):
-    return sum([(float(i)-float(j))**2 for (i, j) in zip(point1, point2)])
+    return float(((np.asarray(point1, dtype=float) - np.asarray(point2, dtype=float)) ** 2).sum())
 
 # taken from scikit-learn (https://goo.gl/1RYPP5)
 def tolerance(tol, dataset):
-    n = len(dataset)
-    dim = len(dataset[0])
-    averages = [sum(dataset[i][d] for i in range(n))/float(n) for d in range(dim)]
-    variances = [sum((dataset[i][d]-averages[d])**2 for i in range(n))/float(n) for d in range(dim)]
-    return tol * sum(variances) / dim
+    dataset = np.asarray(dataset, dtype=float)
+    return tol * dataset.var(axis=0).mean()
 
 def closest_clusters(centers, datapoint):
-    distances = [l2_distance(center, datapoint) for
-                 center in centers]
-    return sorted(range(len(distances)), key=lambda x: distances[x]), distances
+    distances = _squared_distances(np.asarray(datapoint, dtype=float)[np.newaxis, :], np.asarray(centers, dtype=float))[0]
+    return np.argsort(distances, kind='stable').tolist(), distances.tolist()
 
-def initialize_centers(dataset, k, method):
+def initialize_centers(dataset, k, method, rand=random):
+    dataset = np.asarray(dataset, dtype=float)
     if method == 'random':
         ids = list(range(len(dataset)))
-        random.shuffle(ids)
-        return [dataset[i] for i in ids[:k]]
+        rand.shuffle(ids)
+        return dataset[ids[:k]]
 
     elif method == 'kmpp':
-        chances = [1] * len(dataset)
-        centers = []
+        chances = np.ones(len(dataset))
+        min_distances = None
+        ls_index = []
 
         for _ in range(k):
-            chances = [x/sum(chances) for x in chances]
-            r = random.random()
-            acc = 0.0
-            for index, chance in enumerate(chances):
-                if acc + chance >= r:
-                    break
-                acc += chance
-            centers.append(dataset[index])
+            chances = chances / chances.sum()
+            r = rand.random()
+            # the first point whose cumulative chance reaches r, or the last point
+            arr_reached = np.cumsum(chances) >= r
+            index = int(np.argmax(arr_reached)) if arr_reached.any() else len(dataset) - 1
+            ls_index.append(index)
 
-            for index, point in enumerate(dataset):
-                cids, distances = closest_clusters(centers, point)
-                chances[index] = distances[cids[0]]
+            # distance to the closest center
+            distances = _squared_distances(dataset, dataset[[index]])[:, 0]
+            min_distances = distances if min_distances is None else np.minimum(min_distances, distances)
+            chances = min_distances
 
-        return centers
+        return dataset[ls_index]
 
 def violate_constraints(data_index, cluster_index, clusters, ml, cl):
     for i in ml[data_index]:
@@ -96,28 +106,19 @@ def violate_constraints(data_index, cluster_index, clusters, ml, cl):
     return False
 
 def compute_centers(clusters, dataset, k, ml_info):
-    cluster_ids = set(clusters)
+    dataset = np.asarray(dataset, dtype=float)
+    cluster_ids, clusters = np.unique(clusters, return_inverse=True)
     k_new = len(cluster_ids)
-    id_map = dict(zip(cluster_ids, range(k_new)))
-    clusters = [id_map[x] for x in clusters]
-
-    dim = len(dataset[0])
-    centers = [[0.0] * dim for i in range(k)]
-
-    counts = [0] * k_new
-    for j, c in enumerate(clusters):
-        for i in range(dim):
-            centers[c][i] += dataset[j][i]
-        counts[c] += 1
 
-    for j in range(k_new):
-        for i in range(dim):
-            centers[j][i] = centers[j][i]/float(counts[j])
+    dim = dataset.shape[1]
+    centers = np.zeros((k, dim))
+    np.add.at(centers, clusters, dataset)
+    counts = np.bincount(clusters, minlength=k_new)
+    centers[:k_new] /= counts[:, np.newaxis]
 
     if k_new < k:
         ml_groups, ml_scores, ml_centroids = ml_info
-        current_scores = [sum(l2_distance(centers[clusters[i]], dataset[i])
-                              for i in group)
+        current_scores = [((centers[clusters[group]] - dataset[group]) ** 2).sum()
                           for group in ml_groups]
         group_ids = sorted(range(len(ml_groups)),
                            key=lambda x: current_scores[x] - ml_scores[x],
@@ -127,12 +128,12 @@ def compute_centers(clusters, dataset, k, ml_info):
             gid = group_ids[j]
             cid = k_new + j
             centers[cid] = ml_centroids[gid]
-            for i in ml_groups[gid]:
-                clusters[i] = cid
+            clusters[ml_groups[gid]] = cid
 
     return clusters, centers
 
 def get_ml_info(ml, dataset):
+    dataset = np.asarray(dataset, dtype=float)
     flags = [True] * len(dataset)
     groups = []
     for i in range(len(dataset)):
@@ -142,19 +143,8 @@ def get_ml_info(ml, dataset):
         for j in group:
             flags[j] = False
 
-    dim = len(dataset[0])
-    scores = [0.0] * len(groups)
-    centroids = [[0.0] * dim for i in range(len(groups))]
-
-    for j, group in enumerate(groups):
-        for d in range(dim):
-            for i in group:
-                centroids[j][d] += dataset[i][d]
-            centroids[j][d] /= float(len(group))
-
-    scores = [sum(l2_distance(centroids[j], dataset[i])
-                  for i in groups[j])
-              for j in range(len(groups))]
+    centroids = np.array([dataset[group].sum(axis=0) / float(len(group)) for group in groups])
+    scores = [((centroids[j] - dataset[group]) ** 2).sum() for j, group in enumerate(groups)]
 
     return groups, scores, centroids
 
@@ -202,4 +192,4 @@ def transitive_closure(ml, cl, n):
             if j != i and j in cl_graph[i]:
                 raise Exception('inconsistent constraints between %d and %d' %(i, j))
 
-    return ml_graph, cl_graph
\ No newline at end of file
+    return ml_graph, cl_graph
@@ -1 +1,5 @@
-from viola.ml.extractor import SV_signature_extractor
\ No newline at end of file
+from viola.ml.extractor import (
+    SV_signature_extractor,
+    select_n_signatures,
+)
+from viola.ml.exposure import fit_exposures
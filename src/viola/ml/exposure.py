@@ -0,0 +1,102 @@
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from scipy.optimize import nnls
+from viola.utils.utils import _check_n_jobs
+
+def _nnls_batch(args) -> np.ndarray:
+    # worker of fit_exposures: NNLS of each row of arr_X against the signatures.
+    arr_X, arr_signature_t = args
+    arr_exposure = np.zeros((arr_X.shape[0], arr_signature_t.shape[1]))
+    for i, arr_x in enumerate(arr_X):
+        # samples without SVs have no exposure.
+        if arr_x.any():
+            arr_exposure[i], _ = nnls(arr_signature_t, arr_x)
+    return arr_exposure
+
+def _iter_batches(iterable_rows, batch_size: int, n_features: int):
+    iterator = iter(iterable_rows)
+    while True:
+        ls_rows = list(itertools.islice(iterator, batch_size))
+        if len(ls_rows) == 0:
+            return
+        arr_X = np.asarray(ls_rows, dtype=float)
+        if arr_X.ndim != 2 or arr_X.shape[1] != n_features:
+            raise ValueError('Each row of X should have {} features.'.format(n_features))
+        yield arr_X
+
+def fit_exposures(X, signatures, n_jobs=1, batch_size=1000):
+    """
+    fit_exposures(X, signatures, n_jobs=1, batch_size=1000)
+    Compute the exposures of samples to fixed SV signatures
+    by non-negative least squares (scipy.optimize.nnls) of each sample.
+
+    Unlike sklearn.decomposition.non_negative_factorization(X, H=signatures, update_H=False),
+    the samples are solved independently, so that X can be a generator of feature count rows.
+    The rows are read and solved batch_size rows at a time, and at most 2 * n_jobs
+    batches are kept in memory.
+
+    Parameters
+    ----------
+    X: ndarray, pd.DataFrame or iterable of array-like
+        (n_samples, n_features) shaped feature matrix, or rows of it,
+        e.g. a generator of the feature count vectors of each patient.
+        The features must be in the same order as those of the signatures.
+    signatures: ndarray or pd.DataFrame
+        (n_signatures, n_features) shaped signature matrix,
+        e.g. the signature_matrix returned by SV_signature_extractor().
+    n_jobs: int, default 1
+        Number of processes used to solve the batches. -1 means all CPUs.
+    batch_size: int, default 1000
+        Number of samples solved at a time.
+
+    Returns
+    ----------
+    ndarray or pd.DataFrame
+        (n_samples, n_signatures) shaped exposure matrix.
+        If X is a pd.DataFrame, a DataFrame with the index of X is returned.
+        Its columns are the index of signatures if signatures is a pd.DataFrame.
+    """
+    if isinstance(signatures, pd.DataFrame):
+        ls_signature_names = signatures.index.tolist()
+    else:
+        ls_signature_names = None
+    arr_signature_t = np.asarray(signatures, dtype=float).T
+    n_features, n_signatures = arr_signature_t.shape
+    n_jobs = _check_n_jobs(n_jobs)
+
+    index = None
+    if isinstance(X, pd.DataFrame):
+        index = X.index
+        X = X.values
+    if isinstance(X, np.ndarray):
+        if X.ndim != 2 or X.shape[1] != n_features:
+            raise ValueError('X should be (n_samples, {}) shaped but {} was passed.'.format(n_features, X.shape))
+        iterable_batches = (X[i:i + batch_size] for i in range(0, X.shape[0], batch_size))
+    else:
+        iterable_batches = _iter_batches(X, batch_size, n_features)
+
+    ls_exposure = []
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            # keep a bounded number of batches in flight, in the order of the samples.
+            deque_futures = deque()
+            for arr_X in iterable_batches:
+                deque_futures.append(executor.submit(_nnls_batch, (arr_X, arr_signature_t)))
+                if len(deque_futures) >= 2 * n_jobs:
+                    ls_exposure.append(deque_futures.popleft().result())
+            while deque_futures:
+                ls_exposure.append(deque_futures.popleft().result())
+    else:
+        for arr_X in iterable_batches:
+            ls_exposure.append(_nnls_batch((arr_X, arr_signature_t)))
+
+    if ls_exposure:
+        exposure_matrix = np.concatenate(ls_exposure)
+    else:
+        exposure_matrix = np.zeros((0, n_signatures))
+    if index is not None:
+        return pd.DataFrame(exposure_matrix, index=index, columns=ls_signature_names)
+    return exposure_matrix
@@ -1,101 +1,101 @@
-import random
-import collections
 import numpy as np
 import pandas as pd
 import scipy
+from concurrent.futures import ProcessPoolExecutor
 from sklearn.decomposition import NMF, non_negative_factorization
 from typing import List
+from collections import OrderedDict
 from sklearn.metrics import silhouette_score
 from sklearn.metrics import pairwise_distances
+from viola.utils.utils import _check_n_jobs
 from viola.ml._constrained_kmeans import cop_kmeans
+from viola.ml._consensus import assignment_kmeans
 
-def SV_signature_extractor(X, n_iter=10, name='test', **sklearn_nmf_parameters):
+def _get_seed_sequence(random_state) -> np.random.SeedSequence:
     """
-    Parameters
-    -----------
-    X: ndarray or pd.DataFrame
-        (n_sample, n_features) shaped ndarray.
-    n_iter: int
-        Number of iteration for resampling X.
-    name: str or int
-        Name of this run. Do not use '_' in this argument.
-    **sklearn_nmf_parameters: dict
-        kwargs to pass the sklearn.decomposition.NMF (https://scikit-learn.org/stable/modules/generated/sklearn.decomposition.NMF.html).
-        Specify number of signatures to the 'n_components' argument.
-    
-    Returns
-    --------
-    result_silhouette: float
-        Average silhouette score of the extracted SV signatures
-    result_metrics: float
-        beta_loss of the extracted matrice.
-    exposure_matrix: (n_samples, n_signatures)
-        Exposure matrix.
-    signature_matrix: (n_signatures, n_features)
-        SV signature matrix extracted.
+    Return a numpy SeedSequence from the random_state argument of sklearn.
     """
-    if not isinstance(sklearn_nmf_parameters.get('n_components', None), int):
-        raise TypeError('n_components argument of sklearn.decomposition.NMF should be int type but {} was passed.'.format(type(sklearn_nmf_parameters.get('n_components'))))
+    if isinstance(random_state, np.random.RandomState):
+        random_state = random_state.randint(np.iinfo(np.int32).max)
+    return np.random.SeedSequence(random_state)
 
-    if isinstance(X, pd.DataFrame):
-        X = X.values
-    ls_X = []
-    for i in range(X.shape[0]):
-        for j in range(X.shape[1]):
-            ls_X += [(i, j) for _ in range(X[(i, j)])] 
-    
-    
-    # NMF unit
-    def _unit(ls_X, unit_name, **sklearn_nmf_parameters) -> List[pd.Series]:
-        # monte carlo bootstrap sampling
-        ls_sample = random.choices(ls_X, k=len(ls_X))
-        dict_count = collections.Counter(ls_sample)
-        new_X = np.zeros_like(X) # need to fix later
-        for key, value in dict_count.items():
-            new_X[key] = value
-
-        # NMF model
-        model = NMF(**sklearn_nmf_parameters)
-        W = model.fit_transform(new_X)
-        H = model.components_
-        #print(model.reconstruction_err_)
-
-        # vector generation
-        ls_return = []
-        for i in range(H.shape[0]):
-            ser_name = str(unit_name) + '_' + str(i)
-            ls_return.append(pd.Series(H[i, :], name=ser_name))
-        return ls_return
-    # /NMF unit
-    
-    def _get_distance(x: pd.Series, y: pd.Series) -> float:
-        x_unit_name = x.name.split('_')[0]
-        y_unit_name = y.name.split('_')[0]
-        arr_x = x.values
-        arr_y = y.values
-        if x_unit_name == y_unit_name:
-            return 10**16 # for the purpose of constraints
-        cos_sim = (x*y).sum()/(np.linalg.norm(arr_x)*np.linalg.norm(arr_y))
-        return 1 - cos_sim
-    
-    # get signature vectors
-    ls_ser = []
-    for i_iter in range(n_iter):
-        unit_name = str(name) + str(i_iter)
-        ls_ser += _unit(ls_X, unit_name=unit_name, **sklearn_nmf_parameters)
-    
-    print(str(name) + ': finished NMF')
-    # /get signature vectors
-    
+def _bootstrap(X: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Resample the SVs of a count matrix with replacement.
+    The same as drawing len(SVs) SVs from all the SVs, but done as multinomial
+    draws: the numbers of SVs of the samples are drawn first, and then the counts
+    of the features of each sample from the feature proportions of the sample.
+    """
+    X_count = X.astype(np.int64)
+    arr_row_total = X_count.sum(axis=1)
+    n_total = arr_row_total.sum()
+    if n_total == 0:
+        return np.zeros_like(X)
+    arr_new_row_total = rng.multinomial(n_total, arr_row_total / n_total)
+    # rows without SVs are never drawn; give them any valid proportions.
+    arr_pvals = np.where(arr_row_total[:, np.newaxis] > 0, X_count / np.maximum(arr_row_total, 1)[:, np.newaxis], 1 / X.shape[1])
+    return rng.multinomial(arr_new_row_total, arr_pvals).astype(X.dtype)
+
+def _nmf_unit(args) -> List[pd.Series]:
+    # NMF unit: fit NMF to a bootstrap resample of X, and return the signatures
+    # named "<unit_name>_<index>". Worker of SV_signature_extractor(n_jobs=...)
+    # and select_n_signatures(n_jobs=...).
+    new_X, unit_name, sklearn_nmf_parameters = args
+
+    # NMF model
+    model = NMF(**sklearn_nmf_parameters)
+    W = model.fit_transform(new_X)
+    H = model.components_
+
+    # vector generation
+    ls_return = []
+    for i in range(H.shape[0]):
+        ser_name = str(unit_name) + '_' + str(i)
+        ls_return.append(pd.Series(H[i, :], name=ser_name))
+    return ls_return
+
+def _check_consensus(consensus: str):
+    if consensus not in ('cop-kmeans', 'assignment'):
+        raise ValueError("consensus should be 'cop-kmeans' or 'assignment' but {} was passed.".format(repr(consensus)))
+
+def _resample(X: np.ndarray, n_iter: int, random_state):
+    """
+    Return the n_iter bootstrap resamples of X and the seed of the clustering.
+    Each resample has its own random stream spawned from random_state, so that
+    the resamples do not depend on n_jobs or n_components.
+    """
+    seed_seq = _get_seed_sequence(random_state)
+    ls_seed_seq_unit = seed_seq.spawn(n_iter + 1)
+    ls_new_X = [_bootstrap(X, np.random.default_rng(ls_seed_seq_unit[i_iter])) for i_iter in range(n_iter)]
+    kmeans_random_state = None
+    if random_state is not None:
+        kmeans_random_state = int(np.random.default_rng(ls_seed_seq_unit[n_iter]).integers(np.iinfo(np.int32).max))
+    return ls_new_X, kmeans_random_state
+
+def _run_nmf_units(ls_args, n_jobs: int) -> List[List[pd.Series]]:
+    if n_jobs > 1 and len(ls_args) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(ls_args))) as executor:
+            return list(executor.map(_nmf_unit, ls_args))
+    return [_nmf_unit(args) for args in ls_args]
+
+def _consensus_signatures(X, ls_ser, name, consensus, kmeans_random_state, **sklearn_nmf_parameters):
+    """
+    Cluster the signatures of the NMF units, and return the result of SV_signature_extractor().
+    """
     # run constrained k-means clustering
     n_cluster = sklearn_nmf_parameters.get('n_components')
     arr_evaluate = np.array(ls_ser)
-    cannot_link = []
-    for i in range(len(ls_ser)):
-        for j in range(len(ls_ser)):
-            if ls_ser[i].name.split('_')[0] == ls_ser[j].name.split('_')[0]:
-                cannot_link += [(i, j)] 
-    ls_clusters, ls_centers = cop_kmeans(dataset=arr_evaluate, k=n_cluster, cl=cannot_link)
+    if consensus == 'assignment':
+        # ls_ser consists of the n_cluster signatures of each unit in order.
+        ls_clusters, ls_centers = assignment_kmeans(dataset=arr_evaluate, k=n_cluster, random_state=kmeans_random_state)
+    else:
+        odict_unit_indices = OrderedDict()
+        for i, ser in enumerate(ls_ser):
+            odict_unit_indices.setdefault(ser.name.split('_')[0], []).append(i)
+        cannot_link = []
+        for i, ser in enumerate(ls_ser):
+            cannot_link += [(i, j) for j in odict_unit_indices[ser.name.split('_')[0]]]
+        ls_clusters, ls_centers = cop_kmeans(dataset=arr_evaluate, k=n_cluster, cl=cannot_link, random_state=kmeans_random_state)
     print(str(name) + ': finished kmeans clustering')
     # /run constrained k-means clustering
 
@@ -130,3 +130,129 @@ def SV_signature_extractor(X, n_iter=10, name='test', **sklearn_nmf_parameters):
     print('\n==================\n')
 
     return (result_silhouette, result_metrics, exposure_matrix, signature_matrix)
+
+def SV_signature_extractor(X, n_iter=10, name='test', n_jobs=1, consensus='cop-kmeans', **sklearn_nmf_parameters):
+    """
+    Parameters
+    -----------
+    X: ndarray or pd.DataFrame
+        (n_sample, n_features) shaped ndarray.
+    n_iter: int
+        Number of iteration for resampling X.
+    name: str or int
+        Name of this run. Do not use '_' in this argument.
+    n_jobs: int, default 1
+        Number of processes used to run the NMF iterations. -1 means all CPUs.
+        Each iteration has its own random stream spawned from random_state,
+        so that the result does not depend on n_jobs.
+    consensus: str, default 'cop-kmeans'
+        How the signatures of the iterations are clustered.
+        'cop-kmeans': constrained k-means with cannot-link constraints between the
+        signatures of the same iteration.
+        'assignment': k-means in which the signatures of each iteration are matched
+        to the centers by an optimal assignment (Hungarian algorithm).
+        It scales linearly with n_iter.
+    **sklearn_nmf_parameters: dict
+        kwargs to pass the sklearn.decomposition.NMF (https://scikit-learn.org/stable/modules/generated/sklearn.decomposition.NMF.html).
+        Specify number of signatures to the 'n_components' argument.
+        'random_state' also seeds the bootstrap resampling of X, so that the results are reproducible.
+    
+    Returns
+    --------
+    result_silhouette: float
+        Average silhouette score of the extracted SV signatures
+    result_metrics: float
+        beta_loss of the extracted matrice.
+    exposure_matrix: (n_samples, n_signatures)
+        Exposure matrix.
+    signature_matrix: (n_signatures, n_features)
+        SV signature matrix extracted.
+    """
+    if not isinstance(sklearn_nmf_parameters.get('n_components', None), int):
+        raise TypeError('n_components argument of sklearn.decomposition.NMF should be int type but {} was passed.'.format(type(sklearn_nmf_parameters.get('n_components'))))
+    _check_consensus(consensus)
+
+    if isinstance(X, pd.DataFrame):
+        X = X.values
+    X = np.asarray(X)
+    n_jobs = _check_n_jobs(n_jobs)
+    # monte carlo bootstrap sampling
+    ls_new_X, kmeans_random_state = _resample(X, n_iter, sklearn_nmf_parameters.get('random_state'))
+
+    # get signature vectors
+    ls_args = [(ls_new_X[i_iter], str(name) + str(i_iter), sklearn_nmf_parameters) for i_iter in range(n_iter)]
+    ls_ser = []
+    for ls_ser_unit in _run_nmf_units(ls_args, n_jobs):
+        ls_ser += ls_ser_unit
+    
+    print(str(name) + ': finished NMF')
+    # /get signature vectors
+
+    return _consensus_signatures(X, ls_ser, name, consensus, kmeans_random_state, **sklearn_nmf_parameters)
+
+def select_n_signatures(X, k_range, n_iter=10, name='test', n_jobs=1, consensus='cop-kmeans', **sklearn_nmf_parameters) -> pd.DataFrame:
+    """
+    select_n_signatures(X, k_range, n_iter=10, name='test', n_jobs=1, consensus='cop-kmeans', **sklearn_nmf_parameters)
+    Run SV_signature_extractor() for each number of signatures in k_range, and return the scores.
+
+    The bootstrap resamples of X are shared by all the numbers of signatures,
+    and the NMF fits of all the (number of signatures, resample) pairs run in one process pool.
+    The scores of each number of signatures are the same as those of
+    SV_signature_extractor(X, n_iter, n_components=k, random_state=random_state, ...).
+
+    Parameters
+    -----------
+    X: ndarray or pd.DataFrame
+        (n_sample, n_features) shaped ndarray.
+    k_range: iterable of int
+        Numbers of signatures to evaluate.
+    n_iter: int
+        Number of iteration for resampling X.
+    name: str or int
+        Name of this run. Do not use '_' in this argument.
+    n_jobs: int, default 1
+        Number of processes used to run the NMF fits. -1 means all CPUs.
+    consensus: str, default 'cop-kmeans'
+        See SV_signature_extractor().
+    **sklearn_nmf_parameters: dict
+        kwargs to pass the sklearn.decomposition.NMF except for 'n_components'.
+    
+    Returns
+    --------
+    pd.DataFrame
+        Silhouette score and beta_loss of each number of signatures.
+        The index is the number of signatures.
+    """
+    if 'n_components' in sklearn_nmf_parameters:
+        raise TypeError("n_components can't be passed to select_n_signatures. Use k_range instead.")
+    ls_k = [int(k) for k in k_range]
+    if len(ls_k) == 0:
+        raise ValueError('k_range is empty.')
+    _check_consensus(consensus)
+
+    if isinstance(X, pd.DataFrame):
+        X = X.values
+    X = np.asarray(X)
+    n_jobs = _check_n_jobs(n_jobs)
+    ls_new_X, kmeans_random_state = _resample(X, n_iter, sklearn_nmf_parameters.get('random_state'))
+
+    ls_args = []
+    for k in ls_k:
+        params_k = dict(sklearn_nmf_parameters, n_components=k)
+        ls_args += [(ls_new_X[i_iter], str(name) + str(i_iter), params_k) for i_iter in range(n_iter)]
+    ls_ls_ser = _run_nmf_units(ls_args, n_jobs)
+    print(str(name) + ': finished NMF')
+
+    metrics = sklearn_nmf_parameters.get('beta_loss', 'frobenius')
+    ls_rows = []
+    for i_k, k in enumerate(ls_k):
+        ls_ser = []
+        for ls_ser_unit in ls_ls_ser[i_k*n_iter:(i_k+1)*n_iter]:
+            ls_ser += ls_ser_unit
+        result_silhouette, result_metrics, exposure_matrix, signature_matrix = _consensus_signatures(
+            X, ls_ser, '{}(n_signatures={})'.format(name, k), consensus, kmeans_random_state,
+            **dict(sklearn_nmf_parameters, n_components=k)
+        )
+        ls_rows.append([result_silhouette, result_metrics])
+    df_scores = pd.DataFrame(ls_rows, index=pd.Index(ls_k, name='n_signatures'), columns=['silhouette_score', str(metrics)])
+    return df_scores
@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 import numpy as np
 import re
@@ -97,3 +98,11 @@ def get_id_by_boolean_info(
     else:
         all_ids = bedpe_or_vcf.ids
         return all_ids - true_ids
+
+def _check_n_jobs(n_jobs) -> int:
+    # the number of processes of the n_jobs arguments: None means 1 and -1 means all CPUs.
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(os.cpu_count() + 1 + n_jobs, 1)
+    return n_jobs
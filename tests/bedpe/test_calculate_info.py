@@ -0,0 +1,36 @@
+import viola
+import pandas as pd
+from io import StringIO
+
+data = """chrom1	start1	end1	chrom2	start2	end2	name	score	strand1	strand2
+chr1	10	11	chr1	20	21	test1	60	+	-
+chr1	10	11	chr1	25	26	test2	60	+	-
+chr1	100	101	chr1	250	251	test3	60	+	-
+chr2	10	11	chr2	40	41	test4	60	+	+
+"""
+
+
+def test_calculate_info():
+    bedpe = viola.read_bedpe(StringIO(data), patient_name='patient1')
+    bedpe.calculate_info('${svlen} * 2', 'svlen2')
+    expected = pd.DataFrame({'id': ['test1', 'test2', 'test3', 'test4'], 'value_idx': [0, 0, 0, 0], 'svlen2': [-18, -28, -298, 60]})
+    pd.testing.assert_frame_equal(bedpe.get_table('svlen2'), expected)
+
+def test_calculate_info_multiple_infos():
+    bedpe = viola.read_bedpe(StringIO(data), patient_name='patient1')
+    bedpe.calculate_info('${cipos} - ${ciend}', 'cidiff')
+    expected = pd.merge(bedpe.get_table('cipos'), bedpe.get_table('ciend'), on=['id', 'value_idx'])
+    expected['cidiff'] = expected['cipos'] - expected['ciend']
+    pd.testing.assert_frame_equal(bedpe.get_table('cidiff'), expected[['id', 'value_idx', 'cidiff']])
+
+def test_calculate_info_partial_info():
+    bedpe = viola.read_bedpe(StringIO(data), patient_name='patient1')
+    test_info = pd.DataFrame({'id': ['test3', 'test1'], 'value_idx': [0, 0], 'test': [1, 2]})
+    bedpe.add_info_table('test', test_info)
+    bedpe.calculate_info('${svlen} + ${test}', 'result')
+    expected = pd.DataFrame({'id': ['test1', 'test3'], 'value_idx': [0, 0], 'result': [-7, -148]})
+    pd.testing.assert_frame_equal(bedpe.get_table('result'), expected)
+    # the cached wide table of 'test' is discarded when the table is replaced.
+    bedpe.set_value_for_info_by_id('test', 'test2', 0, 3)
+    bedpe.calculate_info('${svlen} + ${test}', 'result')
+    assert bedpe.get_table('result')['result'].tolist() == [-7, -11, -148]
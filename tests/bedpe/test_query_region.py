@@ -0,0 +1,54 @@
+import viola
+import pytest
+import pickle
+from io import StringIO
+from viola._exceptions import IllegalArgumentError
+DATA = """chrom1	start1	end1	chrom2	start2	end2	name	score	strand1	strand2	test1
+chr1	10	11	chr1	20	21	test1	60	+	-	True
+chr1	10	11	chr1	25	26	test2	60	+	-	False
+chr1	100	101	chr1	250	251	test3	60	+	-	True
+chr1	105	106	chr1	290	291	test4	60	+	-	False
+chr1	150	151	chr1	300	301	test5	60	+	-	True
+chr2	10	11	chr2	20	21	test6	60	-	+	False
+chr2	100	101	chr2	280	281	test7	60	-	-	False
+chr2	10	11	chr5	20	21	test8	60	+	-	False
+chr3	10	11	chr1	120	121	test9	60	-	-	True
+"""
+
+def test_query_region_any():
+    bedpe = viola.read_bedpe(StringIO(DATA))
+    result = bedpe.query_region('chr1', 100, 260)
+    assert set(result.ids) == {'test3', 'test4', 'test5', 'test9'}
+
+def test_query_region_breakend():
+    bedpe = viola.read_bedpe(StringIO(DATA))
+    assert set(bedpe.query_region('chr1', 100, 260, breakend='be1').ids) == {'test3', 'test4', 'test5'}
+    assert set(bedpe.query_region('chr1', 100, 260, breakend='be2').ids) == {'test3', 'test9'}
+    assert set(bedpe.query_region('chr1', 100, 260, breakend='both').ids) == {'test3'}
+    assert set(bedpe.query_region('chr1', breakend='be2').ids) == {'test1', 'test2', 'test3', 'test4', 'test5', 'test9'}
+    assert bedpe.query_region('chr10', 1, 100).sv_count == 0
+    with pytest.raises(IllegalArgumentError):
+        bedpe.query_region('chr1', 100, 260, breakend='be3')
+
+def test_query_region_equals_filter():
+    bedpe = viola.read_bedpe(StringIO(DATA))
+    for chrom, st, en in [('chr1', 11, 101), ('chr1', 101, 102), ('chr2', None, 101), ('chr1', 151, None)]:
+        str_st = '' if st is None else str(st)
+        str_en = '' if en is None else str(en)
+        query = 'be1 {}:{}-{}'.format(chrom, str_st, str_en)
+        assert set(bedpe.filter(query).ids) == set(bedpe.query_region(chrom, st, en, breakend='be1').ids)
+
+def test_position_index_invalidation():
+    bedpe = viola.read_bedpe(StringIO(DATA))
+    assert set(bedpe.query_region('chr3').ids) == {'test9'}
+    df_svpos = bedpe.get_table('positions')
+    df_svpos.loc[df_svpos['id'] == 'test9', 'chrom1'] = 'chr4'
+    bedpe.replace_table('positions', df_svpos)
+    assert bedpe.query_region('chr3').sv_count == 0
+    assert set(bedpe.query_region('chr4').ids) == {'test9'}
+
+def test_pickle_with_position_index():
+    bedpe = viola.read_bedpe(StringIO(DATA))
+    bedpe.query_region('chr1', 100, 260)
+    bedpe_unpickled = pickle.loads(pickle.dumps(bedpe))
+    viola.testing.assert_bedpe_equal(bedpe, bedpe_unpickled)
@@ -24,4 +24,35 @@ test4	chr3:11	chr4:21	--	60	BND
 """
     df_expected = pd.read_table(StringIO(txt))
     view_expected += str(df_expected)
-    assert view == view_expected
\ No newline at end of file
+    assert view == view_expected
+
+def _make_large_bedpe(n):
+    ls_lines = ['chrom1\tstart1\tend1\tchrom2\tstart2\tend2\tname\tscore\tstrand1\tstrand2\ttest1']
+    for i in range(n):
+        ls_lines.append('chr1\t{0}\t{1}\tchr1\t{2}\t{3}\ttest{4}\t60\t+\t-\t{4}'.format(i * 10, i * 10 + 1, i * 100 + 50, i * 100 + 51, i))
+    return viola.read_bedpe(StringIO('\n'.join(ls_lines) + '\n'), patient_name="patient1")
+
+
+@pytest.mark.parametrize('n', [59, 60, 61, 500])
+def test_view_truncated(n):
+    bedpe = _make_large_bedpe(n)
+    # test1 lacks a value for an SV, which turns its column into float
+    df_test1 = bedpe.get_table('test1')
+    bedpe.replace_table('test1', df_test1.iloc[1:].reset_index(drop=True))
+    for custom_infonames in [None, ['test1', 'cipos']]:
+        df_view = bedpe.view(custom_infonames=custom_infonames, return_as_dataframe=True)
+        assert df_view.shape[0] == n
+        view = bedpe.view(custom_infonames=custom_infonames)
+        assert view.split('\n', 2)[2] == str(df_view)
+
+
+def test_view_rows():
+    bedpe = _make_large_bedpe(100)
+    df_view = bedpe.view(return_as_dataframe=True)
+    pd.testing.assert_frame_equal(bedpe.head(), df_view.iloc[:5])
+    pd.testing.assert_frame_equal(bedpe.tail(3), df_view.iloc[-3:])
+    pd.testing.assert_frame_equal(bedpe.view(rows=[3, 50], return_as_dataframe=True), df_view.iloc[[3, 50]])
+    df_view_info = bedpe.view(custom_infonames=['test1'], return_as_dataframe=True)
+    pd.testing.assert_frame_equal(bedpe.head(10, custom_infonames=['test1']), df_view_info.iloc[:10])
+    view = bedpe.view(rows=2)
+    assert view.split('\n', 2)[2] == str(df_view.iloc[:2])
@@ -1,6 +1,7 @@
 from viola.cli.viola import viola
 from click.testing import CliRunner
 import sys, os
+import pytest
 HERE = os.path.abspath(os.path.dirname(__file__))
 bedpe_path = os.path.join(HERE, 'data/bedpe')
 vcf_path = os.path.join(HERE, 'data/vcf')
@@ -60,4 +61,20 @@ def test_generate_matrix_vcf_files2():
     output = os.path.join(out_path, 'out7.tsv')
     runner = CliRunner()
     result = runner.invoke(viola, ['generate-feature-matrix', '--input-files', path, '--input-files-id', 'manta1,manta2', '--format', 'vcf', '--definitions', vcf_definition_path, '--as-breakpoint', output])
-    assert result.exit_code == 0
\ No newline at end of file
+    assert result.exit_code == 0
+
+@pytest.mark.parametrize('ls_args', [
+    ['--input-dir', bedpe_path, '--format', 'bedpe', '--definitions', bedpe_definition_path],
+    ['--input-files', ','.join([os.path.join(vcf_path, 'manta1.vcf'), os.path.join(vcf_path, 'manta2.vcf')]), '--input-files-id', 'manta1,manta2', '--format', 'vcf', '--definitions', vcf_definition_path, '--as-breakpoint'],
+])
+@pytest.mark.parametrize('n_jobs', ['1', '2'])
+def test_generate_matrix_streaming(tmp_path, ls_args, n_jobs):
+    output = str(tmp_path / 'out.tsv')
+    output_streaming = str(tmp_path / 'out_streaming.tsv')
+    runner = CliRunner()
+    result = runner.invoke(viola, ['generate-feature-matrix'] + ls_args + [output])
+    assert result.exit_code == 0
+    result = runner.invoke(viola, ['generate-feature-matrix'] + ls_args + ['--streaming', '--n-jobs', n_jobs, output_streaming])
+    assert result.exit_code == 0
+    with open(output) as f1, open(output_streaming) as f2:
+        assert f1.read() == f2.read()
@@ -10,3 +10,12 @@ def test_signature_extractor():
     runner = CliRunner()
     result = runner.invoke(viola, ['extract-signature', infile, outfile])
     assert result.exit_code == 0
+
+
+def test_select_n_signatures(tmp_path):
+    runner = CliRunner()
+    outfile_scores = str(tmp_path / 'scores.tsv')
+    result = runner.invoke(viola, ['select-n-signatures', '--min-signatures', '2', '--max-signatures', '3', '--n-iter', '3', '--random-state', '0', infile, outfile_scores])
+    assert result.exit_code == 0
+    df_scores = pd.read_csv(outfile_scores, sep='\t', index_col=0)
+    assert df_scores.index.tolist() == [2, 3]
@@ -27,3 +27,54 @@ def test_vcf2bedpe_gridss():
   runner = CliRunner()
   result = runner.invoke(viola, ['vcf2bedpe', '--caller=gridss', path])
   assert result.exit_code == 0
+
+def _sorted_lines(output):
+  # the header and the records sorted by their contents
+  ls_lines = output.splitlines()
+  return ls_lines[:1] + sorted(ls_lines[1:])
+
+def test_vcf2bedpe_chunksize():
+  path = os.path.join(HERE, '../io/data/test.manta.vcf')
+  runner = CliRunner()
+  result = runner.invoke(viola, ['vcf2bedpe', '-i', 'svtype,svlen', '-f', '-m', path])
+  assert result.exit_code == 0
+  ls_lines = result.output.splitlines()
+  # header and 6 records, tab-separated
+  assert len(ls_lines) == 7
+  assert ls_lines[0].split('\t')[:12] == ['chrom1', 'start1', 'end1', 'chrom2', 'start2', 'end2', 'name', 'score', 'strand1', 'strand2', 'svtype_0', 'svlen_0']
+  assert len(set(len(line.split('\t')) for line in ls_lines)) == 1
+  # the same records for any chunksize and from the standard input;
+  # the breakends waiting for their mates are written with the later chunks.
+  result_chunk = runner.invoke(viola, ['vcf2bedpe', '-i', 'svtype,svlen', '-f', '-m', '--chunksize', '1', path])
+  assert _sorted_lines(result_chunk.output) == _sorted_lines(result.output)
+  with open(path, 'rb') as f:
+    result_stdin = runner.invoke(viola, ['vcf2bedpe', '-i', 'svtype,svlen', '-f', '-m', '--chunksize', '4'], input=f.read())
+  assert _sorted_lines(result_stdin.output) == _sorted_lines(result.output)
+
+def test_vcf2bedpe_chunksize_ciend():
+  path = os.path.join(HERE, '../io/data/test.manta.vcf')
+  runner = CliRunner()
+  result = runner.invoke(viola, ['vcf2bedpe', '-i', 'ciend,cipos,svtype', path])
+  result_chunk = runner.invoke(viola, ['vcf2bedpe', '-i', 'ciend,cipos,svtype', '--chunksize', '1', path])
+  assert result_chunk.exit_code == 0
+  assert _sorted_lines(result_chunk.output) == _sorted_lines(result.output)
+  # CIEND of the breakends is taken from CIPOS of their mates.
+  ls_lines = [line.split('\t') for line in result_chunk.output.splitlines()]
+  dict_ciend = {row[6]: row[10:12] for row in ls_lines[1:]}
+  assert ls_lines[0][10:12] == ['ciend_0', 'ciend_1']
+  assert dict_ciend['test4_1'] == ['-50', '50']
+  assert dict_ciend['test4_2'] == ['-100', '100']
+
+def test_vcf2bedpe_gridss_cipos_ciend():
+  path = os.path.join(HERE, '../io/data/test.gridss.vcf')
+  runner = CliRunner()
+  result = runner.invoke(viola, ['vcf2bedpe', '--caller', 'gridss', '-i', 'cipos,ciend', '--chunksize', '3', path])
+  assert result.exit_code == 0
+  import pandas as pd
+  from io import StringIO
+  import viola as viola_
+  df_result = pd.read_csv(StringIO(result.output), sep='\t')
+  df_expected = viola_.read_vcf(path, variant_caller='gridss').to_bedpe_like(custom_infonames=['cipos', 'ciend'])
+  df_result = df_result.sort_values('name').reset_index(drop=True)
+  df_expected = df_expected.sort_values('name').reset_index(drop=True)
+  pd.testing.assert_frame_equal(df_result, df_expected, check_dtype=False)
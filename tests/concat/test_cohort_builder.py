@@ -0,0 +1,59 @@
+import os
+import pytest
+import viola
+import pandas as pd
+from io import StringIO
+from viola._exceptions import DuplicatedPatientIDError
+from tests.concat.test_concat import data1, data2, data3, data4, data5, data6
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+def assert_multi_bedpe_equal(left, right):
+    assert left.table_list == right.table_list
+    for tablename in left.table_list:
+        pd.testing.assert_frame_equal(left.get_table(tablename), right.get_table(tablename))
+
+def test_cohort_builder():
+    bedpe1 = viola.read_bedpe(StringIO(data1), patient_name='patient1')
+    bedpe2 = viola.read_bedpe(StringIO(data2), patient_name='patient2')
+    multi_bedpe1 = viola.MultiBedpe([bedpe1, bedpe2], ['patient1', 'patient2'])
+    ls_bedpe = [viola.read_bedpe(StringIO(data), patient_name='patient{}'.format(i + 3)) for i, data in enumerate([data3, data6, data4, data5])]
+    builder = viola.CohortBuilder(multi_bedpe1)
+    for bedpe in ls_bedpe:
+        builder.append(bedpe)
+    assert len(builder) == 6
+    assert 'patient4' in builder
+    assert builder.patients == ['patient1', 'patient2', 'patient3', 'patient4', 'patient5', 'patient6']
+    assert_multi_bedpe_equal(builder.build(), viola.concat([multi_bedpe1] + ls_bedpe))
+
+def test_cohort_builder_compaction():
+    ls_bedpe = [viola.read_bedpe(StringIO(data1 if i % 3 else data2)) for i in range(40)]
+    ls_patients = ['patient{}'.format(i) for i in range(40)]
+    builder = viola.CohortBuilder()
+    for bedpe, patient in zip(ls_bedpe, ls_patients):
+        builder.append(bedpe, patient)
+    assert len(builder._ls_chunks) < 40
+    assert_multi_bedpe_equal(builder.build(), viola.MultiBedpe(ls_bedpe, ls_patients))
+    # the builder can still be used after build()
+    builder.append(viola.read_bedpe(StringIO(data3)), 'patient40')
+    assert builder.build().get_table('patients')['patients'].to_list() == ls_patients + ['patient40']
+
+def test_cohort_builder_vcf():
+    vcf = viola.read_vcf(os.path.join(HERE, '../multivcf/data/manta1.vcf'), patient_name='vcf1')
+    builder = viola.CohortBuilder()
+    builder.append(vcf).append(viola.MultiVcf([vcf], ['vcf2']))
+    expected = viola.MultiBedpe([vcf.as_bedpe(), vcf.as_bedpe()], ['vcf1', 'vcf2'])
+    assert_multi_bedpe_equal(builder.build(), expected)
+
+def test_cohort_builder_duplicated_patients():
+    bedpe1 = viola.read_bedpe(StringIO(data1), patient_name='patient1')
+    builder = viola.CohortBuilder(bedpe1)
+    with pytest.raises(DuplicatedPatientIDError):
+        builder.append(viola.read_bedpe(StringIO(data2)), 'patient1')
+    assert builder.patients == ['patient1']
+    with pytest.raises(DuplicatedPatientIDError):
+        viola.concat([bedpe1, bedpe1])
+    # duplicates within the appended patients
+    bedpe2 = viola.read_bedpe(StringIO(data2), patient_name='patient2')
+    with pytest.raises(DuplicatedPatientIDError):
+        builder.append(viola.MultiBedpe([bedpe2, bedpe2], ['patient2', 'patient2']))
+    assert builder.patients == ['patient1']
@@ -32,4 +32,20 @@ test2\tchr1\t10\tchr1\t10\t+\t-\tDEL\tN
         b = StringIO(test_data)
         df_svpos = pd.read_csv(b, sep="\t")
         result = viola.io.parser.create_alt_field_from_position(df_svpos)
-        
\ No newline at end of file
+        
+    def test_prepend_chr(self):
+        ser = pd.Series(['1', 'chr2', 'X', 'MT', 'M', 'GL000207.1', 22])
+        result = viola.io.parser.prepend_chr(ser)
+        expected = pd.Series(['chr1', 'chr2', 'chrX', 'chrMT', 'chrMT', 'GL000207.1', 'chr22'])
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_read_bedpe_dtype_usecols(self):
+        data = """chrom1\tstart1\tend1\tchrom2\tstart2\tend2\tname\tscore\tstrand1\tstrand2\textra1\textra2
+chr1\t10\t13\tchr2\t20\t30\ttest1\t10\t+\t+\t0.5\ta
+chr3\t100\t130\tchr3\t210\t230\ttest2\t30\t-\t+\t0.7\tb
+"""
+        ls_usecols = ['chrom1', 'start1', 'end1', 'chrom2', 'start2', 'end2', 'name', 'score', 'strand1', 'strand2', 'extra2']
+        obj = viola.read_bedpe(StringIO(data), dtype={'score': 'float64'}, usecols=ls_usecols)
+        assert obj.table_list == ['positions', 'svlen', 'svtype', 'cipos', 'ciend', 'extra2']
+        assert obj.get_table('positions')['qual'].dtype == 'float64'
+        pd.testing.assert_frame_equal(obj.get_table('positions').drop(columns='qual'), self.obj.get_table('positions').drop(columns='qual'))
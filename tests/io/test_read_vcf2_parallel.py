@@ -0,0 +1,27 @@
+import viola
+import os
+import pytest
+import pandas as pd
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+
+@pytest.mark.parametrize('caller', ['manta', 'delly', 'lumpy', 'gridss'])
+def test_read_vcf2_n_jobs(caller):
+    path = os.path.join(HERE, 'data/test.{}.vcf'.format(caller))
+    expected = viola.read_vcf2(path, variant_caller=caller, patient_name='patient1')
+    result = viola.read_vcf2(path, variant_caller=caller, patient_name='patient1', n_jobs=2)
+    assert result.table_list == expected.table_list
+    for table_name in expected.table_list:
+        pd.testing.assert_frame_equal(result.get_table(table_name), expected.get_table(table_name))
+
+
+def test_split_vcf_body():
+    from viola.io.parser import _split_vcf_body
+    path = os.path.join(HERE, 'data/test.gridss.vcf')
+    ls_header, ls_ranges = _split_vcf_body(path, 5)
+    with open(path, 'rb') as f:
+        data = f.read()
+    assert b''.join(ls_header) + b''.join([data[st:en] for st, en in ls_ranges]) == data
+    assert len(ls_ranges) > 1
+    for st, en in ls_ranges:
+        assert data[en - 1:en] == b'\n'
@@ -0,0 +1,73 @@
+import viola
+import os
+import pytest
+import pandas as pd
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+
+@pytest.mark.parametrize('caller', ['manta', 'delly', 'lumpy', 'gridss'])
+def test_read_vcf_chunks(caller):
+    path = os.path.join(HERE, 'data/test.{}.vcf'.format(caller))
+    expected = viola.read_vcf2(path, variant_caller=caller, patient_name='patient1')
+    ls_vcf = list(viola.read_vcf_chunks(path, variant_caller=caller, patient_name='patient1', chunksize=2))
+    assert len(ls_vcf) > 1
+    for table_name in ('infos_meta', 'formats_meta', 'filters_meta', 'samples_meta'):
+        pd.testing.assert_frame_equal(ls_vcf[-1].get_table(table_name), expected.get_table(table_name))
+    # the breakends waiting for their mates are carried to the later chunks.
+    df_result = pd.concat([vcf.to_bedpe_like() for vcf in ls_vcf], ignore_index=True)
+    df_result = df_result.sort_values('name').reset_index(drop=True)
+    df_expected = expected.to_bedpe_like().sort_values('name').reset_index(drop=True)
+    pd.testing.assert_frame_equal(df_result, df_expected)
+
+
+@pytest.mark.parametrize('chunksize', [1, 2, 3])
+def test_read_vcf_chunks_mate(chunksize):
+    path = os.path.join(HERE, 'data/test.manta.vcf')
+    expected = viola.read_vcf2(path, variant_caller='manta')
+    ls_vcf = list(viola.read_vcf_chunks(path, variant_caller='manta', chunksize=chunksize))
+    # the breakends test4_1 and test4_2 are in the same chunk, and their CIEND is taken from the mates.
+    vcf_bnd = [vcf for vcf in ls_vcf if 'test4_1' in vcf.ids][0]
+    assert 'test4_2' in vcf_bnd.ids
+    df_ciend = vcf_bnd.get_table('ciend').sort_values(['id', 'value_idx']).reset_index(drop=True)
+    df_expected = expected.get_table('ciend')
+    df_expected = df_expected[df_expected['id'].isin(vcf_bnd.ids)].sort_values(['id', 'value_idx']).reset_index(drop=True)
+    pd.testing.assert_frame_equal(df_ciend, df_expected)
+
+
+def test_read_vcf_chunks_empty():
+    path = os.path.join(HERE, 'data/test.manta.vcf')
+    with open(path, 'rb') as f:
+        header = b''.join([line for line in f if line.startswith(b'#')])
+    from io import BytesIO
+    ls_vcf = list(viola.read_vcf_chunks(BytesIO(header), variant_caller='manta'))
+    assert len(ls_vcf) == 1
+    assert ls_vcf[0].sv_count == 0
+    with pytest.raises(ValueError):
+        next(viola.read_vcf_chunks(path, variant_caller='manta', chunksize=0))
+
+
+def test_read_vcf_chunks_missing_mates():
+    # sorted breakend pairs whose second mates are missing for 30% of the pairs
+    path = os.path.join(HERE, 'data/test.manta.vcf')
+    with open(path) as f:
+        header = ''.join([line for line in f if line.startswith('#')])
+    ls_records = []
+    for i in range(3000):
+        pos1 = 10000 * (i + 1)
+        pos2 = pos1 + 5000
+        ls_records.append((pos1, 'chr1\t{0}\tbnd{1}_1\tN\tN[chr1:{2}[\t.\tPASS\tSVTYPE=BND;CIPOS=-10,10;MATEID=bnd{1}_2\tPR\t10,0\t10,5\n'.format(pos1, i, pos2)))
+        if i % 10 >= 3:
+            ls_records.append((pos2, 'chr1\t{0}\tbnd{1}_2\tN\t]chr1:{2}]N\t.\tPASS\tSVTYPE=BND;CIPOS=-20,20;MATEID=bnd{1}_1\tPR\t10,0\t10,5\n'.format(pos2, i, pos1)))
+    content = header + ''.join([record for _, record in sorted(ls_records)])
+    from io import StringIO
+    ls_vcf = list(viola.read_vcf_chunks(StringIO(content), variant_caller='manta', chunksize=50))
+    # the breakends without mates are yielded once their mate positions are passed,
+    # so that the chunks do not grow with the number of them.
+    assert max(vcf.sv_count for vcf in ls_vcf) <= 2 * 50
+    assert sum(vcf.sv_count for vcf in ls_vcf) == len(ls_records)
+    df_ciend = pd.concat([vcf.get_table('ciend') for vcf in ls_vcf], ignore_index=True)
+    expected = viola.read_vcf2(StringIO(content), variant_caller='manta')
+    pd.testing.assert_frame_equal(
+        df_ciend.sort_values(['id', 'value_idx']).reset_index(drop=True),
+        expected.get_table('ciend').sort_values(['id', 'value_idx']).reset_index(drop=True),
+    )
@@ -0,0 +1,60 @@
+import viola
+import os
+import gzip
+import shutil
+import pandas as pd
+from io import BytesIO
+from click.testing import CliRunner
+from viola.cli.viola import viola as viola_cli
+from viola.testing import assert_vcf_equal
+HERE = os.path.abspath(os.path.dirname(__file__))
+MANTA = os.path.join(HERE, 'data/test.manta.vcf')
+GRIDSS = os.path.join(HERE, 'data/test.gridss.vcf')
+
+
+def test_read_vcf_gzip_path(tmp_path):
+    path_gz = str(tmp_path / 'test.manta.vcf.gz')
+    with open(MANTA, 'rb') as f_in, gzip.open(path_gz, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    expected = viola.read_vcf(MANTA, variant_caller='manta', patient_name='patient1')
+    assert_vcf_equal(viola.read_vcf(path_gz, variant_caller='manta', patient_name='patient1'), expected)
+    expected2 = viola.read_vcf2(MANTA, variant_caller='manta', patient_name='patient1')
+    assert_vcf_equal(viola.read_vcf2(path_gz, variant_caller='manta', patient_name='patient1'), expected2)
+
+
+def test_read_vcf_bgzf_binary_stream():
+    # BGZF consists of many gzip members
+    path_bgzf = os.path.join(HERE, 'data/test.gridss.sorted.vcf.gz')
+    with gzip.open(path_bgzf, 'rb') as f:
+        expected = viola.read_vcf2(BytesIO(f.read()), variant_caller='gridss', patient_name='patient1')
+    with open(path_bgzf, 'rb') as f:
+        result = viola.read_vcf2(f, variant_caller='gridss', patient_name='patient1')
+        assert not f.closed
+    assert_vcf_equal(result, expected)
+    with open(path_bgzf, 'rb') as f:
+        result = viola.read_vcf(f, variant_caller='gridss', patient_name='patient1')
+    assert sorted(result.ids) == sorted(viola.read_vcf(GRIDSS, variant_caller='gridss', patient_name='patient1').ids)
+
+
+def test_read_vcf_multi_gzip(tmp_path):
+    dir_data = os.path.join(HERE, 'data/multivcf')
+    shutil.copy(os.path.join(dir_data, 'test.manta1.vcf'), str(tmp_path / 'test.manta1.vcf'))
+    with open(os.path.join(dir_data, 'test.manta2.vcf'), 'rb') as f_in, gzip.open(str(tmp_path / 'test.manta2.vcf.gz'), 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    multi_vcf = viola.read_vcf_multi(str(tmp_path), variant_caller='manta')
+    expected = viola.read_vcf_multi(dir_data, variant_caller='manta', exclude_empty_cases=True)
+    assert sorted(multi_vcf.get_table('patients')['patients']) == ['test.manta1', 'test.manta2']
+    pd.testing.assert_frame_equal(
+        multi_vcf.positions.sort_values('id').reset_index(drop=True),
+        expected.positions.sort_values('id').reset_index(drop=True),
+    )
+
+
+def test_vcf2bedpe_gzip_stdin():
+    with open(MANTA, 'rb') as f:
+        data = f.read()
+    runner = CliRunner()
+    expected = runner.invoke(viola_cli, ['vcf2bedpe', MANTA])
+    result = runner.invoke(viola_cli, ['vcf2bedpe'], input=gzip.compress(data))
+    assert result.exit_code == 0
+    assert result.output == expected.output
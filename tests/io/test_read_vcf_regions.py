@@ -0,0 +1,47 @@
+import viola
+import os
+import pytest
+import pandas as pd
+HERE = os.path.abspath(os.path.dirname(__file__))
+GRIDSS = os.path.join(HERE, 'data/test.gridss.sorted.vcf.gz')
+GRIDSS_CSI = os.path.join(HERE, 'data/test.gridss.sorted.csi.vcf.gz')
+MANTA = os.path.join(HERE, 'data/test.manta.sorted.vcf.gz')
+
+
+def test_read_vcf_regions_whole():
+    vcf = viola.read_vcf(os.path.join(HERE, 'data/test.gridss.vcf'), variant_caller='gridss', patient_name='patient1')
+    vcf_regions = viola.read_vcf(GRIDSS, variant_caller='gridss', patient_name='patient1', regions=['chr10', 'chr12', 'chr15', 'chr17'])
+    assert sorted(vcf_regions.ids) == sorted(vcf.ids)
+    pd.testing.assert_frame_equal(
+        vcf_regions.positions.sort_values('id').reset_index(drop=True),
+        vcf.positions.sort_values('id').reset_index(drop=True),
+    )
+
+
+def test_read_vcf_regions_mate():
+    # the mate of the breakend on chr12 is on chr10
+    vcf = viola.read_vcf(GRIDSS, variant_caller='gridss', patient_name='patient1', regions='chr12')
+    assert sorted(vcf.ids) == ['gridss7fb_7717h', 'gridss7fb_7717o']
+    vcf2 = viola.read_vcf2(GRIDSS, variant_caller='gridss', patient_name='patient1', regions='chr12')
+    assert sorted(vcf2.ids) == ['gridss7fb_7717h', 'gridss7fb_7717o']
+
+
+@pytest.mark.parametrize('path', [GRIDSS, GRIDSS_CSI])
+def test_read_vcf_regions_range(path):
+    vcf = viola.read_vcf(path, variant_caller='gridss', patient_name='patient1', regions='chr10:90150000-90151000')
+    assert sorted(vcf.ids) == ['gridss9fb_229h', 'gridss9fb_229o']
+    vcf = viola.read_vcf(path, variant_caller='gridss', patient_name='patient1', regions=[('chr15', 63000000, 64000000)])
+    assert sorted(vcf.ids) == ['gridss64bf_1924h', 'gridss64bf_1924o', 'gridss68ff_1141h', 'gridss68ff_1141o']
+
+
+def test_read_vcf_regions_end():
+    # <DEL> and <INV> spanning the region are found through their END
+    vcf = viola.read_vcf(MANTA, variant_caller='manta', patient_name='patient1', regions='chr1:82550500-82550600')
+    assert sorted(vcf.ids) == ['test1', 'test2']
+    vcf = viola.read_vcf(MANTA, variant_caller='manta', patient_name='patient1', regions='chr1:82554300-92000000')
+    assert list(vcf.ids) == ['test2']
+
+
+def test_read_vcf_regions_no_index():
+    with pytest.raises(FileNotFoundError):
+        viola.read_vcf(os.path.join(HERE, 'data/test.gridss.vcf'), variant_caller='gridss', patient_name='patient1', regions='chr1')
@@ -0,0 +1,23 @@
+import numpy as np
+from viola.ml._constrained_kmeans import cop_kmeans
+
+def test_cop_kmeans():
+    rng = np.random.default_rng(0)
+    k = 3
+    arr_centers = np.eye(k)
+    dataset = np.concatenate([arr_centers + rng.normal(scale=0.01, size=(k, k)) for i in range(5)])
+    cannot_link = [(i, j) for i in range(len(dataset)) for j in range(len(dataset)) if i // k == j // k]
+    ls_clusters, ls_centers = cop_kmeans(dataset=dataset, k=k, cl=cannot_link, random_state=1)
+    # each unit has one vector in each cluster.
+    for i in range(5):
+        assert sorted(ls_clusters[i*k:(i+1)*k]) == list(range(k))
+    # vectors near the same center are in the same cluster.
+    for i in range(k):
+        assert len(set(ls_clusters[i::k])) == 1
+    np.testing.assert_allclose(np.array(ls_centers)[ls_clusters[:k]], arr_centers, atol=0.05)
+    assert cop_kmeans(dataset=dataset, k=k, cl=cannot_link, random_state=1) == (ls_clusters, ls_centers)
+
+def test_cop_kmeans_infeasible():
+    dataset = np.array([[0.0, 1.0], [1.0, 0.0], [0.5, 0.5]])
+    cannot_link = [(0, 1), (1, 2), (0, 2)]
+    assert cop_kmeans(dataset=dataset, k=2, cl=cannot_link, random_state=0) == (None, None)
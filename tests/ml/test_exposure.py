@@ -0,0 +1,36 @@
+import viola
+import numpy as np
+import pandas as pd
+import os
+import pytest
+from sklearn.decomposition import non_negative_factorization
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+def test_fit_exposures():
+    df_feature = pd.read_csv(os.path.join(HERE, 'data/feature_matrix.csv'), index_col = 0)
+    df_feature.drop('others', axis=1, inplace=True)
+    rng = np.random.default_rng(0)
+    arr_signature = rng.random((3, df_feature.shape[1]))
+    arr_signature /= arr_signature.sum(axis=1)[:, np.newaxis]
+    df_signature = pd.DataFrame(arr_signature, index=['sig1', 'sig2', 'sig3'], columns=df_feature.columns)
+
+    df_exposure = viola.fit_exposures(df_feature, df_signature, batch_size=3)
+    assert df_exposure.index.equals(df_feature.index)
+    assert df_exposure.columns.tolist() == ['sig1', 'sig2', 'sig3']
+    assert (df_exposure.values >= 0).all()
+    W, H, n_iter = non_negative_factorization(df_feature.values.astype(float), H=arr_signature, update_H=False, n_components=3, init='custom', solver='cd', tol=1e-10, max_iter=100000)
+    np.testing.assert_allclose(df_exposure.values, W, atol=1e-4)
+
+    # generator of rows and parallel batches
+    arr_exposure = viola.fit_exposures((row for row in df_feature.values), arr_signature, n_jobs=2, batch_size=2)
+    np.testing.assert_allclose(arr_exposure, df_exposure.values)
+
+def test_fit_exposures_shape():
+    arr_signature = np.array([[0.5, 0.5, 0.0], [0.0, 0.0, 1.0]])
+    arr_exposure = viola.fit_exposures(np.array([[1, 1, 0], [0, 0, 0], [0, 0, 3]]), arr_signature)
+    np.testing.assert_allclose(arr_exposure, [[2, 0], [0, 0], [0, 3]], atol=1e-12)
+    assert viola.fit_exposures(iter([]), arr_signature).shape == (0, 2)
+    with pytest.raises(ValueError):
+        viola.fit_exposures(np.ones((2, 4)), arr_signature)
+    with pytest.raises(ValueError):
+        viola.fit_exposures([[1, 1]], arr_signature)
@@ -12,3 +12,68 @@ def test_SV_signature_extractor():
     sil, fro, ex, sig = viola.SV_signature_extractor(df_feature, 10, 'test', n_components=2, init='nndsvda', max_iter=10000)
     with pytest.raises(TypeError):
         sil, fro, ex, sig = viola.SV_signature_extractor(df_feature, 10, 'test', init='nndsvda', beta_loss='frobenius', max_iter=10000)
+
+def test_SV_signature_extractor_random_state():
+    df_feature = pd.read_csv(os.path.join(HERE, 'data/feature_matrix.csv'), index_col = 0)
+    df_feature.drop('others', axis=1, inplace=True)
+    result1 = viola.SV_signature_extractor(df_feature, 5, 'test', n_components=2, init='nndsvda', max_iter=10000, random_state=1)
+    result2 = viola.SV_signature_extractor(df_feature, 5, 'test', n_components=2, init='nndsvda', max_iter=10000, random_state=1)
+    assert result1[0] == result2[0]
+    np.testing.assert_array_equal(result1[3], result2[3])
+
+def test_SV_signature_extractor_n_jobs():
+    df_feature = pd.read_csv(os.path.join(HERE, 'data/feature_matrix.csv'), index_col = 0)
+    df_feature.drop('others', axis=1, inplace=True)
+    result1 = viola.SV_signature_extractor(df_feature, 4, 'test', n_jobs=1, n_components=2, init='nndsvda', max_iter=10000, random_state=1)
+    result2 = viola.SV_signature_extractor(df_feature, 4, 'test', n_jobs=2, n_components=2, init='nndsvda', max_iter=10000, random_state=1)
+    assert result1[0] == result2[0]
+    np.testing.assert_array_equal(result1[2], result2[2])
+    np.testing.assert_array_equal(result1[3], result2[3])
+
+def test_SV_signature_extractor_assignment():
+    df_feature = pd.read_csv(os.path.join(HERE, 'data/feature_matrix.csv'), index_col = 0)
+    df_feature.drop('others', axis=1, inplace=True)
+    sil, fro, ex, sig = viola.SV_signature_extractor(df_feature, 5, 'test', consensus='assignment', n_components=2, init='nndsvda', max_iter=10000, random_state=1)
+    assert sig.shape == (2, df_feature.shape[1])
+    np.testing.assert_allclose(sig.sum(axis=1), 1)
+    with pytest.raises(ValueError):
+        viola.SV_signature_extractor(df_feature, 5, 'test', consensus='kmeans', n_components=2)
+
+def test_select_n_signatures():
+    df_feature = pd.read_csv(os.path.join(HERE, 'data/feature_matrix.csv'), index_col = 0)
+    df_feature.drop('others', axis=1, inplace=True)
+    df_scores = viola.select_n_signatures(df_feature, range(2, 4), 4, 'test', n_jobs=2, init='nndsvda', max_iter=10000, random_state=1)
+    assert df_scores.index.tolist() == [2, 3]
+    assert df_scores.columns.tolist() == ['silhouette_score', 'frobenius']
+    for k in (2, 3):
+        sil, fro, ex, sig = viola.SV_signature_extractor(df_feature, 4, 'test', n_components=k, init='nndsvda', max_iter=10000, random_state=1)
+        assert df_scores.loc[k, 'silhouette_score'] == sil
+        assert df_scores.loc[k, 'frobenius'] == fro
+    with pytest.raises(TypeError):
+        viola.select_n_signatures(df_feature, range(2, 4), 4, n_components=2)
+
+def test_assignment_kmeans():
+    from viola.ml._consensus import assignment_kmeans
+    rng = np.random.default_rng(0)
+    k = 3
+    arr_centers = np.eye(k)
+    # vectors of each replicate are shuffled.
+    dataset = np.concatenate([arr_centers[rng.permutation(k)] + rng.normal(scale=0.01, size=(k, k)) for i in range(20)])
+    ls_clusters, ls_centers = assignment_kmeans(dataset, k, random_state=0)
+    arr_clusters = np.array(ls_clusters).reshape(20, k)
+    assert (np.sort(arr_clusters, axis=1) == np.arange(k)).all()
+    np.testing.assert_allclose(np.array(ls_centers)[ls_clusters], np.round(dataset), atol=0.05)
+    with pytest.raises(ValueError):
+        assignment_kmeans(dataset[:-1], k)
+
+def test_bootstrap():
+    from viola.ml.extractor import _bootstrap
+    X = np.array([[5, 0, 3], [0, 0, 0], [1, 2, 10]])
+    rng = np.random.default_rng(0)
+    ls_X = [_bootstrap(X, rng) for i in range(2000)]
+    for new_X in ls_X[:10]:
+        assert new_X.dtype == X.dtype
+        assert new_X.sum() == X.sum()
+        # features without SVs and samples without SVs are never drawn.
+        assert (new_X[X == 0] == 0).all()
+    np.testing.assert_allclose(np.mean(ls_X, axis=0), X, atol=0.3)
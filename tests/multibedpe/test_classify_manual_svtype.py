@@ -1,4 +1,5 @@
 import os
+import pytest
 import viola
 import pandas as pd
 from io import StringIO
@@ -189,4 +190,34 @@ def test_classify_manual_svtype_from_file():
     result_expected.columns.name = 'manual_sv_type'
     result_expected.index = ['bedpe1', 'bedpe2']
     result_expected.index.name = 'patients'
-    pd.testing.assert_frame_equal(result, result_expected)
\ No newline at end of file
+    pd.testing.assert_frame_equal(result, result_expected)
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_classify_manual_svtype_n_jobs(n_jobs):
+    ls_bedpe = [viola.read_bedpe(StringIO(data if i % 2 == 0 else data_empty)) for i in range(5)]
+    ls_patients = ['bedpe{}'.format(i) for i in range(5)]
+    ls_conditions = [small_del, large_del, small_dup, large_dup, small_inv, tra]
+    ls_names = ['small_del', 'large_del', 'small_dup', 'large_dup', 'small_inv', 'tra']
+    multibedpe_expected = viola.MultiBedpe(ls_bedpe, ls_patients)
+    result_expected = multibedpe_expected.classify_manual_svtype(ls_conditions=ls_conditions, ls_names=ls_names)
+    manual_sv_type_expected = multibedpe_expected.manual_sv_type.set_index('id').sort_index()
+
+    multibedpe = viola.MultiBedpe(ls_bedpe, ls_patients)
+    result = multibedpe.classify_manual_svtype(ls_conditions=ls_conditions, ls_names=ls_names, n_jobs=n_jobs)
+    pd.testing.assert_frame_equal(result, result_expected)
+    pd.testing.assert_frame_equal(multibedpe.manual_sv_type.set_index('id').sort_index(), manual_sv_type_expected)
+
+    multibedpe = viola.MultiBedpe(ls_bedpe, ls_patients)
+    result = multibedpe.classify_manual_svtype(definitions=StringIO(DEFINITIONS), exclude_empty_cases=True, n_jobs=n_jobs)
+    pd.testing.assert_frame_equal(result, result_expected.loc[['bedpe0', 'bedpe2', 'bedpe4']])
+
+def test_get_feature_count_as_data_frame_sparse():
+    bedpe1 = viola.read_bedpe(StringIO(data))
+    empty1 = viola.read_bedpe(StringIO(data_empty))
+    multibedpe = viola.MultiBedpe([bedpe1, empty1], ['bedpe1', 'empty1'])
+    result = multibedpe.get_feature_count_as_data_frame('svtype', ls_order=['DEL', 'INV', 'DUP', 'BND'], sparse=True)
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in result.dtypes)
+    result_expected = pd.DataFrame([[5, 4, 1, 2], [0, 0, 0, 0]])
+    result_expected.columns = pd.Index(['DEL', 'INV', 'DUP', 'BND'], name='svtype')
+    result_expected.index = pd.Index(['bedpe1', 'empty1'], name='patients')
+    pd.testing.assert_frame_equal(result.sparse.to_dense(), result_expected)
@@ -0,0 +1,37 @@
+import viola
+import pandas as pd
+from io import StringIO
+data = """chrom1	start1	end1	chrom2	start2	end2	name	score	strand1	strand2	info_0
+chr1	10	11	chr1	20	21	test1	60	+	-	A
+chr1	10	11	chr1	25	26	test2	60	+	-	B
+chr2	10	11	chr5	20	21	test3	60	+	-	C
+"""
+data_int_id = """chrom1	start1	end1	chrom2	start2	end2	name	score	strand1	strand2	info_0
+chr1	10	11	chr1	20	21	1	60	+	-	A
+chr1	10	11	chr1	25	26	2	60	+	-	B
+"""
+
+def test_global_id_strings_are_shared():
+    bedpe = viola.read_bedpe(StringIO(data))
+    multibedpe = viola.MultiBedpe([bedpe, bedpe], ['patient1', 'patient2'])
+    df_global_id = multibedpe._odict_alltables['global_id']
+    assert df_global_id['global_id'].to_list() == [
+        'patient1_test1', 'patient1_test2', 'patient1_test3', 'patient2_test1', 'patient2_test2', 'patient2_test3'
+    ]
+    dict_global_id = {x: x for x in df_global_id['global_id']}
+    for tablename in ['positions', 'info_0', 'svtype']:
+        for global_id in multibedpe._odict_alltables[tablename]['id']:
+            assert global_id is dict_global_id[global_id]
+
+def test_global_id_non_string_ids():
+    bedpe1 = viola.read_bedpe(StringIO(data_int_id))
+    bedpe2 = viola.read_bedpe(StringIO(data))
+    multibedpe = viola.MultiBedpe([bedpe1, bedpe2], [1, 2])
+    df_global_id = multibedpe.get_table('global_id')
+    df_expected = pd.DataFrame({
+        'global_id': ['1_1', '1_2', '2_test1', '2_test2', '2_test3'],
+        'patient_id': [0, 0, 1, 1, 1],
+        'id': [1, 2, 'test1', 'test2', 'test3'],
+    })
+    pd.testing.assert_frame_equal(df_global_id, df_expected)
+    assert multibedpe.get_table('info_0')['id'].to_list() == ['1_1', '1_2', '2_test1', '2_test2', '2_test3']
@@ -0,0 +1,61 @@
+import viola
+import pytest
+import pandas as pd
+from io import StringIO
+import os
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+DATA1 = """chrom1	start1	end1	chrom2	start2	end2	name	score	strand1	strand2
+chr1	10	11	chr1	20	21	test1	60	+	-
+chr1	100	101	chr1	250	251	test2	60	+	-
+chr2	10	11	chr1	120	121	test3	60	+	-
+"""
+DATA2 = """chrom1	start1	end1	chrom2	start2	end2	name	score	strand1	strand2
+chr1	150	151	chr1	300	301	test1	60	+	-
+chr3	10	11	chr4	20	21	test2	60	-	-
+"""
+BED = """chr1	99	130	region1
+chr4	0	100	region2
+chr5	0	100	region3
+"""
+
+def _get_multi_bedpe():
+    bedpe1 = viola.read_bedpe(StringIO(DATA1))
+    bedpe2 = viola.read_bedpe(StringIO(DATA2))
+    return viola.MultiBedpe([bedpe1, bedpe2], ['patient1', 'patient2'])
+
+def test_query_regions():
+    multi_bedpe = _get_multi_bedpe()
+    df_regions = pd.read_csv(StringIO(BED), sep='\t', header=None, names=['chrom', 'chromStart', 'chromEnd', 'name'])
+    result = multi_bedpe.query_regions(df_regions)
+    df_expected = pd.DataFrame({
+        'region': ['region1', 'region1', 'region2'],
+        'global_id': ['patient1_test2', 'patient1_test3', 'patient2_test2'],
+        'patients': ['patient1', 'patient1', 'patient2'],
+        'breakend': ['be1', 'be2', 'be2'],
+    })
+    pd.testing.assert_frame_equal(result, df_expected)
+
+def test_query_regions_flank():
+    multi_bedpe = _get_multi_bedpe()
+    df_regions = pd.DataFrame({'chrom': ['chr1'], 'chromStart': [99], 'chromEnd': [130]})
+    result = multi_bedpe.query_regions(df_regions, flank=30)
+    assert set(result['global_id']) == {'patient1_test2', 'patient1_test3', 'patient2_test1'}
+    assert (result['region'] == 0).all()
+
+def test_query_regions_consistent_with_filter():
+    multi_bedpe = _get_multi_bedpe()
+    df_regions = pd.DataFrame({'chrom': ['chr1'], 'chromStart': [0], 'chromEnd': [200]})
+    result = multi_bedpe.query_regions(df_regions)
+    set_be1 = set(multi_bedpe.filter('be1 chr1:1-201').ids)
+    set_be2 = set(multi_bedpe.filter('be2 chr1:1-201').ids)
+    assert set(result.loc[result['breakend'] == 'be1', 'global_id']) == set_be1
+    assert set(result.loc[result['breakend'] == 'be2', 'global_id']) == set_be2
+
+def test_query_regions_multi_vcf():
+    multi_vcf = viola.read_vcf_multi(os.path.join(HERE, '../io/data/multivcf'), variant_caller='manta')
+    df_regions = pd.DataFrame({'chrom': ['chr11', 'chr8'], 'chromStart': [30018802, 69735693], 'chromEnd': [30018803, 69735694]})
+    result = multi_vcf.query_regions(df_regions)
+    assert set(result['patients']) <= set(multi_vcf._ls_patients)
+    df_hit = result.loc[result['region'] == 0]
+    assert set(zip(df_hit['global_id'], df_hit['breakend'])) >= {('test.manta1_test4_2', 'be1'), ('test.manta1_test4_1', 'be2')}
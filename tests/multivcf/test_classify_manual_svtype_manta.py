@@ -163,4 +163,17 @@ def test_classify_manual_svtype_from_file():
     result_expected.columns.name = 'manual_sv_type'
     result_expected.index = ['vcf1', 'vcf2']
     result_expected.index.name = 'patients'
-    pd.testing.assert_frame_equal(result, result_expected)
\ No newline at end of file
+    pd.testing.assert_frame_equal(result, result_expected)
+
+def test_classify_manual_svtype_n_jobs():
+    vcf = viola.read_vcf(os.path.join(HERE, 'data/manta1.vcf')).breakend2breakpoint()
+    ls_vcf = [vcf, vcf.copy(), vcf.copy()]
+    multi_vcf_expected = viola.MultiVcf(ls_vcf, ['vcf1', 'vcf2', 'vcf3'])
+    result_expected = multi_vcf_expected.classify_manual_svtype(definitions='default')
+    multi_vcf = viola.MultiVcf(ls_vcf, ['vcf1', 'vcf2', 'vcf3'])
+    result = multi_vcf.classify_manual_svtype(definitions='default', n_jobs=2)
+    pd.testing.assert_frame_equal(result, result_expected)
+    pd.testing.assert_frame_equal(
+        multi_vcf.manual_sv_type.set_index('id').sort_index(),
+        multi_vcf_expected.manual_sv_type.set_index('id').sort_index()
+    )
@@ -0,0 +1,60 @@
+import os
+import sys
+import json
+import subprocess
+import viola
+
+# "import viola" without pandas, which every command needs anyway, should take well under this budget.
+IMPORT_TIME_BUDGET = 1.0
+
+_SCRIPT = '''
+import sys, time, json
+t0 = time.perf_counter()
+import pandas
+t1 = time.perf_counter()
+import {module}
+t2 = time.perf_counter()
+print(json.dumps({{
+    'time': t2 - t1,
+    'modules': [m for m in ('sklearn', 'scipy', 'Bio', 'viola.ml', 'viola.testing') if m in sys.modules],
+}}))
+'''
+
+def _import_in_subprocess(module):
+    env = dict(os.environ)
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(viola.__file__)))
+    env['PYTHONPATH'] = os.pathsep.join([src_dir, env.get('PYTHONPATH', '')])
+    output = subprocess.check_output([sys.executable, '-c', _SCRIPT.format(module=module)], env=env)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+def test_import_time():
+    for module in ('viola', 'viola.cli.viola'):
+        result = _import_in_subprocess(module)
+        # the ML, FASTA and testing subsystems are loaded on the first access.
+        assert result['modules'] == []
+        assert result['time'] < IMPORT_TIME_BUDGET
+
+def test_lazy_attributes():
+    assert 'SV_signature_extractor' in dir(viola)
+    from viola.ml.extractor import SV_signature_extractor
+    assert viola.SV_signature_extractor is SV_signature_extractor
+    from viola.io.fasta_io import read_fasta
+    assert viola.read_fasta is read_fasta
+    from viola.testing import assert_vcf_equal
+    assert viola.testing.assert_vcf_equal is assert_vcf_equal
+    try:
+        viola.not_existing_attribute
+    except AttributeError:
+        pass
+    else:
+        assert False
+
+def test_api_reexports():
+    from viola.io.api import read_fasta
+    from viola.io.fasta_io import read_fasta as _read_fasta
+    assert read_fasta is _read_fasta
+    from viola.core.api import merge, TmpVcfForMerge, IntervalTreeForMerge
+    import viola.core.merge
+    assert merge is viola.core.merge.merge
+    assert TmpVcfForMerge is viola.core.merge.TmpVcfForMerge
+    assert IntervalTreeForMerge is viola.core.merge.IntervalTreeForMerge
@@ -0,0 +1,64 @@
+import os
+from io import StringIO
+import pytest
+import viola
+from benchmarks.synthetic import (
+    simulate_svs,
+    write_vcf,
+    write_bedpe,
+    write_bed,
+    generate_cohort,
+)
+
+@pytest.mark.parametrize('variant_caller', ['manta', 'delly', 'lumpy', 'gridss'])
+def test_write_vcf(variant_caller):
+    events = simulate_svs(200, random_state=0, breakend_fraction=0.5)
+    b = StringIO()
+    write_vcf(events, b, variant_caller=variant_caller, random_state=0)
+    b_same = StringIO()
+    write_vcf(events, b_same, variant_caller=variant_caller, random_state=0)
+    assert b.getvalue() == b_same.getvalue()
+
+    vcf = viola.read_vcf(StringIO(b.getvalue()), variant_caller=variant_caller, patient_name='patient')
+    result = vcf.breakend2breakpoint().get_table('svtype')['svtype'].value_counts()
+    expected = events['svtype'].value_counts()
+    if variant_caller == 'lumpy':
+        # a symbolic inversion of Lumpy is split into two SV records.
+        expected['INV'] += ((events['svtype'] == 'INV') & ~events['breakend']).sum()
+    assert result.sort_index().to_dict() == expected.sort_index().to_dict()
+
+def test_write_vcf_mate_missing():
+    events = simulate_svs(200, random_state=0, breakend_fraction=1.0, mate_missing_fraction=0.5)
+    b = StringIO()
+    write_vcf(events, b, variant_caller='manta', random_state=0)
+    vcf = viola.read_vcf(StringIO(b.getvalue()), variant_caller='manta', patient_name='patient')
+    assert len(vcf.ids) == 2 * len(events) - events['mate_missing'].sum()
+
+def test_simulate_svs():
+    events = simulate_svs(500, random_state=1, ci_width=50)
+    assert events.equals(simulate_svs(500, random_state=1, ci_width=50))
+    intra = events[events['svtype'] != 'TRA']
+    assert (intra['chrom1'] == intra['chrom2']).all()
+    assert (intra['pos1'] < intra['pos2']).all()
+    tra = events[events['svtype'] == 'TRA']
+    assert (tra['chrom1'] != tra['chrom2']).all()
+    assert tra['breakend'].all()
+    assert events['ci'].between(0, 50).all()
+
+def test_write_bedpe_and_bed(tmp_path):
+    events = simulate_svs(100, random_state=0)
+    b = StringIO()
+    write_bedpe(events, b)
+    b.seek(0)
+    bedpe = viola.read_bedpe(b, patient_name='patient')
+    assert len(bedpe.ids) == 100
+    path = os.path.join(tmp_path, 'regions.bed')
+    write_bed(path, 50, random_state=0)
+    bed = viola.read_bed(path)
+    assert bed._df.shape[0] == 50
+
+def test_generate_cohort(tmp_path):
+    ls_paths = generate_cohort(tmp_path, n_patients=3, n_svs=20, format_='bedpe', random_state=0)
+    assert [os.path.basename(p) for p in ls_paths] == ['patient0.bedpe', 'patient1.bedpe', 'patient2.bedpe']
+    multibedpe = viola.read_bedpe_multi(str(tmp_path))
+    assert sorted(multibedpe._ls_patients) == ['patient0', 'patient1', 'patient2']
@@ -1,6 +1,7 @@
 import pytest
 import viola
 import sys, os
+from viola._exceptions import TableNotFoundError
 HERE = os.path.abspath(os.path.dirname(__file__))
 
 class TestAppendInfos:
@@ -19,4 +20,41 @@ class TestAppendInfos:
         if 'svlen' in self.reader2.table_list:
             result = viola.Vcf.append_infos(self.reader2, self.positions, ls_tablenames=['svlen'])
             assert result.columns[-1] == 'svlen_0'
-            assert result['svlen_0'].notnull().any()
\ No newline at end of file
+            assert result['svlen_0'].notnull().any()
+
+class TestAppendInfosCache:
+    manta_path = os.path.join(HERE, 'data/test.manta.vcf')
+
+    def test_wide_table_is_reused(self):
+        vcf = viola.read_vcf(self.manta_path, variant_caller='manta')
+        wide1, _ = vcf._get_info_wide('cipos')
+        wide2, _ = vcf._get_info_wide('cipos')
+        assert wide1 is wide2
+
+    def test_set_value_invalidates(self):
+        vcf = viola.read_vcf(self.manta_path, variant_caller='manta')
+        positions = vcf.get_table('positions')
+        vcf.append_infos(positions, ['svlen'])
+        sv_id = positions['id'].iloc[0]
+        vcf.set_value_for_info_by_id('svlen', sv_id, 0, 12345)
+        result = vcf.append_infos(positions, ['svlen']).set_index('id')
+        assert result.at[sv_id, 'svlen_0'] == 12345
+
+    def test_add_remove_rename_invalidate(self):
+        vcf = viola.read_vcf(self.manta_path, variant_caller='manta')
+        positions = vcf.get_table('positions')
+        df_svlen = vcf.get_table('svlen')
+        df_test = df_svlen.rename(columns={'svlen': 'test'})
+        vcf.add_info_table('test', df_test, number=1, type_='Integer', description='test')
+        result1 = vcf.append_infos(positions, ['test'])
+        df_test2 = df_test.copy()
+        df_test2['test'] = df_test2['test'] * 2
+        vcf.add_info_table('test', df_test2, number=1, type_='Integer', description='test')
+        result2 = vcf.append_infos(positions, ['test'])
+        assert (result2['test_0'] == result1['test_0'] * 2).all()
+        vcf.rename_info('test', 'test2')
+        result3 = vcf.append_infos(positions, ['test2'])
+        assert (result3['test2_0'] == result2['test_0']).all()
+        vcf.remove_info_table('test2')
+        with pytest.raises(TableNotFoundError):
+            vcf._get_info_wide('test2')
@@ -55,3 +55,28 @@ def test_copy2():
     assert_vcf_equal(delly_vcf, delly_vcf.copy())
     assert_vcf_equal(lumpy_vcf, lumpy_vcf.copy())
     assert_vcf_equal(gridss_vcf, gridss_vcf.copy())
+
+def test_copy_is_independent():
+    manta_path = os.path.join(HERE, '../io/data/test.manta.vcf')
+    manta_vcf = viola.read_vcf(manta_path, variant_caller='manta', patient_name='test')
+    expected = viola.read_vcf(manta_path, variant_caller='manta', patient_name='test')
+    manta_copy = manta_vcf.copy()
+    sv_id = manta_copy.get_table('positions')['id'].iloc[0]
+    manta_copy.replace_svid(sv_id, 'replaced')
+    manta_copy.rename_info('event', 'renamed')
+    manta_copy.set_value_for_info_by_id('svlen', 'replaced', 0, 1)
+    assert_vcf_equal(manta_vcf, expected)
+    assert 'replaced' in manta_copy.ids
+    assert 'renamed' in manta_copy.get_table('infos_meta')['id'].str.lower().tolist()
+
+def test_filter_by_id_chained():
+    manta_path = os.path.join(HERE, '../io/data/test.manta.vcf')
+    manta_vcf = viola.read_vcf(manta_path, variant_caller='manta', patient_name='test')
+    ids = sorted(manta_vcf.ids)
+    ls_ids = ids[:6]
+    result = manta_vcf.filter_by_id(ls_ids).filter_by_id(ids[3:])
+    # INFO tables are filtered lazily, but not by the modified list.
+    ls_ids.clear()
+    expected = manta_vcf.filter_by_id(ids[3:6])
+    assert_vcf_equal(result, expected)
+    assert_vcf_equal(result.copy(), expected)
@@ -0,0 +1,47 @@
+import os
+import pytest
+import viola
+from viola.testing import assert_vcf_equal
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+@pytest.mark.parametrize('caller', ['manta', 'delly', 'lumpy', 'gridss'])
+def test_lazy_pipeline(caller):
+    path = os.path.join(HERE, '../io/data/test.{}.vcf'.format(caller))
+    vcf = viola.read_vcf(path, variant_caller=caller, patient_name='test')
+    vcf_before = viola.read_vcf(path, variant_caller=caller, patient_name='test')
+    ids = sorted(vcf.ids)
+
+    ls_query1 = ['svlen < 100000000', 'svtype == BND']
+    ls_query2 = ['svtype == DEL', 'svtype == DUP', 'svtype == INV']
+    eager = vcf.filter_by_id(ids[1:]).filter(ls_query1, query_logic='or').breakend2breakpoint()
+    eager = eager.filter(ls_query2, query_logic='or')
+    ls_drop = sorted(eager.ids)[:1]
+    eager = eager.drop_by_id(ls_drop)
+    eager.classify_manual_svtype(definitions='default', return_series=False)
+    assert eager.sv_count > 0
+
+    plan = vcf.lazy().filter_by_id(ids[1:]).filter(ls_query1, query_logic='or').breakend2breakpoint()
+    plan = plan.filter(ls_query2, query_logic='or').drop_by_id(ls_drop)
+    plan = plan.classify_manual_svtype(definitions='default')
+    assert_vcf_equal(plan.collect(), eager)
+    # the source object is not modified.
+    assert_vcf_equal(vcf, vcf_before)
+
+def test_lazy_filters_are_fused():
+    path = os.path.join(HERE, '../io/data/test.manta.vcf')
+    vcf = viola.read_vcf(path, variant_caller='manta', patient_name='test')
+    plan = vcf.lazy().filter('svtype == DEL').filter('svlen > -1000').breakend2breakpoint().filter('svtype == INV')
+    assert plan.explain().splitlines()[1:] == [
+        "  select records: filter(['svtype == DEL'], query_logic='and') & filter(['svlen > -1000'], query_logic='and')",
+        "  breakend2breakpoint()",
+        "  select records: filter(['svtype == INV'], query_logic='and')",
+    ]
+    eager = vcf.filter('svtype == DEL').filter('svlen > -1000').breakend2breakpoint().filter('svtype == INV')
+    assert_vcf_equal(plan.collect(), eager)
+
+def test_lazy_without_steps():
+    path = os.path.join(HERE, '../io/data/test.manta.vcf')
+    vcf = viola.read_vcf(path, variant_caller='manta', patient_name='test')
+    result = vcf.lazy().collect()
+    assert result is not vcf
+    assert_vcf_equal(result, vcf)
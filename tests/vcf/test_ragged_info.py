@@ -0,0 +1,71 @@
+import viola
+from viola.core.ragged import RaggedInfo
+from viola.testing import assert_vcf_equal
+import pandas as pd
+import os
+HERE = os.path.abspath(os.path.dirname(__file__))
+gridss_path = os.path.join(HERE, '../io/data/test.gridss.vcf')
+manta_path = os.path.join(HERE, '../io/data/test.manta.vcf')
+
+
+def test_ragged_round_trip():
+    df = pd.DataFrame({
+        'id': ['a', 'a', 'b', 'c', 'c', 'c'],
+        'value_idx': [0, 1, 0, 0, 1, 2],
+        'test': [1, 2, 3, 4, 5, 6]
+    })
+    ragged = RaggedInfo.from_long(df)
+    assert list(ragged.ids) == ['a', 'b', 'c']
+    assert list(ragged.offsets) == [0, 2, 3, 6]
+    pd.testing.assert_frame_equal(ragged.to_long(), df)
+
+
+def test_ragged_to_wide():
+    df = pd.DataFrame({
+        'id': ['a', 'a', 'b'],
+        'value_idx': [0, 1, 0],
+        'test': [1, 2, 3]
+    })
+    ragged = RaggedInfo.from_long(df)
+    df_expected = df.pivot(index='id', columns='value_idx', values='test')
+    df_expected.columns = pd.RangeIndex(2)
+    pd.testing.assert_frame_equal(ragged.to_wide(), df_expected)
+
+
+def test_ragged_not_contiguous():
+    df = pd.DataFrame({'id': ['a', 'b'], 'value_idx': [0, 1], 'test': [1, 2]})
+    try:
+        RaggedInfo.from_long(df)
+    except ValueError:
+        return
+    assert False
+
+
+def test_compact_infos():
+    vcf = viola.read_vcf(gridss_path, variant_caller='gridss', patient_name='test')
+    vcf_compact = vcf.copy()
+    vcf_compact.compact_infos()
+    assert isinstance(vcf_compact._odict_alltables.get_raw('cipos'), RaggedInfo)
+    assert_vcf_equal(vcf, vcf_compact)
+    assert_vcf_equal(vcf.copy(), vcf_compact.copy())
+
+
+def test_compact_infos_append_infos():
+    vcf = viola.read_vcf(gridss_path, variant_caller='gridss', patient_name='test')
+    vcf_compact = vcf.copy()
+    vcf_compact.compact_infos()
+    df_positions = vcf.get_table('positions')
+    result = vcf.append_infos(df_positions, vcf._ls_infokeys)
+    result_compact = vcf_compact.append_infos(df_positions, vcf_compact._ls_infokeys)
+    pd.testing.assert_frame_equal(result, result_compact)
+
+
+def test_compact_infos_filter():
+    vcf = viola.read_vcf(manta_path, variant_caller='manta', patient_name='test')
+    vcf_compact = vcf.copy()
+    vcf_compact.compact_infos(['cipos', 'ciend', 'svtype'])
+    result = vcf.filter(['svtype == DEL', 'cipos 0 < -10'])
+    result_compact = vcf_compact.filter(['svtype == DEL', 'cipos 0 < -10'])
+    assert_vcf_equal(result, result_compact)
+    assert isinstance(result_compact._odict_alltables.get_raw('cipos'), RaggedInfo)
+    assert_vcf_equal(vcf.breakend2breakpoint(), vcf_compact.breakend2breakpoint())